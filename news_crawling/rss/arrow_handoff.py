@@ -0,0 +1,166 @@
+"""
+크롤러 → 분석 작업 Arrow IPC 전달
+
+CSV 대신 Arrow 레코드 배치로 수집 결과를 넘긴다. 발행/수집 시각은 timestamp 타입,
+언론사/카테고리/기자명은 dictionary 타입으로 유지되므로 분석 쪽에서 타입 추론이나
+CSV 파싱 없이 바로 pandas/NumPy로 사용할 수 있다.
+
+- 파일: Arrow IPC 파일 형식(.arrow). 읽을 때 memory_map으로 열어 복사 없이 접근
+- 소켓: Arrow IPC 스트림 형식. 로컬 유닉스 소켓 또는 TCP로 배치를 연속 전송
+
+사용 예:
+    write_arrow_file(articles, "results/KBS_전체_20250815.arrow")
+    df = read_arrow_file("results/KBS_전체_20250815.arrow").to_pandas()
+
+    with ArrowStreamPublisher("/tmp/news_batches.sock") as publisher:
+        publisher.publish(articles)
+"""
+
+import os
+import socket
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from article_record import Article
+
+ARTICLE_SCHEMA = pa.schema(
+    [
+        pa.field("언론사", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("제목", pa.string()),
+        pa.field("날짜", pa.timestamp("s", tz="Asia/Seoul")),
+        pa.field("카테고리", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("기자명", pa.dictionary(pa.int32(), pa.string())),
+        pa.field("본문", pa.string()),
+        pa.field("URL", pa.string()),
+        pa.field("수집시각", pa.timestamp("s", tz="Asia/Seoul")),
+    ]
+)
+
+
+def _to_articles(items, outlet=""):
+    return [item if isinstance(item, Article) else Article.from_dict(item, outlet=outlet) for item in items]
+
+
+def _timestamps(values):
+    # 0은 날짜 정보 없음 → null
+    return pa.array([value or None for value in values], type=pa.timestamp("s", tz="Asia/Seoul"))
+
+
+def articles_to_record_batch(items, outlet=""):
+    """Article 또는 수집기 dict 목록을 레코드 배치로 변환"""
+    articles = _to_articles(items, outlet=outlet)
+    return pa.record_batch(
+        [
+            pa.array([a.outlet for a in articles], type=pa.string()).dictionary_encode(),
+            pa.array([a.title for a in articles], type=pa.string()),
+            _timestamps(a.published for a in articles),
+            pa.array([a.category for a in articles], type=pa.string()).dictionary_encode(),
+            pa.array([a.reporter for a in articles], type=pa.string()).dictionary_encode(),
+            pa.array([a.body for a in articles], type=pa.string()),
+            pa.array([a.url for a in articles], type=pa.string()),
+            _timestamps(a.collected for a in articles),
+        ],
+        schema=ARTICLE_SCHEMA,
+    )
+
+
+def write_arrow_file(items, path, outlet="", batch_size=10000):
+    """수집 결과를 Arrow IPC 파일로 저장"""
+    articles = _to_articles(items, outlet=outlet)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    batches = [
+        articles_to_record_batch(articles[start : start + batch_size]) for start in range(0, len(articles), batch_size)
+    ]
+    # 파일 형식은 사전 교체를 허용하지 않으므로 배치 간 사전을 하나로 통일
+    table = pa.Table.from_batches(batches, schema=ARTICLE_SCHEMA).unify_dictionaries()
+
+    tmp_path = f"{path}.tmp"
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with ipc.new_file(sink, ARTICLE_SCHEMA) as writer:
+            writer.write_table(table, max_chunksize=batch_size)
+    os.replace(tmp_path, path)
+
+    print(f"✓ Arrow 파일 저장 완료: {path}")
+    print(f"  - 총 {len(articles)}개 기사, {os.path.getsize(path):,} bytes")
+    return path
+
+
+def read_arrow_file(path):
+    """Arrow IPC 파일을 memory_map으로 열어 Table 반환 (본문 버퍼는 복사하지 않음)"""
+    source = pa.memory_map(path, "r")
+    return ipc.open_file(source).read_all()
+
+
+def _connect(address):
+    """유닉스 소켓 경로(str) 또는 (host, port) 튜플로 연결"""
+    if isinstance(address, str):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.connect(address)
+    return sock
+
+
+class ArrowStreamPublisher:
+    """로컬 소켓으로 레코드 배치를 연속 전송하는 크롤러 쪽 송신기"""
+
+    def __init__(self, address):
+        self.address = address
+        self._sock = _connect(address)
+        self._sink = self._sock.makefile("wb")
+        # 스트림 형식은 배치마다 사전 교체가 가능
+        self._writer = ipc.new_stream(self._sink, ARTICLE_SCHEMA)
+        self.sent_rows = 0
+
+    def publish(self, items, outlet=""):
+        """기사 배치 전송"""
+        batch = articles_to_record_batch(items, outlet=outlet)
+        if batch.num_rows:
+            self._writer.write_batch(batch)
+            self._sink.flush()
+            self.sent_rows += batch.num_rows
+        return batch.num_rows
+
+    def close(self):
+        try:
+            self._writer.close()
+            self._sink.close()
+        finally:
+            self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def serve_arrow_stream(address, handle_batch, max_connections=None):
+    """분석 쪽 수신기: 연결마다 배치를 읽어 handle_batch(batch) 호출"""
+    if isinstance(address, str):
+        if os.path.exists(address):
+            os.remove(address)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+    server.bind(address)
+    server.listen()
+    print(f"📡 Arrow 스트림 수신 대기: {address}")
+
+    handled = 0
+    try:
+        while max_connections is None or handled < max_connections:
+            conn, _ = server.accept()
+            with conn, conn.makefile("rb") as source:
+                reader = ipc.open_stream(source)
+                for batch in reader:
+                    handle_batch(batch)
+            handled += 1
+    finally:
+        server.close()
+        if isinstance(address, str) and os.path.exists(address):
+            os.remove(address)
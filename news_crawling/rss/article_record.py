@@ -0,0 +1,244 @@
+"""
+표준 기사 레코드 (Article)
+
+언론사별 크롤러가 만드는 dict 형태가 제각각이라(한글 6개 키, 정책포털 대통령직속위원회의 16개 키,
+대구신문의 summary/reporter/collected_at 등) 하루치 수집 결과를 메모리에 올리면 키 문자열과
+수집 시각 문자열이 기사마다 반복된다. Article은 __slots__ 기반의 고정 필드 레코드로,
+언론사/카테고리/기자명은 intern 처리하고 날짜는 정수 타임스탬프(epoch 초)로 보관한다.
+
+사용 예:
+    articles = [Article.from_dict(d, outlet="대구신문") for d in collector_rows]
+    rows = [a.to_row() for a in articles]   # 기존 CSV 컬럼(언론사, 제목, 날짜, 카테고리, 기자명, 본문)
+"""
+
+import csv
+import re
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+
+KST = timezone(timedelta(hours=9))
+
+# 결과 CSV 표준 컬럼 순서
+CSV_COLUMNS = ["언론사", "제목", "날짜", "카테고리", "기자명", "본문"]
+
+# 수집기에서 흔히 쓰는 날짜 형식 (시간대 정보가 없으면 KST로 간주)
+DATE_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%Y.%m.%d %H:%M:%S",
+    "%Y.%m.%d %H:%M",
+    "%Y.%m.%d",
+    "%Y/%m/%d %H:%M:%S",
+    "%Y/%m/%d",
+    "%Y%m%d",
+]
+
+# 기사로서 의미 없는 자리표시 값
+EMPTY_VALUES = {"", "정보없음", "날짜 없음", "기자명 없음", "null"}
+
+
+def parse_timestamp(value):
+    """날짜 문자열을 epoch 초로 변환 (해석 불가 시 0)"""
+    if value is None:
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, datetime):
+        dt = value if value.tzinfo else value.replace(tzinfo=KST)
+        return int(dt.timestamp())
+
+    text = str(value).strip()
+    if text in EMPTY_VALUES:
+        return 0
+
+    for fmt in DATE_FORMATS:
+        try:
+            return int(datetime.strptime(text, fmt).replace(tzinfo=KST).timestamp())
+        except ValueError:
+            continue
+
+    # ISO 8601 (2025-08-15T09:30:00+09:00, ...Z)
+    try:
+        dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        return parse_timestamp(dt)
+    except ValueError:
+        pass
+
+    # RSS의 RFC 822 형식 (Fri, 15 Aug 2025 09:30:00 +0900)
+    try:
+        return parse_timestamp(parsedate_to_datetime(text))
+    except (TypeError, ValueError, IndexError):
+        pass
+
+    # "2025년 08월 15일" 형태
+    match = re.search(r"(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일", text)
+    if match:
+        year, month, day = (int(g) for g in match.groups())
+        return int(datetime(year, month, day, tzinfo=KST).timestamp())
+
+    return 0
+
+
+def format_timestamp(ts, fmt="%Y-%m-%d %H:%M:%S"):
+    """epoch 초를 KST 문자열로 변환 (0이면 빈 문자열)"""
+    if not ts:
+        return ""
+    return datetime.fromtimestamp(ts, tz=KST).strftime(fmt)
+
+
+def _intern(value):
+    if not value:
+        return ""
+    return sys.intern(str(value).strip())
+
+
+def _text(value):
+    if value is None:
+        return ""
+    text = str(value).strip()
+    return "" if text in EMPTY_VALUES else text
+
+
+class Article:
+    """표준 기사 레코드"""
+
+    __slots__ = ("outlet", "title", "published", "category", "reporter", "body", "url", "collected")
+
+    def __init__(self, outlet, title, published=0, category="", reporter="", body="", url="", collected=None):
+        self.outlet = _intern(outlet)
+        self.title = title or ""
+        self.published = parse_timestamp(published)
+        self.category = _intern(category)
+        self.reporter = _intern(_text(reporter))
+        self.body = body or ""
+        self.url = url or ""
+        self.collected = int(time.time()) if collected is None else parse_timestamp(collected)
+
+    # ------------------------------------------------------------------
+    # 언론사별 dict 형태 변환
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_row(cls, row, outlet=""):
+        """표준 한글 컬럼 dict (언론사/언론사명, 제목, 날짜, 카테고리, 기자명, 본문)"""
+        return cls(
+            outlet=row.get("언론사") or row.get("언론사명") or outlet,
+            title=row.get("제목", ""),
+            published=row.get("날짜", ""),
+            category=row.get("카테고리", ""),
+            reporter=row.get("기자명", ""),
+            body=row.get("본문") or row.get("본문내용", ""),
+            url=row.get("URL") or row.get("링크", ""),
+        )
+
+    @classmethod
+    def from_presidential_committee(cls, item, outlet="정책포털_대통령직속위원회"):
+        """PresidentialCommitteeRSSCrawler.crawl_presidential_committee_feed 결과 (16개 키)"""
+        return cls(
+            outlet=outlet,
+            title=item.get("title", ""),
+            published=item.get("pub_date", ""),
+            category=item.get("committee_category", ""),
+            reporter="정책포털",
+            body=item.get("content") or item.get("description", ""),
+            url=item.get("link", ""),
+            collected=item.get("collected_at"),
+        )
+
+    @classmethod
+    def from_summary_item(cls, item, outlet):
+        """대구신문 등 summary/reporter/collected_at 형태 수집기 결과"""
+        return cls(
+            outlet=outlet,
+            title=item.get("title", ""),
+            published=item.get("published") or item.get("pub_date", ""),
+            category=item.get("category", ""),
+            reporter=item.get("reporter", ""),
+            body=item.get("summary", ""),
+            url=item.get("link", ""),
+            collected=item.get("collected_at"),
+        )
+
+    @classmethod
+    def from_factcheck(cls, item, outlet="뉴스톱"):
+        """NewstofCrawlerImproved.extract_article_content 결과"""
+        return cls(
+            outlet=outlet,
+            title=item.get("title", ""),
+            published=item.get("date", ""),
+            category=item.get("category", ""),
+            reporter=item.get("reporter", ""),
+            body=item.get("content", ""),
+            url=item.get("url", ""),
+        )
+
+    @classmethod
+    def from_rss_item(cls, item, outlet):
+        """title/link/pub_date/description(/content) 형태의 영문 키 RSS 수집기 결과"""
+        return cls(
+            outlet=outlet,
+            title=item.get("title", ""),
+            published=item.get("pub_date") or item.get("published") or item.get("date", ""),
+            category=item.get("category", ""),
+            reporter=item.get("reporter") or item.get("author") or item.get("creator", ""),
+            body=item.get("content") or item.get("description") or item.get("summary", ""),
+            url=item.get("link") or item.get("url", ""),
+            collected=item.get("collected_at"),
+        )
+
+    @classmethod
+    def from_dict(cls, item, outlet=""):
+        """키 구성을 보고 알맞은 변환기를 선택"""
+        if "제목" in item:
+            return cls.from_row(item, outlet=outlet)
+        if "presidential_committee" in item:
+            return cls.from_presidential_committee(item)
+        if "summary" in item and "collected_at" in item:
+            return cls.from_summary_item(item, outlet)
+        if "content" in item and "url" in item and "date" in item:
+            return cls.from_factcheck(item, outlet=outlet or "뉴스톱")
+        return cls.from_rss_item(item, outlet)
+
+    # ------------------------------------------------------------------
+    # 출력
+    # ------------------------------------------------------------------
+    def to_row(self, date_format="%Y-%m-%d %H:%M:%S"):
+        """기존 결과 CSV 컬럼 형태의 dict"""
+        return {
+            "언론사": self.outlet,
+            "제목": self.title,
+            "날짜": format_timestamp(self.published, date_format),
+            "카테고리": self.category,
+            "기자명": self.reporter,
+            "본문": self.body,
+        }
+
+    def __eq__(self, other):
+        if not isinstance(other, Article):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self):
+        # __eq__는 모든 필드를 비교하므로 식별 필드 일부만 해시해도 일관됨 (세트/딕셔너리 키에 쓰는 동안은 필드를 바꾸지 말 것)
+        return hash((self.url, self.outlet, self.title, self.published))
+
+    def __repr__(self):
+        return f"Article({self.outlet!r}, {self.title[:30]!r}, published={format_timestamp(self.published)!r})"
+
+
+def load_articles_csv(path, outlet=""):
+    """결과 CSV 파일을 Article 리스트로 로드"""
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        return [Article.from_row(row, outlet=outlet) for row in csv.DictReader(f)]
+
+
+def save_articles_csv(articles, path, date_format="%Y-%m-%d %H:%M:%S"):
+    """Article 리스트를 표준 컬럼 CSV로 저장"""
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        for article in articles:
+            writer.writerow(article.to_row(date_format))
+    return path
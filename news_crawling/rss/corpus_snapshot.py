@@ -0,0 +1,297 @@
+"""
+읽기 전용 기사 코퍼스 스냅샷 (mmap)
+
+분석/조회 프로세스마다 results/*.csv를 pandas로 다시 읽으면 코퍼스가 프로세스 수만큼 복제된다.
+스냅샷은 고정 레이아웃 바이너리 파일로, 여러 워커 프로세스가 같은 파일을 mmap으로 열면
+OS 페이지 캐시 한 벌을 공유하고 역직렬화 없이 바로 조회할 수 있다.
+
+파일 레이아웃 (리틀 엔디언, 모든 섹션 8바이트 정렬):
+    header      : magic(8) version(u32) reserved(u32) n_rows(u64) n_dict(u64) + 섹션 오프셋 6개(u64)
+    outlet      : u32[n_rows]   언론사 사전 코드
+    category    : u32[n_rows]   카테고리 사전 코드
+    published   : i64[n_rows]   발행 시각 (epoch 초, 오름차순 정렬)
+    collected   : i64[n_rows]   수집 시각 (epoch 초)
+    str_offsets : u64[n_dict + n_rows * 4 + 1]   문자열 힙 오프셋
+    heap        : UTF-8 문자열 (사전 문자열 n_dict개 뒤에 행마다 제목/기자명/본문/URL)
+
+사용 예:
+    write_snapshot(articles, "results/corpus.snap")
+    snap = CorpusSnapshot("results/corpus.snap")
+    for i in snap.range_by_published(start_ts, end_ts):
+        print(snap.title(i))
+"""
+
+import bisect
+import glob
+import mmap
+import os
+import struct
+
+from article_record import Article, load_articles_csv
+
+MAGIC = b"NCASNAP1"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQ6Q")
+TEXT_FIELDS = ("title", "reporter", "body", "url")
+
+
+def _align(n):
+    return (n + 7) & ~7
+
+
+def write_snapshot(articles, path):
+    """Article 목록을 스냅샷 파일로 저장 (임시 파일에 쓴 뒤 교체하므로 기존 리더에 영향 없음)"""
+    articles = sorted(articles, key=lambda a: a.published)
+    n_rows = len(articles)
+
+    # 언론사/카테고리 사전
+    dictionary = []
+    codes = {}
+    for article in articles:
+        for value in (article.outlet, article.category):
+            if value not in codes:
+                codes[value] = len(dictionary)
+                dictionary.append(value)
+
+    strings = [value.encode("utf-8") for value in dictionary]
+    for article in articles:
+        for field in TEXT_FIELDS:
+            strings.append(getattr(article, field).encode("utf-8"))
+
+    str_offsets = [0]
+    for data in strings:
+        str_offsets.append(str_offsets[-1] + len(data))
+
+    # 섹션 오프셋 계산
+    pos = HEADER.size
+    outlet_off = pos
+    pos = _align(pos + 4 * n_rows)
+    category_off = pos
+    pos = _align(pos + 4 * n_rows)
+    published_off = pos
+    pos += 8 * n_rows
+    collected_off = pos
+    pos += 8 * n_rows
+    str_offsets_off = pos
+    pos += 8 * len(str_offsets)
+    heap_off = pos
+
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        0,
+        n_rows,
+        len(dictionary),
+        outlet_off,
+        category_off,
+        published_off,
+        collected_off,
+        str_offsets_off,
+        heap_off,
+    )
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+
+        f.seek(outlet_off)
+        f.write(struct.pack(f"<{n_rows}I", *(codes[a.outlet] for a in articles)))
+        f.seek(category_off)
+        f.write(struct.pack(f"<{n_rows}I", *(codes[a.category] for a in articles)))
+        f.seek(published_off)
+        f.write(struct.pack(f"<{n_rows}q", *(a.published for a in articles)))
+        f.write(struct.pack(f"<{n_rows}q", *(a.collected for a in articles)))
+        f.write(struct.pack(f"<{len(str_offsets)}Q", *str_offsets))
+        for data in strings:
+            f.write(data)
+
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
+    return path
+
+
+def build_snapshot_from_csv(csv_paths, path):
+    """결과 CSV 파일들로 스냅샷 생성"""
+    articles = []
+    for csv_path in csv_paths:
+        try:
+            articles.extend(load_articles_csv(csv_path))
+        except Exception as e:
+            print(f"⚠️ CSV 로드 실패 ({csv_path}): {e}")
+
+    write_snapshot(articles, path)
+    print(f"📦 스냅샷 저장 완료: {path} ({len(articles):,}개 기사, {os.path.getsize(path):,} bytes)")
+    return path
+
+
+class CorpusSnapshot:
+    """mmap 기반 읽기 전용 스냅샷 리더 (열기 비용은 헤더 파싱뿐)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = memoryview(self._mm)
+
+        (
+            magic,
+            version,
+            _,
+            self.n_rows,
+            self.n_dict,
+            outlet_off,
+            category_off,
+            published_off,
+            collected_off,
+            str_offsets_off,
+            heap_off,
+        ) = HEADER.unpack_from(self._buf, 0)
+
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"스냅샷 형식이 아닙니다: {path}")
+
+        n = self.n_rows
+        self._columns = {
+            "outlet": self._buf[outlet_off : outlet_off + 4 * n].cast("I"),
+            "category": self._buf[category_off : category_off + 4 * n].cast("I"),
+            "published": self._buf[published_off : published_off + 8 * n].cast("q"),
+            "collected": self._buf[collected_off : collected_off + 8 * n].cast("q"),
+        }
+        n_strings = self.n_dict + 4 * n + 1
+        self._str_offsets = self._buf[str_offsets_off : str_offsets_off + 8 * n_strings].cast("Q")
+        self._heap = self._buf[heap_off:]
+
+        # 사전 문자열은 개수가 작으므로 한 번만 디코딩
+        self.dictionary = [self._string(i) for i in range(self.n_dict)]
+
+    def _string(self, index):
+        start = self._str_offsets[index]
+        end = self._str_offsets[index + 1]
+        return str(self._heap[start:end], "utf-8")
+
+    def _text(self, row, field_index):
+        return self._string(self.n_dict + 4 * row + field_index)
+
+    def __len__(self):
+        return self.n_rows
+
+    # ------------------------------------------------------------------
+    # 컬럼 접근 (복사 없음)
+    # ------------------------------------------------------------------
+    def column(self, name):
+        """outlet/category/published/collected 컬럼의 memoryview"""
+        return self._columns[name]
+
+    def as_numpy(self, name):
+        """컬럼을 numpy 배열로 (mmap 위의 읽기 전용 뷰, 배열이 살아 있는 동안 close()는 mmap 해제를 미룸)"""
+        import numpy as np
+
+        return np.frombuffer(self._columns[name], dtype=self._columns[name].format)
+
+    def code_of(self, value):
+        """언론사/카테고리 문자열의 사전 코드 (없으면 -1)"""
+        try:
+            return self.dictionary.index(value)
+        except ValueError:
+            return -1
+
+    # ------------------------------------------------------------------
+    # 행 접근
+    # ------------------------------------------------------------------
+    def outlet(self, row):
+        return self.dictionary[self._columns["outlet"][row]]
+
+    def category(self, row):
+        return self.dictionary[self._columns["category"][row]]
+
+    def title(self, row):
+        return self._text(row, 0)
+
+    def reporter(self, row):
+        return self._text(row, 1)
+
+    def body(self, row):
+        return self._text(row, 2)
+
+    def url(self, row):
+        return self._text(row, 3)
+
+    def article(self, row):
+        """행을 Article로 구성"""
+        return Article(
+            outlet=self.outlet(row),
+            title=self.title(row),
+            published=self._columns["published"][row],
+            category=self.category(row),
+            reporter=self.reporter(row),
+            body=self.body(row),
+            url=self.url(row),
+            collected=self._columns["collected"][row],
+        )
+
+    def __iter__(self):
+        for row in range(self.n_rows):
+            yield self.article(row)
+
+    def range_by_published(self, start=None, end=None):
+        """발행 시각 [start, end) 구간의 행 번호 range (정렬된 컬럼 이분 탐색)"""
+        published = self._columns["published"]
+        lo = 0 if start is None else bisect.bisect_left(published, start)
+        hi = self.n_rows if end is None else bisect.bisect_left(published, end)
+        return range(lo, max(lo, hi))
+
+    def rows_by_outlet(self, outlet):
+        """특정 언론사의 행 번호 목록"""
+        code = self.code_of(outlet)
+        if code < 0:
+            return []
+        return [row for row, value in enumerate(self._columns["outlet"]) if value == code]
+
+    # ------------------------------------------------------------------
+    def close(self):
+        """파일 닫기
+
+        as_numpy()로 받은 배열이 아직 살아 있으면 그 배열이 참조하는 뷰와 mmap은 닫을 수 없다(BufferError).
+        이 경우 예외를 내지 않고 mmap 해제를 미루며, 배열이 모두 사라지면 가비지 컬렉션이 정리한다.
+        """
+        views = list(getattr(self, "_columns", {}).values())
+        views += [getattr(self, name, None) for name in ("_str_offsets", "_heap", "_buf")]
+        for view in views:
+            if view is not None:
+                try:
+                    view.release()
+                except BufferError:
+                    pass  # as_numpy() 배열이 참조 중
+
+        try:
+            self._mm.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    """results 폴더의 CSV로 스냅샷 생성"""
+    csv_paths = sorted(glob.glob("results/*.csv"))
+    if not csv_paths:
+        print("❌ results 폴더에 CSV 파일이 없습니다.")
+        return
+
+    print(f"🔄 {len(csv_paths)}개 CSV 파일로 스냅샷 생성 중...")
+    path = build_snapshot_from_csv(csv_paths, "results/corpus.snap")
+
+    with CorpusSnapshot(path) as snap:
+        print(f"✅ 로드 확인: {len(snap):,}개 기사, 언론사/카테고리 사전 {len(snap.dictionary)}개")
+
+
+if __name__ == "__main__":
+    main()
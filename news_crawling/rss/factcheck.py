@@ -1,10 +1,17 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import csv
+import glob
+import json
+import queue
+import sys
+import threading
 import time
 import re
-from urllib.parse import urljoin
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urljoin, urlparse
 import logging
 from datetime import datetime
 
@@ -14,6 +21,107 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 NEWS_OUTLET = "뉴스톱"
 # 모든 기자명 고정
 REPORTER_NAME = "팩트체크"
+# 이미 수집한 기사 번호(idxno) 저장소 (증분 수집 시 여기까지 오면 페이지 순회 중단)
+KNOWN_IDXNO_PATH = "results/newstof_idxno.txt"
+IDXNO_RE = re.compile(r"idxno=(\d+)")
+
+
+def article_idxno(url):
+    match = IDXNO_RE.search(url or "")
+    return int(match.group(1)) if match else None
+
+
+class HostRateLimiter:
+    """호스트별 요청 시작 간격 제한 (여러 스레드가 같은 서버에 몰리지 않도록)"""
+
+    def __init__(self, min_interval=1.0):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = {}
+
+    def wait(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class CrawlStats:
+    """수집 성공률 누적 카운터 (기사 목록을 메모리에 쌓지 않음)"""
+
+    def __init__(self):
+        self.processed = 0
+        self.failed = 0
+        self.dates = 0
+        self.reporters = 0
+
+    def record(self, article_data):
+        self.processed += 1
+        if article_data["title"] == "추출 실패":
+            self.failed += 1
+        if article_data["date"]:
+            self.dates += 1
+        if article_data["reporter"]:
+            self.reporters += 1
+
+    def log(self, prefix=""):
+        if not self.processed:
+            logging.info(f"{prefix}처리한 기사가 없습니다.")
+            return
+        logging.info(f"{prefix}총 {self.processed}개 기사 (실패 {self.failed}개)")
+        logging.info(f"{prefix}날짜 추출 성공률: {self.dates}/{self.processed} ({self.dates/self.processed*100:.1f}%)")
+        logging.info(
+            f"{prefix}기자명 추출 성공률: {self.reporters}/{self.processed} ({self.reporters/self.processed*100:.1f}%)"
+        )
+
+
+def load_known_idxnos(path=KNOWN_IDXNO_PATH, results_dir="results"):
+    """저장소 파일 + 기존 결과 CSV(URL 컬럼)에서 이미 수집한 idxno 집합"""
+    known = set()
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            known.update(int(line) for line in f if line.strip().isdigit())
+
+    for csv_path in glob.glob(os.path.join(results_dir, "*.csv")):
+        try:
+            with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
+                reader = csv.DictReader(f)
+                if "URL" not in (reader.fieldnames or []):
+                    continue
+                for row in reader:
+                    if "newstof.com" in (row.get("URL") or ""):
+                        idxno = article_idxno(row["URL"])
+                        if idxno is not None:
+                            known.add(idxno)
+        except Exception as e:
+            logging.warning(f"기존 결과 확인 실패 ({csv_path}): {e}")
+    return known
+
+
+def failed_idxno_path(known_path=KNOWN_IDXNO_PATH):
+    """추출에 실패한 기사 저장소 ({idxno: url}, 다음 증분 실행 시작 시 다시 시도)"""
+    return os.path.splitext(known_path)[0] + "_failed.json"
+
+
+def load_failed_idxnos(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return {int(idxno): url for idxno, url in json.load(f).items()}
+    except (OSError, ValueError) as e:
+        logging.warning(f"실패 기사 목록 로드 실패 ({path}): {e}")
+        return {}
+
+
+def save_failed_idxnos(path, failed):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({str(idxno): url for idxno, url in sorted(failed.items())}, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
 
 
 class NewstofCrawlerImproved:
@@ -26,13 +134,20 @@ class NewstofCrawlerImproved:
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
             }
         )
+        # 파이프라인 모드에서만 설정 (None이면 기존처럼 호출 측 sleep으로 간격 유지)
+        self.rate_limiter = None
+
+    def _get(self, url, **kwargs):
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait(url)
+        return self.session.get(url, **kwargs)
 
     def get_total_pages(self):
         """전체 페이지 수 계산"""
         params = {"sc_section_code": "S1N45", "view_type": "sm", "page": 1}
 
         try:
-            response = self.session.get(self.list_url, params=params)
+            response = self._get(self.list_url, params=params)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, "html.parser")
 
@@ -52,61 +167,65 @@ class NewstofCrawlerImproved:
             return 169
 
     def get_article_links_from_page(self, page_num):
-        """특정 페이지에서 기사 링크와 기본 정보 추출"""
-        params = {"sc_section_code": "S1N45", "view_type": "sm", "page": page_num}
-
+        """특정 페이지에서 기사 링크와 기본 정보 추출 (오류 시 빈 목록)"""
         try:
-            response = self.session.get(self.list_url, params=params)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
+            return self._fetch_article_links(page_num)
 
-            articles_info = []
+        except Exception as e:
+            logging.error(f"페이지 {page_num} 링크 추출 중 오류: {e}")
+            return []
 
-            # 요약형 view에서 기사 정보 추출
-            article_items = soup.find_all("li")
+    def _fetch_article_links(self, page_num):
+        """get_article_links_from_page 본체 (요청/파싱 오류를 그대로 전달)"""
+        params = {"sc_section_code": "S1N45", "view_type": "sm", "page": page_num}
 
-            for item in article_items:
-                # 기사 링크 찾기
-                link_elem = item.find("a", href=re.compile(r"articleView\.html\?idxno=\d+"))
-                if not link_elem:
-                    continue
+        response = self._get(self.list_url, params=params)
+        response.raise_for_status()
+        soup = BeautifulSoup(response.content, "html.parser")
 
-                article_url = urljoin(self.base_url, link_elem["href"])
+        articles_info = []
 
-                # 리스트 페이지에서 미리 날짜와 기자명 추출 시도
-                date_text = ""
-                reporter_text = ""
+        # 요약형 view에서 기사 정보 추출
+        article_items = soup.find_all("li")
 
-                # 날짜 패턴 찾기 (예: 2025.06.27 16:01)
-                date_elem = item.find(text=re.compile(r"\d{4}\.\d{2}\.\d{2}"))
-                if date_elem:
-                    date_match = re.search(r"(\d{4}\.\d{2}\.\d{2})", date_elem.strip())
-                    if date_match:
-                        date_text = date_match.group(1)
+        for item in article_items:
+            # 기사 링크 찾기
+            link_elem = item.find("a", href=re.compile(r"articleView\.html\?idxno=\d+"))
+            if not link_elem:
+                continue
 
-                # 기자명 패턴 찾기
-                reporter_elem = item.find(text=re.compile(r"[가-힣]+\s*기자"))
-                if reporter_elem:
-                    reporter_match = re.search(r"([가-힣]+)\s*기자", reporter_elem.strip())
-                    if reporter_match:
-                        reporter_text = reporter_match.group(1)
+            article_url = urljoin(self.base_url, link_elem["href"])
 
-                articles_info.append({"url": article_url, "preview_date": date_text, "preview_reporter": reporter_text})
+            # 리스트 페이지에서 미리 날짜와 기자명 추출 시도
+            date_text = ""
+            reporter_text = ""
 
-            # 중복 제거
-            seen_urls = set()
-            unique_articles = []
-            for article in articles_info:
-                if article["url"] not in seen_urls:
-                    seen_urls.add(article["url"])
-                    unique_articles.append(article)
+            # 날짜 패턴 찾기 (예: 2025.06.27 16:01)
+            date_elem = item.find(text=re.compile(r"\d{4}\.\d{2}\.\d{2}"))
+            if date_elem:
+                date_match = re.search(r"(\d{4}\.\d{2}\.\d{2})", date_elem.strip())
+                if date_match:
+                    date_text = date_match.group(1)
 
-            logging.info(f"페이지 {page_num}: {len(unique_articles)}개 기사 링크 발견")
-            return unique_articles
+            # 기자명 패턴 찾기
+            reporter_elem = item.find(text=re.compile(r"[가-힣]+\s*기자"))
+            if reporter_elem:
+                reporter_match = re.search(r"([가-힣]+)\s*기자", reporter_elem.strip())
+                if reporter_match:
+                    reporter_text = reporter_match.group(1)
 
-        except Exception as e:
-            logging.error(f"페이지 {page_num} 링크 추출 중 오류: {e}")
-            return []
+            articles_info.append({"url": article_url, "preview_date": date_text, "preview_reporter": reporter_text})
+
+        # 중복 제거
+        seen_urls = set()
+        unique_articles = []
+        for article in articles_info:
+            if article["url"] not in seen_urls:
+                seen_urls.add(article["url"])
+                unique_articles.append(article)
+
+        logging.info(f"페이지 {page_num}: {len(unique_articles)}개 기사 링크 발견")
+        return unique_articles
 
     def clean_content(self, content):
         """본문 내용 정제"""
@@ -148,7 +267,7 @@ class NewstofCrawlerImproved:
         article_url = article_info["url"]
 
         try:
-            response = self.session.get(article_url)
+            response = self._get(article_url)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, "html.parser")
 
@@ -365,6 +484,182 @@ class NewstofCrawlerImproved:
 
         return all_articles
 
+    def _prefetch_pages(self, page_queue, total_pages, known, retrying, stop_event, known_threshold):
+        """목록 페이지를 미리 받아 큐에 넣는 생산자 (이미 수집한 idxno를 만나면 순회 중단)
+
+        목록 요청이 실패하면 예외 객체를 큐에 넣어 소비자가 다시 발생시키고, 정상 종료는 None으로 알린다.
+        """
+        known_hits = 0
+        error = None
+        try:
+            for page in range(1, total_pages + 1):
+                if stop_event.is_set():
+                    break
+                articles_info = self._fetch_article_links(page)
+                if not articles_info:
+                    break
+
+                fresh = []
+                for article_info in articles_info:
+                    idxno = article_idxno(article_info["url"])
+                    if idxno in retrying:
+                        # 실행 시작 때 이미 다시 제출한 실패 기사 (수집 완료로 세지 않음)
+                        continue
+                    if idxno in known:
+                        known_hits += 1
+                        continue
+                    if idxno is not None:
+                        # 수집 중 새 기사가 올라와 목록이 밀려도 같은 기사를 두 번 받지 않도록
+                        known.add(idxno)
+                    fresh.append(article_info)
+
+                while not stop_event.is_set():
+                    try:
+                        page_queue.put((page, fresh), timeout=1)
+                        break
+                    except queue.Full:
+                        continue
+
+                if known_hits >= known_threshold:
+                    logging.info(f"페이지 {page}에서 이미 수집한 기사 {known_hits}건 확인 → 목록 순회 중단")
+                    break
+        except Exception as e:
+            error = e
+        finally:
+            page_queue.put(error)
+
+    def crawl_incremental(
+        self,
+        output_file=None,
+        max_pages=None,
+        workers=4,
+        min_interval=1.0,
+        known_path=KNOWN_IDXNO_PATH,
+        known_threshold=3,
+        prefetch_pages=2,
+    ):
+        """증분 파이프라인 수집
+
+        - 목록 페이지는 별도 스레드가 prefetch_pages 만큼 앞서 받아 둔다
+        - 기사 본문은 스레드 풀(workers)에서 받되 호스트별 min_interval 간격을 지킨다
+          (고정 sleep 대신 HostRateLimiter가 요청 시작 시각을 배분)
+        - 이미 수집한 idxno(known_path + 기존 결과 CSV)를 known_threshold건 만나면 페이지 순회 중단
+        - 추출에 실패한 기사는 failed_idxno_path(known_path)에 남겨 다음 실행 시작 때 먼저 다시 제출
+          (순회가 일찍 멈춰도 오래된 실패 기사를 놓치지 않음)
+        - 기사 목록을 메모리에 쌓지 않고 CrawlStats 카운터로 성공률만 집계
+        - 출력 컬럼: 언론사, 제목, 날짜, 카테고리, 기자명, 본문, URL
+        """
+        known = load_known_idxnos(known_path, os.path.dirname(known_path) or ".")
+        failed_path = failed_idxno_path(known_path)
+        failed = {idxno: url for idxno, url in load_failed_idxnos(failed_path).items() if idxno not in known}
+        retrying = dict(failed)
+        logging.info(f"이미 수집한 기사 {len(known)}건, 다시 시도할 실패 기사 {len(retrying)}건")
+
+        if output_file is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_file = os.path.join("results", f"{NEWS_OUTLET}_증분_{timestamp}.csv")
+        os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+        os.makedirs(os.path.dirname(known_path) or ".", exist_ok=True)
+
+        total_pages = self.get_total_pages()
+        if max_pages:
+            total_pages = min(total_pages, max_pages)
+
+        self.rate_limiter = HostRateLimiter(min_interval)
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=workers + 1)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        stats = CrawlStats()
+        stop_event = threading.Event()
+        page_queue = queue.Queue(maxsize=prefetch_pages)
+        producer = threading.Thread(
+            target=self._prefetch_pages,
+            args=(page_queue, total_pages, known, set(retrying), stop_event, known_threshold),
+            name="newstof-prefetch",
+            daemon=True,
+        )
+
+        fieldnames = ["언론사", "제목", "날짜", "카테고리", "기자명", "본문", "URL"]
+        max_pending = workers * 2
+
+        with open(output_file, "w", newline="", encoding="utf-8-sig") as f, open(
+            known_path, "a", encoding="utf-8"
+        ) as known_file:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+
+            def drain(pending, return_when):
+                done, pending = wait(pending, return_when=return_when)
+                for future in done:
+                    data = future.result()
+                    stats.record(data)
+                    idxno = article_idxno(data["url"])
+                    if data["title"] == "추출 실패":
+                        # 실패한 기사는 수집 완료 저장소 대신 실패 목록에 남겨 다음 실행에서 다시 시도
+                        if idxno is not None:
+                            failed[idxno] = data["url"]
+                        continue
+                    failed.pop(idxno, None)
+                    writer.writerow(
+                        {
+                            "언론사": NEWS_OUTLET,
+                            "제목": data["title"],
+                            "날짜": data["date"],
+                            "카테고리": data.get("category", "기타"),
+                            "기자명": REPORTER_NAME,
+                            "본문": data["content"],
+                            "URL": data["url"],
+                        }
+                    )
+                    if idxno is not None:
+                        known_file.write(f"{idxno}\n")
+                    if stats.processed % 50 == 0:
+                        f.flush()
+                        known_file.flush()
+                        stats.log(f"[{stats.processed}] ")
+                return pending
+
+            producer.start()
+            pending = set()
+            try:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    # 지난 실행에서 실패한 기사부터 다시 제출
+                    for url in retrying.values():
+                        article_info = {"url": url, "preview_date": "", "preview_reporter": ""}
+                        pending.add(executor.submit(self.extract_article_content, article_info))
+                        if len(pending) >= max_pending:
+                            pending = drain(pending, FIRST_COMPLETED)
+
+                    while True:
+                        item = page_queue.get()
+                        if item is None:
+                            break
+                        if isinstance(item, Exception):
+                            raise RuntimeError(f"목록 페이지 수집 실패: {item}") from item
+                        page, articles_info = item
+                        logging.info(f"페이지 {page}/{total_pages}: 새 기사 {len(articles_info)}건")
+                        for article_info in articles_info:
+                            pending.add(executor.submit(self.extract_article_content, article_info))
+                            if len(pending) >= max_pending:
+                                pending = drain(pending, FIRST_COMPLETED)
+                    if pending:
+                        drain(pending, ALL_COMPLETED)
+            finally:
+                stop_event.set()
+                # 생산자가 큐에 막혀 있지 않도록 비워 준다
+                while producer.is_alive():
+                    try:
+                        page_queue.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+                self.rate_limiter = None
+                save_failed_idxnos(failed_path, failed)
+
+        logging.info(f"증분 수집 완료: {output_file}")
+        stats.log("최종 ")
+        return stats
+
     def crawl_per_category(self, categories=None, max_per_category=20, output_dir="results"):
         """카테고리별로 20개씩 자동 수집하여 단일 CSV로 저장
 
@@ -450,6 +745,11 @@ class NewstofCrawlerImproved:
 def main():
     crawler = NewstofCrawlerImproved()
     try:
+        if len(sys.argv) > 1 and sys.argv[1] == "incremental":
+            # 일일 갱신: 지난 실행 이후 새 기사만 파이프라인으로 수집
+            stats = crawler.crawl_incremental()
+            print(f"증분 수집 완료: 새 기사 {stats.processed - stats.failed}개 저장했습니다.")
+            return
         # 비대화형: 각 카테고리(팩트체크/주간팩트체크) 20개씩 자동 수집하여 단일 CSV 저장
         crawler.crawl_per_category(
             categories=["팩트체크", "주간팩트체크"],
@@ -463,6 +463,22 @@ def save_kbs_to_csv(articles_data, date_str, filename=None, split_by_section=Fal
     return saved_files
 
 
+def save_kbs_to_arrow(articles_data, date_str, filename=None):
+    """
+    KBS 뉴스 데이터를 Arrow IPC 파일로 저장 (분석 작업이 CSV 파싱 없이 바로 로드)
+    """
+    if not articles_data:
+        print("저장할 데이터가 없습니다.")
+        return None
+
+    from arrow_handoff import write_arrow_file
+
+    if filename is None:
+        filename = f"results/KBS_전체_{date_str}.arrow"
+
+    return write_arrow_file(articles_data, filename, outlet="KBS")
+
+
 def main():
     """
     메인 실행 함수
@@ -487,6 +503,12 @@ def main():
             # CSV 파일로 저장
             saved_files = save_kbs_to_csv(articles, date_str, split_by_section=split_by_section)
 
+            # 분석 작업 전달용 Arrow 파일
+            try:
+                saved_files.append(save_kbs_to_arrow(articles, date_str))
+            except ImportError:
+                print("⚠️ pyarrow가 설치되어 있지 않아 Arrow 파일 저장을 건너뜁니다.")
+
             # 결과 요약
             print("\n" + "=" * 60)
             print("KBS 뉴스 크롤링 완료 결과")
@@ -6,9 +6,11 @@ from datetime import datetime
 import time
 from urllib.parse import urljoin
 
+from raw_archive import RawHTMLArchive
 
-def extract_mbc_article_content(url):
-    """MBC 뉴스 기사 URL에서 전체 본문을 추출하는 함수"""
+
+def extract_mbc_article_content(url, archive=None):
+    """MBC 뉴스 기사 URL에서 전체 본문을 추출하는 함수 (archive 지정 시 원문 HTML 보관)"""
     try:
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -18,6 +20,10 @@ def extract_mbc_article_content(url):
         response.raise_for_status()
         response.encoding = "utf-8"
 
+        # 추출 로직 개선 시 재처리할 수 있도록 원문 보관
+        if archive is not None:
+            archive.put(url, response.content, status=response.status_code, headers=response.headers)
+
         soup = BeautifulSoup(response.text, "html.parser")
 
         # MBC 뉴스 기사 본문 추출 (다양한 선택자 시도)
@@ -300,7 +306,7 @@ def get_mbc_news_list(base_url="https://imnews.imbc.com", categories=None, max_p
         return []
 
 
-def scrape_mbc_news(max_articles=50, categories=None):
+def scrape_mbc_news(max_articles=50, categories=None, archive=None):
     """MBC 뉴스를 크롤링하여 CSV로 저장하는 메인 함수"""
 
     print("🗞️  MBC 뉴스 크롤링 시작")
@@ -382,7 +388,7 @@ def scrape_mbc_news(max_articles=50, categories=None):
                     date_text = datetime.now().strftime("%Y-%m-%d %H:%M")
 
                 # 전체 본문 추출
-                full_content = extract_mbc_article_content(url)
+                full_content = extract_mbc_article_content(url, archive=archive)
 
                 # 기자명 추출
                 reporter_name = extract_mbc_reporter_name(soup, full_content)
@@ -415,7 +421,7 @@ def scrape_mbc_news(max_articles=50, categories=None):
         return []
 
 
-def scrape_mbc_by_category(category=None):
+def scrape_mbc_by_category(category=None, archive=None):
     """특정 카테고리의 MBC 뉴스 크롤링"""
 
     category_mapping = {
@@ -438,7 +444,7 @@ def scrape_mbc_by_category(category=None):
         print("📰 MBC 전체 뉴스를 수집합니다.")
 
     # 해당 카테고리만 수집 (제한 없이 전체 수집)
-    return scrape_mbc_news(categories=[category] if category else None)
+    return scrape_mbc_news(categories=[category] if category else None, archive=archive)
 
 
 if __name__ == "__main__":
@@ -451,9 +457,10 @@ if __name__ == "__main__":
         ("culture", "문화"),
     ]
     all_articles = []
+    archive = RawHTMLArchive("results/raw_archive")
     for key, kor in categories:
         print(f"\n=== MBC {kor} 뉴스 수집 시작 ===")
-        data = scrape_mbc_by_category(key)
+        data = scrape_mbc_by_category(key, archive=archive)
         for item in data:
             item["카테고리"] = kor
         all_articles.extend(data)
@@ -16,6 +16,9 @@ import logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# 더보기로 늘어나는 최신기사 목록 항목
+LIST_ITEM_SELECTOR = "div.row-bottom-border-2"
+
 
 class News1Scraper:
     def __init__(self, headless=False):
@@ -71,90 +74,144 @@ class News1Scraper:
         if not os.path.exists("results"):
             os.makedirs("results")
 
+    def _list_count(self):
+        """현재 DOM의 최신기사 목록 항목 수"""
+        return self.driver.execute_script(f"return document.querySelectorAll('{LIST_ITEM_SELECTOR}').length;")
+
+    def _load_more(self, previous_count):
+        """더보기 한 번 클릭 후 목록 항목이 실제로 늘어날 때까지 대기 (늘어나지 않으면 False)"""
+        try:
+            more_button = self.wait.until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, "button.read-more.btn.btn-dark"))
+            )
+        except (TimeoutException, NoSuchElementException):
+            logger.info("  더 이상 로드할 기사가 없습니다.")
+            return False
+
+        # 버튼으로 스크롤 후 클릭
+        self.driver.execute_script("arguments[0].scrollIntoView(true); arguments[0].click();", more_button)
+
+        # 고정 대기 대신 새 항목이 붙는 시점까지만 대기 (서버 응답 시간만큼)
+        try:
+            self.wait.until(lambda driver: self._list_count() > previous_count)
+        except TimeoutException:
+            logger.info("  더보기 후 새 기사가 추가되지 않았습니다.")
+            return False
+        return True
+
     def scroll_and_click_more(self, max_clicks=10):
         """더보기 버튼을 클릭하여 추가 기사 로드"""
         click_count = 0
 
         while click_count < max_clicks:
             try:
-                # 더보기 버튼 찾기
-                more_button = self.wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "button.read-more.btn.btn-dark"))
-                )
-
-                # 버튼으로 스크롤
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", more_button)
-                time.sleep(1)
-
-                # 버튼 클릭
-                self.driver.execute_script("arguments[0].click();", more_button)
+                if not self._load_more(self._list_count()):
+                    break
                 click_count += 1
                 logger.info(f"  더보기 버튼 클릭 {click_count}회")
 
-                # 새 콘텐츠 로딩 대기
-                time.sleep(2)
+            except Exception as e:
+                logger.error(f"  더보기 버튼 클릭 중 오류: {e}")
+                break
+
+        return click_count
+
+    def collect_article_list(self, max_articles=30, max_clicks=10):
+        """최신기사 목록을 더보기로 늘려 가며 새로 붙은 항목만 파싱
+
+        이미 파싱한 항목은 다시 읽지 않고, max_articles개가 모이면 더보기를 멈춘다.
+        """
+        articles = []
+        seen_urls = set()
+        parsed_count = 0
+        click_count = 0
+
+        while True:
+            try:
+                containers = self.driver.find_elements(By.CSS_SELECTOR, LIST_ITEM_SELECTOR)
+            except Exception as e:
+                logger.error(f"  기사 목록 추출 중 오류: {e}")
+                break
+
+            for article_info in self._parse_list_items(containers[parsed_count:]):
+                if article_info["url"] not in seen_urls:
+                    seen_urls.add(article_info["url"])
+                    articles.append(article_info)
+            parsed_count = len(containers)
 
-            except (TimeoutException, NoSuchElementException):
-                logger.info("  더 이상 로드할 기사가 없습니다.")
+            if len(articles) >= max_articles or click_count >= max_clicks:
                 break
+            try:
+                if not self._load_more(parsed_count):
+                    break
             except Exception as e:
                 logger.error(f"  더보기 버튼 클릭 중 오류: {e}")
                 break
+            click_count += 1
+            logger.info(f"  더보기 버튼 클릭 {click_count}회 (목록 {self._list_count()}개)")
 
-        return click_count
+        logger.info(f"  총 {len(articles)}개의 기사 목록 추출 완료")
+        return articles
 
-    def extract_article_list(self):
-        """최신기사 목록 추출"""
+    def _parse_list_items(self, article_containers):
+        """최신기사 목록 항목(div.row-bottom-border-2) → 기사 정보 리스트"""
         articles = []
 
-        try:
-            # 최신기사 섹션 찾기
-            article_containers = self.driver.find_elements(By.CSS_SELECTOR, "div.row-bottom-border-2")
+        for container in article_containers:
+            try:
+                article_info = {}
 
-            for container in article_containers:
+                # 제목과 링크
+                title_elem = container.find_element(By.CSS_SELECTOR, "h2.n1-header-title-1-2 a")
+                article_info["title"] = title_elem.text.strip()
+                article_info["url"] = title_elem.get_attribute("href")
+
+                # 중복 제거를 위한 URL 체크
+                if not article_info["url"]:
+                    continue
+
+                # 시간
                 try:
-                    article_info = {}
-
-                    # 제목과 링크
-                    title_elem = container.find_element(By.CSS_SELECTOR, "h2.n1-header-title-1-2 a")
-                    article_info["title"] = title_elem.text.strip()
-                    article_info["url"] = title_elem.get_attribute("href")
-
-                    # 중복 제거를 위한 URL 체크
-                    if not article_info["url"]:
-                        continue
-
-                    # 시간
-                    try:
-                        time_elem = container.find_element(By.CSS_SELECTOR, "div.entry-meta span:first-child")
-                        article_info["time"] = time_elem.text.strip()
-                    except:
-                        article_info["time"] = ""
-
-                    # 기자명
-                    try:
-                        meta_spans = container.find_elements(By.CSS_SELECTOR, "div.entry-meta span")
-                        reporters = []
-                        for span in meta_spans:
-                            text = span.text.strip()
-                            if "기자" in text:
-                                reporters.append(text)
-                        article_info["reporter"] = ", ".join(reporters) if reporters else ""
-                    except:
-                        article_info["reporter"] = ""
-
-                    # 요약 (있는 경우)
-                    try:
-                        desc_elem = container.find_element(By.CSS_SELECTOR, "span.n1-header-desc-1")
-                        article_info["description"] = desc_elem.text.strip()
-                    except:
-                        article_info["description"] = ""
+                    time_elem = container.find_element(By.CSS_SELECTOR, "div.entry-meta span:first-child")
+                    article_info["time"] = time_elem.text.strip()
+                except:
+                    article_info["time"] = ""
 
-                    articles.append(article_info)
+                # 기자명
+                try:
+                    meta_spans = container.find_elements(By.CSS_SELECTOR, "div.entry-meta span")
+                    reporters = []
+                    for span in meta_spans:
+                        text = span.text.strip()
+                        if "기자" in text:
+                            reporters.append(text)
+                    article_info["reporter"] = ", ".join(reporters) if reporters else ""
+                except:
+                    article_info["reporter"] = ""
+
+                # 요약 (있는 경우)
+                try:
+                    desc_elem = container.find_element(By.CSS_SELECTOR, "span.n1-header-desc-1")
+                    article_info["description"] = desc_elem.text.strip()
+                except:
+                    article_info["description"] = ""
 
-                except Exception as e:
-                    logger.error(f"  기사 정보 추출 중 오류: {e}")
-                    continue
+                articles.append(article_info)
+
+            except Exception as e:
+                logger.error(f"  기사 정보 추출 중 오류: {e}")
+                continue
+
+        return articles
+
+    def extract_article_list(self):
+        """최신기사 목록 추출"""
+        articles = []
+
+        try:
+            # 최신기사 섹션 찾기
+            article_containers = self.driver.find_elements(By.CSS_SELECTOR, LIST_ITEM_SELECTOR)
+            articles = self._parse_list_items(article_containers)
 
             logger.info(f"  총 {len(articles)}개의 기사 목록 추출 완료")
             return articles
@@ -246,15 +303,15 @@ class News1Scraper:
         logger.info(f"{'='*50}")
 
         try:
-            # 페이지 로드
+            # 페이지 로드 (첫 목록 항목이 나타날 때까지 대기)
             self.driver.get(section_url)
-            time.sleep(3)
-
-            # 더보기 버튼 클릭하여 추가 기사 로드
-            self.scroll_and_click_more(load_more_clicks)
+            try:
+                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, LIST_ITEM_SELECTOR)))
+            except TimeoutException:
+                logger.warning("  기사 목록이 로드되지 않았습니다.")
 
-            # 기사 목록 추출
-            articles = self.extract_article_list()
+            # 더보기로 목록을 늘리며 새 항목만 추출
+            articles = self.collect_article_list(max_articles, load_more_clicks)
 
             # 지정된 수만큼만 처리
             articles_to_process = articles[:max_articles]
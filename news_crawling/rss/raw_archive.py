@@ -0,0 +1,325 @@
+"""
+원문 HTML 아카이브
+
+크롤링한 기사 원문(HTML 응답)을 WARC 스타일의 gzip 압축 세그먼트에 추가 전용으로 저장하고,
+정규화된 URL과 수집 시각을 키로 하는 고정 길이 오프셋 인덱스를 함께 관리한다.
+
+- 레코드마다 독립된 gzip 멤버로 기록하므로 인덱스의 (세그먼트, 오프셋, 길이)만으로
+  한 번의 seek + read로 특정 페이지를 꺼낼 수 있다.
+- 세그먼트 파일은 gzip 멤버의 연속이므로 재추출 작업은 세그먼트 전체를 순차 스트리밍한다.
+
+사용 예:
+    archive = RawHTMLArchive("results/raw_archive")
+    archive.put(url, response.content, status=response.status_code, headers=response.headers)
+    record = archive.get(url)
+    for record in archive.iter_segment(1):
+        ...
+"""
+
+import gzip
+import hashlib
+import os
+import re
+import struct
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 인덱스 엔트리: url_key(8) + fetched_at(8) + segment(4) + offset(8) + length(4) = 32 bytes
+INDEX_ENTRY = struct.Struct("<QqIQI")
+
+# 정규화 시 제거하는 추적용 쿼리 파라미터
+TRACKING_PARAMS = {
+    "fbclid",
+    "gclid",
+    "ref",
+    "from",
+    "utm_source",
+    "utm_medium",
+    "utm_campaign",
+    "utm_term",
+    "utm_content",
+}
+
+DEFAULT_SEGMENT_SIZE = 256 * 1024 * 1024
+
+
+def canonicalize_url(url):
+    """URL 정규화 (스킴/호스트 소문자, 기본 포트·프래그먼트·추적 파라미터 제거, 쿼리 정렬)"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+
+    if parts.port and not ((scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    ]
+    query.sort()
+
+    path = parts.path or "/"
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def url_key(url):
+    """정규화 URL의 64비트 해시 키"""
+    digest = hashlib.sha1(canonicalize_url(url).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+class ArchiveRecord:
+    """아카이브에서 꺼낸 원문 레코드"""
+
+    __slots__ = ("url", "fetched_at", "status", "content_type", "body")
+
+    def __init__(self, url, fetched_at, status, content_type, body):
+        self.url = url
+        self.fetched_at = fetched_at
+        self.status = status
+        self.content_type = content_type
+        self.body = body
+
+    def text(self, encoding=None):
+        """본문을 문자열로 디코딩 (Content-Type의 charset 우선)"""
+        if encoding is None:
+            match = re.search(r"charset=([\w-]+)", self.content_type or "", re.IGNORECASE)
+            encoding = match.group(1) if match else "utf-8"
+        return self.body.decode(encoding, errors="replace")
+
+    def __repr__(self):
+        return f"ArchiveRecord({self.url!r}, fetched_at={self.fetched_at}, {len(self.body):,} bytes)"
+
+
+class RawHTMLArchive:
+    def __init__(self, base_dir="results/raw_archive", segment_size=DEFAULT_SEGMENT_SIZE):
+        self.base_dir = base_dir
+        self.segment_size = segment_size
+        self.index_path = os.path.join(base_dir, "index.bin")
+        self._lock = threading.Lock()
+
+        os.makedirs(base_dir, exist_ok=True)
+
+        # url_key -> [(fetched_at, segment, offset, length), ...] (수집 시각 순)
+        self.index = {}
+        self._load_index()
+
+        segments = self.list_segments()
+        self.current_segment = segments[-1] if segments else 1
+
+    def segment_path(self, segment):
+        return os.path.join(self.base_dir, f"segment-{segment:05d}.warc.gz")
+
+    def list_segments(self):
+        """존재하는 세그먼트 번호 목록"""
+        segments = []
+        for name in os.listdir(self.base_dir):
+            match = re.match(r"segment-(\d{5})\.warc\.gz$", name)
+            if match:
+                segments.append(int(match.group(1)))
+        return sorted(segments)
+
+    def _load_index(self):
+        """인덱스 파일 전체를 메모리로 로드 (엔트리당 32바이트)"""
+        if not os.path.exists(self.index_path):
+            return
+
+        with open(self.index_path, "rb") as f:
+            data = f.read()
+
+        # 기록 도중 중단된 마지막 불완전 엔트리는 무시
+        usable = len(data) - (len(data) % INDEX_ENTRY.size)
+        for key, fetched_at, segment, offset, length in INDEX_ENTRY.iter_unpack(data[:usable]):
+            self.index.setdefault(key, []).append((fetched_at, segment, offset, length))
+
+        for entries in self.index.values():
+            entries.sort()
+
+    def _encode_record(self, url, fetched_at, status, content_type, body):
+        """WARC 스타일 헤더 + 본문을 하나의 gzip 멤버로 인코딩"""
+        warc_date = datetime.fromtimestamp(fetched_at, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        header = (
+            "WARC/1.0\r\n"
+            "WARC-Type: response\r\n"
+            f"WARC-Target-URI: {url}\r\n"
+            f"WARC-Date: {warc_date}\r\n"
+            f"HTTP-Status: {status}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "\r\n"
+        ).encode("utf-8")
+        return gzip.compress(header + body + b"\r\n\r\n", compresslevel=6)
+
+    def put(self, url, body, status=200, headers=None, fetched_at=None):
+        """원문 응답 저장 후 (세그먼트, 오프셋) 반환"""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        if fetched_at is None:
+            fetched_at = int(time.time())
+
+        content_type = ""
+        if headers:
+            content_type = headers.get("Content-Type", "") or ""
+
+        canonical = canonicalize_url(url)
+        key = url_key(canonical)
+        member = self._encode_record(canonical, fetched_at, status, content_type, body)
+
+        with self._lock:
+            path = self.segment_path(self.current_segment)
+            if os.path.exists(path) and os.path.getsize(path) + len(member) > self.segment_size:
+                self.current_segment += 1
+                path = self.segment_path(self.current_segment)
+
+            # 세그먼트에 먼저 기록한 뒤 인덱스를 추가 (인덱스가 가리키는 레코드는 항상 완전함)
+            with open(path, "ab") as f:
+                offset = f.tell()
+                f.write(member)
+                f.flush()
+                os.fsync(f.fileno())
+
+            entry = (fetched_at, self.current_segment, offset, len(member))
+            with open(self.index_path, "ab") as f:
+                f.write(INDEX_ENTRY.pack(key, *entry))
+
+            entries = self.index.setdefault(key, [])
+            entries.append(entry)
+            if len(entries) > 1 and entries[-2][0] > fetched_at:
+                entries.sort()
+
+        return entry[1], offset
+
+    def _read_member(self, segment, offset, length):
+        with open(self.segment_path(segment), "rb") as f:
+            f.seek(offset)
+            return self._parse_record(gzip.decompress(f.read(length)))
+
+    @staticmethod
+    def _parse_record(raw):
+        header_end = raw.index(b"\r\n\r\n")
+        fields = {}
+        for line in raw[:header_end].decode("utf-8").split("\r\n")[1:]:
+            name, _, value = line.partition(":")
+            fields[name.strip()] = value.strip()
+
+        length = int(fields["Content-Length"])
+        body = raw[header_end + 4 : header_end + 4 + length]
+        fetched_at = int(
+            datetime.strptime(fields["WARC-Date"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc).timestamp()
+        )
+        return ArchiveRecord(
+            fields["WARC-Target-URI"],
+            fetched_at,
+            int(fields.get("HTTP-Status") or 0),
+            fields.get("Content-Type", ""),
+            body,
+        )
+
+    def get(self, url, fetched_at=None):
+        """URL의 원문 레코드 조회 (fetched_at 지정 시 그 시각 이전의 가장 최근 버전)"""
+        entries = self.index.get(url_key(url))
+        if not entries:
+            return None
+
+        if fetched_at is None:
+            entry = entries[-1]
+        else:
+            candidates = [e for e in entries if e[0] <= fetched_at]
+            if not candidates:
+                return None
+            entry = candidates[-1]
+
+        _, segment, offset, length = entry
+        return self._read_member(segment, offset, length)
+
+    def versions(self, url):
+        """URL의 저장된 수집 시각 목록"""
+        return [entry[0] for entry in self.index.get(url_key(url), [])]
+
+    def __contains__(self, url):
+        return url_key(url) in self.index
+
+    def __len__(self):
+        return sum(len(entries) for entries in self.index.values())
+
+    def iter_segment(self, segment, buffer_size=1024 * 1024):
+        """세그먼트의 모든 레코드를 순차 스트리밍 (인덱스 없이 파일 순서대로)"""
+        with open(self.segment_path(segment), "rb") as raw_file:
+            with gzip.GzipFile(fileobj=raw_file) as stream:
+                reader = stream if buffer_size is None else _BufferedLineReader(stream, buffer_size)
+                while True:
+                    header_lines = []
+                    while True:
+                        line = reader.readline()
+                        if not line:
+                            return
+                        if line == b"\r\n":
+                            break
+                        header_lines.append(line)
+
+                    fields = {}
+                    for line in header_lines[1:]:
+                        name, _, value = line.decode("utf-8").partition(":")
+                        fields[name.strip()] = value.strip()
+
+                    body = reader.read(int(fields["Content-Length"]))
+                    reader.read(4)  # 레코드 구분자 \r\n\r\n
+
+                    fetched_at = int(
+                        datetime.strptime(fields["WARC-Date"], "%Y-%m-%dT%H:%M:%SZ")
+                        .replace(tzinfo=timezone.utc)
+                        .timestamp()
+                    )
+                    yield ArchiveRecord(
+                        fields["WARC-Target-URI"],
+                        fetched_at,
+                        int(fields.get("HTTP-Status") or 0),
+                        fields.get("Content-Type", ""),
+                        body,
+                    )
+
+    def iter_all(self):
+        """전체 세그먼트를 순서대로 스트리밍 (일괄 재추출용)"""
+        for segment in self.list_segments():
+            yield from self.iter_segment(segment)
+
+
+class _BufferedLineReader:
+    """GzipFile 위에 큰 읽기 버퍼를 두어 순차 스트리밍 시 read 호출 횟수를 줄임"""
+
+    def __init__(self, stream, buffer_size):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.buffer = b""
+        self.pos = 0
+
+    def _fill(self):
+        chunk = self.stream.read(self.buffer_size)
+        if not chunk:
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def readline(self):
+        while True:
+            end = self.buffer.find(b"\n", self.pos)
+            if end != -1:
+                line = self.buffer[self.pos : end + 1]
+                self.pos = end + 1
+                return line
+            if not self._fill():
+                line = self.buffer[self.pos :]
+                self.pos = len(self.buffer)
+                return line
+
+    def read(self, size):
+        while len(self.buffer) - self.pos < size:
+            if not self._fill():
+                break
+        data = self.buffer[self.pos : self.pos + size]
+        self.pos += len(data)
+        return data
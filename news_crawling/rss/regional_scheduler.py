@@ -0,0 +1,325 @@
+"""
+지역 언론사 수집 스케줄러 (선거구 → 광역 → 언론사 예산 배분)
+
+지역지는 지금까지 모두 같은 주기/같은 기사 수로 수집했다. 추적 중인 22대 의원의 선거구와
+이행 중인 공약이 있는 지역을 기준으로 광역 단위 가중치를 매기고, 이를 해당 지역 언론사에 나눠
+수집 주기(하루 실행 횟수)와 실행당 기사 수를 다시 배분한다. 전체 하루 요청량은 기존 균등 배분
+(언론사마다 BASE_RUNS_PER_DAY회 × 현재 실행당 기사 수)을 넘지 않도록 맞춘다.
+
+    지역 가중치   = 추적 의원 수(선거구 광역 기준) + PLEDGE_WEIGHT × 미완료 공약 수
+    언론사 가중치 = Σ(담당 지역 가중치 / 그 지역 언론사 수)
+    하루 예산     = 최소 보장분(MIN_SHARE) + 나머지를 가중치 비례 배분
+
+실행당 기사 수를 조절할 수 있는 수집기(CRAWL_MAX_ARTICLES 환경 변수를 읽는 스크립트)는
+주기와 기사 수를 함께, 나머지는 주기만 조절한다. 실제 실행당 수집량은 실행 후 results의
+최신 CSV 행 수로 갱신해 다음 계획에 반영한다.
+
+사용 예:
+    python regional_scheduler.py plan     # 배분 결과만 출력
+    python regional_scheduler.py          # 계속 실행 (기한이 된 언론사 스크립트를 순서대로 실행)
+"""
+
+import glob
+import json
+import math
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BASE_DIR, "results")
+STATE_PATH = os.path.join(RESULTS_DIR, "regional_schedule.json")
+LAWMAKER_CSV = os.path.join(BASE_DIR, "..", "..", "국회의원", "22대국회의원현황.csv")
+TRACKED_PATH = os.path.join(BASE_DIR, "tracked_lawmakers.txt")
+PLEDGE_DB_PATH = os.path.join(BASE_DIR, "..", "..", "공약데이터", "pledge_monitor.sqlite3")
+
+BUDGET_ENV = "CRAWL_MAX_ARTICLES"
+BASE_RUNS_PER_DAY = 4  # 기존: 언론사마다 6시간 간격
+MIN_RUNS_PER_DAY = 1
+MAX_RUNS_PER_DAY = 24
+MIN_SHARE = 0.02  # 언론사당 최소 보장 비율
+MIN_PER_FEED = 5
+MAX_PER_FEED = 50
+PLEDGE_WEIGHT = 0.2
+RUN_TIMEOUT = 60 * 60
+
+# 선거구 앞부분 → 광역 ("세종특별자치시갑"처럼 띄어쓰기 없는 경우 포함)
+REGIONS = [
+    "서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종",
+    "경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주",
+]  # fmt: skip
+
+# 언론사 → 담당 광역
+#   feeds/per_feed: 실행당 기사 수 = 피드 수 × 피드당 기사 수 (adjustable이면 per_feed를 조절)
+#   per_run: 실행당 기사 수를 조절할 수 없는 수집기의 추정치 (실행 후 실제 값으로 갱신)
+REGIONAL_OUTLETS = {
+    "강원도민일보": {"regions": ["강원"], "feeds": 7, "per_feed": 20, "adjustable": True},
+    "경북일보": {"regions": ["경북"], "feeds": 6, "per_feed": 20, "adjustable": True},
+    "경상일보": {"regions": ["울산"], "feeds": 6, "per_feed": 20, "adjustable": True},
+    "경남매일일보": {"regions": ["경남"], "feeds": 4, "per_feed": 20, "adjustable": True},
+    "남도일보": {"regions": ["광주", "전남"], "feeds": 1, "per_feed": 20, "adjustable": True},
+    "매일신문": {"regions": ["대구", "경북"], "feeds": 7, "per_feed": 20, "adjustable": True},
+    "현대일보": {"regions": ["인천", "경기"], "feeds": 4, "per_feed": 20, "adjustable": True},
+    "대구신문": {"regions": ["대구"], "per_run": 140},
+    "제주일보": {"regions": ["제주"], "per_run": 50},
+    "제민일보": {"regions": ["제주"], "per_run": 100},
+    "충청투데이": {"regions": ["대전", "충남", "세종"], "per_run": 50},
+    "충청타임즈": {"regions": ["충북"], "per_run": 50},
+    "중부매일": {"regions": ["충북"], "per_run": 50},
+    "전북도민일보": {"regions": ["전북"], "per_run": 100},
+    "전라매일": {"regions": ["광주", "전남"], "per_run": 50},
+    "기호일보": {"regions": ["인천", "경기"], "per_run": 90},
+}
+
+# 공약 모니터 지자체 id → 광역
+PLEDGE_SOURCE_REGIONS = {"gyeonggi": "경기", "uijeongbu": "경기"}
+COMPLETED_STATUSES = ("완료", "이행완료")
+
+
+def district_region(district):
+    """선거구 → 광역 (비례대표/알 수 없으면 None)"""
+    if not isinstance(district, str):
+        return None
+    for region in REGIONS:
+        if district.startswith(region):
+            return region
+    return None
+
+
+def lawmaker_regions(csv_path=LAWMAKER_CSV, tracked=None):
+    """광역별 추적 의원 수 (tracked: 이름 목록, None이면 22대 전원)"""
+    if not os.path.exists(csv_path):
+        print(f"⚠️ 의원 명부 없음: {csv_path}")
+        return {}
+    lawmakers = pd.read_csv(csv_path, encoding="cp949", dtype=str, usecols=["이름", "선거구"])
+    if tracked:
+        lawmakers = lawmakers[lawmakers["이름"].isin(tracked)]
+    return lawmakers["선거구"].map(district_region).dropna().value_counts().to_dict()
+
+
+def load_tracked(path=TRACKED_PATH):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def pledge_regions(db_path=PLEDGE_DB_PATH):
+    """광역별 미완료 공약 수 (공약 모니터 DB 기준)"""
+    if not os.path.exists(db_path):
+        return {}
+    counts = {}
+    db = sqlite3.connect(db_path)
+    try:
+        placeholders = ",".join("?" * len(COMPLETED_STATUSES))
+        rows = db.execute(
+            f"""
+            SELECT source, COUNT(*) FROM entries
+            WHERE status IS NULL OR status NOT IN ({placeholders}) GROUP BY source
+            """,
+            COMPLETED_STATUSES,
+        )
+        for source, count in rows:
+            region = PLEDGE_SOURCE_REGIONS.get(source)
+            if region:
+                counts[region] = counts.get(region, 0) + count
+    except sqlite3.Error as e:
+        print(f"⚠️ 공약 DB 조회 실패: {e}")
+    finally:
+        db.close()
+    return counts
+
+
+def region_weights(lawmakers, pledges, pledge_weight=PLEDGE_WEIGHT):
+    return {region: lawmakers.get(region, 0) + pledge_weight * pledges.get(region, 0) for region in REGIONS}
+
+
+def _per_run(config, observed=None):
+    if observed:
+        return observed
+    if config.get("adjustable"):
+        return config["feeds"] * config["per_feed"]
+    return config["per_run"]
+
+
+def plan_budgets(weights, outlets=REGIONAL_OUTLETS, observed=None, base_runs=BASE_RUNS_PER_DAY):
+    """언론사별 {runs_per_day, interval, per_feed, per_run, daily, weight} (하루 총량은 기존 이하)"""
+    observed = observed or {}
+    outlets_per_region = {}
+    for config in outlets.values():
+        for region in config["regions"]:
+            outlets_per_region[region] = outlets_per_region.get(region, 0) + 1
+
+    outlet_weights = {
+        outlet: sum(weights.get(region, 0) / outlets_per_region[region] for region in config["regions"])
+        for outlet, config in outlets.items()
+    }
+    total_weight = sum(outlet_weights.values()) or 1.0
+    base_per_run = {outlet: _per_run(config, observed.get(outlet)) for outlet, config in outlets.items()}
+    baseline = sum(per_run * base_runs for per_run in base_per_run.values())
+    flexible = max(0.0, 1.0 - MIN_SHARE * len(outlets))
+
+    plan = {}
+    for outlet, config in outlets.items():
+        share = MIN_SHARE + flexible * outlet_weights[outlet] / total_weight
+        daily = baseline * share
+        ratio = daily / (base_per_run[outlet] * base_runs)
+
+        if config.get("adjustable"):
+            # 주기와 기사 수를 반씩 나눠 조절 (가중치가 높으면 더 자주, 조금 더 많이)
+            runs = round(base_runs * math.sqrt(ratio))
+            runs = min(MAX_RUNS_PER_DAY, max(MIN_RUNS_PER_DAY, runs))
+            per_feed = round(daily / (runs * config["feeds"]))
+            per_feed = min(MAX_PER_FEED, max(MIN_PER_FEED, per_feed))
+            per_run = per_feed * config["feeds"]
+        else:
+            runs = min(MAX_RUNS_PER_DAY, max(MIN_RUNS_PER_DAY, round(base_runs * ratio)))
+            per_feed = None
+            per_run = base_per_run[outlet]
+
+        plan[outlet] = {
+            "weight": round(outlet_weights[outlet], 2),
+            "runs_per_day": runs,
+            "per_feed": per_feed,
+            "per_run": per_run,
+        }
+
+    # 반올림/하한 때문에 기존 총량을 넘으면 가중치 대비 실행이 가장 많은 언론사부터 줄인다
+    def total():
+        return sum(entry["runs_per_day"] * entry["per_run"] for entry in plan.values())
+
+    while total() > baseline:
+        reducible = [outlet for outlet, entry in plan.items() if entry["runs_per_day"] > MIN_RUNS_PER_DAY]
+        if not reducible:
+            break
+        outlet = max(
+            reducible,
+            key=lambda o: plan[o]["runs_per_day"] * plan[o]["per_run"] / (outlet_weights[o] + 1e-9),
+        )
+        plan[outlet]["runs_per_day"] -= 1
+
+    for entry in plan.values():
+        entry["interval"] = int(24 * 3600 / entry["runs_per_day"])
+        entry["daily"] = entry["runs_per_day"] * entry["per_run"]
+    return plan, baseline
+
+
+class RegionalScheduler:
+    def __init__(self, outlets=REGIONAL_OUTLETS, state_path=STATE_PATH, results_dir=RESULTS_DIR, replan_every=6 * 3600):
+        self.outlets = outlets
+        self.state_path = state_path
+        self.results_dir = results_dir
+        self.replan_every = replan_every
+
+        self.state = {"last_run": {}, "observed": {}}
+        if os.path.exists(state_path):
+            with open(state_path, "r", encoding="utf-8") as f:
+                self.state.update(json.load(f))
+        self.plan = {}
+        self.planned_at = 0
+
+    def _save_state(self):
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def replan(self):
+        lawmakers = lawmaker_regions(tracked=load_tracked())
+        pledges = pledge_regions()
+        weights = region_weights(lawmakers, pledges)
+        self.plan, baseline = plan_budgets(weights, self.outlets, self.state["observed"])
+        self.planned_at = time.time()
+        return self.plan, baseline
+
+    def due(self, now=None):
+        """기한이 지난 언론사 (가장 오래 밀린 순)"""
+        now = now or time.time()
+        if not self.plan or now - self.planned_at >= self.replan_every:
+            self.replan()
+
+        overdue = []
+        for outlet, entry in self.plan.items():
+            last_run = self.state["last_run"].get(outlet, 0)
+            lateness = now - (last_run + entry["interval"])
+            if lateness >= 0:
+                overdue.append((lateness / entry["interval"], outlet))
+        return [outlet for _, outlet in sorted(overdue, reverse=True)]
+
+    def _latest_rows(self, outlet, since):
+        """실행 후 생성된 결과 CSV의 행 수 (실제 실행당 수집량)"""
+        paths = [p for p in glob.glob(os.path.join(self.results_dir, f"{outlet}*.csv")) if os.path.getmtime(p) >= since]
+        if not paths:
+            return None
+        try:
+            return len(pd.read_csv(max(paths, key=os.path.getmtime), encoding="utf-8-sig", usecols=[0]))
+        except Exception:
+            return None
+
+    def run_outlet(self, outlet):
+        entry = self.plan[outlet]
+        script = os.path.join(BASE_DIR, f"{outlet}.py")
+        env = dict(os.environ)
+        if entry["per_feed"] is not None:
+            env[BUDGET_ENV] = str(entry["per_feed"])
+
+        started = time.time()
+        print(f"🚀 [{outlet}] 수집 시작 (하루 {entry['runs_per_day']}회, 실행당 {entry['per_run']}건)")
+        try:
+            subprocess.run(
+                [sys.executable, script],
+                cwd=BASE_DIR,
+                env=env,
+                timeout=RUN_TIMEOUT,
+                stdout=subprocess.DEVNULL,
+                check=True,
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            print(f"❌ [{outlet}] 실행 실패: {e}")
+        finally:
+            self.state["last_run"][outlet] = started
+
+        rows = self._latest_rows(outlet, started)
+        if rows is not None and not self.outlets[outlet].get("adjustable"):
+            self.state["observed"][outlet] = rows
+        self._save_state()
+        print(f"✅ [{outlet}] 완료 ({time.time() - started:.0f}초, {rows if rows is not None else '?'}건)")
+
+    def run_forever(self, poll_interval=60):
+        while True:
+            for outlet in self.due():
+                self.run_outlet(outlet)
+            time.sleep(poll_interval)
+
+
+def print_plan(plan, baseline):
+    print(f"{'언론사':<10} {'가중치':>6} {'하루실행':>6} {'간격':>7} {'실행당':>6} {'하루':>6}")
+    for outlet, entry in sorted(plan.items(), key=lambda item: -item[1]["weight"]):
+        print(
+            f"{outlet:<10} {entry['weight']:>8.1f} {entry['runs_per_day']:>8} "
+            f"{entry['interval'] / 3600:>6.1f}h {entry['per_run']:>8} {entry['daily']:>7}"
+        )
+    planned = sum(entry["daily"] for entry in plan.values())
+    print(f"\n📊 하루 기사 요청: {planned}건 (기존 균등 배분 {baseline}건)")
+
+
+def main():
+    scheduler = RegionalScheduler()
+    plan, baseline = scheduler.replan()
+    print_plan(plan, baseline)
+
+    if sys.argv[1:2] == ["plan"]:
+        return
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        print("\n⚠️ 사용자에 의해 중단되었습니다.")
+
+
+if __name__ == "__main__":
+    main()
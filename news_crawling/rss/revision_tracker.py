@@ -0,0 +1,246 @@
+"""
+기사 수정 이력 추적
+
+언론사는 게재 후 기사를 자주 수정하는데, 공약 팩트체크에서는 이 수정 내용이 중요하다.
+정규화 URL마다 본문 해시와 ETag/Last-Modified, 실제 수집한 URL을 저장해 두고, 최근 기사만 점점 간격을
+늘려가며(변경이 없으면 2배, 변경되면 최소 간격으로 초기화) 조건부 요청으로 재확인한다.
+304 응답이면 본문을 받지 않고, 본문이 바뀐 경우에만 이전 본문 대비 압축 diff를 저장한다.
+
+사용 예:
+    tracker = RevisionTracker("results/revisions.sqlite3")
+    tracker.register(url, body, etag=response.headers.get("ETag"))
+    tracker.run_due(extract_body)   # extract_body(url, html) -> 본문 문자열
+"""
+
+import difflib
+import hashlib
+import re
+import sqlite3
+import time
+import zlib
+
+import requests
+
+from raw_archive import canonicalize_url
+
+MIN_INTERVAL = 30 * 60  # 최소 재확인 간격 30분
+MAX_INTERVAL = 7 * 24 * 3600  # 최대 재확인 간격 7일
+MAX_AGE = 30 * 24 * 3600  # 게재 후 30일이 지나면 추적 중단
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url TEXT PRIMARY KEY,
+    fetch_url TEXT,
+    content_hash TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    first_seen INTEGER NOT NULL,
+    last_checked INTEGER NOT NULL,
+    last_changed INTEGER NOT NULL,
+    check_interval INTEGER NOT NULL,
+    next_check INTEGER NOT NULL,
+    revision_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_articles_next_check ON articles (next_check);
+CREATE TABLE IF NOT EXISTS revisions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    detected_at INTEGER NOT NULL,
+    old_hash TEXT NOT NULL,
+    new_hash TEXT NOT NULL,
+    diff BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_revisions_url ON revisions (url);
+"""
+
+
+def content_hash(body):
+    """공백 차이를 무시한 본문 해시"""
+    normalized = re.sub(r"\s+", " ", body or "").strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def _sentences(body):
+    # 본문은 대부분 한 줄로 정리되어 있으므로 문장 단위로 나눠 diff
+    return [s for s in re.split(r"(?<=[.!?다])\s+", re.sub(r"\s+", " ", body or "").strip()) if s]
+
+
+def make_diff(old_body, new_body):
+    """문장 단위 unified diff (zlib 압축)"""
+    diff = difflib.unified_diff(_sentences(old_body), _sentences(new_body), lineterm="", n=1)
+    return zlib.compress("\n".join(diff).encode("utf-8"), 9)
+
+
+class RevisionTracker:
+    def __init__(
+        self,
+        db_path="results/revisions.sqlite3",
+        session=None,
+        min_interval=MIN_INTERVAL,
+        max_interval=MAX_INTERVAL,
+        max_age=MAX_AGE,
+        archive=None,
+    ):
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(SCHEMA)
+        self._migrate()
+        self.session = session or requests.Session()
+        self.session.headers.setdefault(
+            "User-Agent",
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        )
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_age = max_age
+        self.archive = archive
+
+    def _migrate(self):
+        """fetch_url 컬럼이 없는 이전 DB에 컬럼 추가 (기존 행은 정규화 URL로 재확인)"""
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(articles)")}
+        if "fetch_url" not in columns:
+            self.db.execute("ALTER TABLE articles ADD COLUMN fetch_url TEXT")
+            self.db.commit()
+
+    def register(self, url, body, etag=None, last_modified=None, seen_at=None):
+        """수집 직후 기사 등록 (이미 있으면 무시)"""
+        now = int(seen_at or time.time())
+        self.db.execute(
+            """
+            INSERT OR IGNORE INTO articles
+                (url, fetch_url, content_hash, body, etag, last_modified, first_seen, last_checked, last_changed,
+                 check_interval, next_check)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                canonicalize_url(url),
+                url,
+                content_hash(body),
+                zlib.compress((body or "").encode("utf-8")),
+                etag,
+                last_modified,
+                now,
+                now,
+                now,
+                self.min_interval,
+                now + self.min_interval,
+            ),
+        )
+        self.db.commit()
+
+    def due(self, now=None, limit=None):
+        """재확인 시점이 된 최근 기사 URL 목록 (수집 당시 URL)"""
+        now = int(now or time.time())
+        query = (
+            "SELECT COALESCE(fetch_url, url) FROM articles "
+            "WHERE next_check <= ? AND first_seen >= ? ORDER BY next_check"
+        )
+        params = [now, now - self.max_age]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [row[0] for row in self.db.execute(query, params)]
+
+    def _reschedule(self, url, now, interval, **changes):
+        columns = {"last_checked": now, "check_interval": interval, "next_check": now + interval, **changes}
+        assignments = ", ".join(f"{name} = ?" for name in columns)
+        self.db.execute(f"UPDATE articles SET {assignments} WHERE url = ?", (*columns.values(), url))
+
+    def recheck(self, url, extract_body, timeout=15):
+        """조건부 요청으로 기사 재확인 → "not_modified" / "unchanged" / "changed" / "error"
+
+        요청은 수집한 URL 그대로 보내고, 정규화 URL은 DB 키로만 사용한다.
+        """
+        key = canonicalize_url(url)
+        row = self.db.execute(
+            "SELECT content_hash, body, etag, last_modified, check_interval FROM articles WHERE url = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return "error"
+
+        old_hash, old_body, etag, last_modified, interval = row
+        now = int(time.time())
+        backoff = min(interval * 2, self.max_interval)
+
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=timeout)
+        except requests.RequestException as e:
+            print(f"⚠️ 재확인 요청 실패 ({url}): {e}")
+            self._reschedule(key, now, backoff)
+            self.db.commit()
+            return "error"
+
+        if response.status_code == 304:
+            self._reschedule(key, now, backoff)
+            self.db.commit()
+            return "not_modified"
+
+        if response.status_code != 200:
+            self._reschedule(key, now, backoff)
+            self.db.commit()
+            return "error"
+
+        if self.archive is not None:
+            self.archive.put(url, response.content, status=response.status_code, headers=response.headers)
+
+        new_etag = response.headers.get("ETag")
+        new_last_modified = response.headers.get("Last-Modified")
+        new_body = extract_body(url, response.text)
+        new_hash = content_hash(new_body)
+
+        if not new_body or new_hash == old_hash:
+            self._reschedule(key, now, backoff, etag=new_etag, last_modified=new_last_modified)
+            self.db.commit()
+            return "unchanged"
+
+        old_text = zlib.decompress(old_body).decode("utf-8")
+        self.db.execute(
+            "INSERT INTO revisions (url, detected_at, old_hash, new_hash, diff) VALUES (?, ?, ?, ?, ?)",
+            (key, now, old_hash, new_hash, make_diff(old_text, new_body)),
+        )
+        self._reschedule(
+            key,
+            now,
+            self.min_interval,
+            content_hash=new_hash,
+            body=zlib.compress(new_body.encode("utf-8")),
+            etag=new_etag,
+            last_modified=new_last_modified,
+            last_changed=now,
+        )
+        self.db.execute("UPDATE articles SET revision_count = revision_count + 1 WHERE url = ?", (key,))
+        self.db.commit()
+        print(f"✏️ 기사 수정 감지: {url}")
+        return "changed"
+
+    def run_due(self, extract_body, limit=200, delay=0.5):
+        """재확인 대상 기사를 순서대로 확인하고 결과 통계 반환"""
+        stats = {"not_modified": 0, "unchanged": 0, "changed": 0, "error": 0}
+        urls = self.due(limit=limit)
+        print(f"🔄 재확인 대상 기사: {len(urls)}개")
+
+        for url in urls:
+            stats[self.recheck(url, extract_body)] += 1
+            time.sleep(delay)
+
+        print(
+            f"📊 재확인 결과: 304 {stats['not_modified']}개, 동일 {stats['unchanged']}개, "
+            f"수정 {stats['changed']}개, 실패 {stats['error']}개"
+        )
+        return stats
+
+    def revisions(self, url):
+        """기사의 수정 이력 [(감지 시각, diff 문자열), ...]"""
+        rows = self.db.execute(
+            "SELECT detected_at, diff FROM revisions WHERE url = ? ORDER BY id", (canonicalize_url(url),)
+        )
+        return [(detected_at, zlib.decompress(diff).decode("utf-8")) for detected_at, diff in rows]
+
+    def close(self):
+        self.db.close()
@@ -17,6 +17,9 @@ import logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# 더보기로 늘어나는 기사 목록 항목
+LIST_ITEM_SELECTOR = "div.news_list"
+
 
 class YTNScraper:
     def __init__(self, headless=False):
@@ -56,93 +59,146 @@ class YTNScraper:
         if not os.path.exists("results"):
             os.makedirs("results")
 
+    def _list_count(self):
+        """현재 DOM의 기사 목록 항목 수"""
+        return self.driver.execute_script(f"return document.querySelectorAll('{LIST_ITEM_SELECTOR}').length;")
+
+    def _load_more(self, previous_count):
+        """더보기 한 번 실행 후 목록 항목이 실제로 늘어날 때까지 대기 (늘어나지 않으면 False)"""
+        try:
+            more_button = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "a.btn_white_arr_down")))
+        except TimeoutException:
+            logger.info("  더보기 버튼을 찾을 수 없습니다.")
+            return False
+
+        # 버튼이 보이는지 확인
+        if not more_button.is_displayed():
+            logger.info("  더 이상 로드할 기사가 없습니다.")
+            return False
+
+        # onclick 속성에서 함수 호출 추출하여 실행
+        onclick_attr = more_button.get_attribute("href") or ""
+        if "moreNews" in onclick_attr:
+            self.driver.execute_script(onclick_attr.replace("javascript:", ""))
+        else:
+            self.driver.execute_script("arguments[0].scrollIntoView(true); arguments[0].click();", more_button)
+
+        # 고정 대기 대신 새 항목이 붙는 시점까지만 대기 (서버 응답 시간만큼)
+        try:
+            self.wait.until(lambda driver: self._list_count() > previous_count)
+        except TimeoutException:
+            logger.info("  더보기 후 새 기사가 추가되지 않았습니다.")
+            return False
+        return True
+
     def click_more_button(self, max_clicks=10):
         """더보기 버튼 클릭하여 추가 기사 로드"""
         click_count = 0
 
         while click_count < max_clicks:
             try:
-                # 더보기 버튼 찾기
-                more_button = self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "a.btn_white_arr_down")))
-
-                # 버튼이 보이는지 확인
-                if not more_button.is_displayed():
-                    logger.info("  더 이상 로드할 기사가 없습니다.")
+                if not self._load_more(self._list_count()):
                     break
+                click_count += 1
+                logger.info(f"  더보기 버튼 클릭 {click_count}회")
 
-                # JavaScript로 클릭 실행
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", more_button)
-                time.sleep(1)
+            except Exception as e:
+                logger.error(f"  더보기 버튼 클릭 중 오류: {e}")
+                break
 
-                # onclick 속성에서 함수 호출 추출하여 실행
-                onclick_attr = more_button.get_attribute("href")
-                if "moreNews" in onclick_attr:
-                    self.driver.execute_script(onclick_attr.replace("javascript:", ""))
-                else:
-                    self.driver.execute_script("arguments[0].click();", more_button)
+        return click_count
 
-                click_count += 1
-                logger.info(f"  더보기 버튼 클릭 {click_count}회")
+    def collect_article_list(self, max_articles=30, max_clicks=10):
+        """기사 목록을 더보기로 늘려 가며 새로 붙은 항목만 파싱
 
-                # 새 콘텐츠 로딩 대기
-                time.sleep(3)
+        이미 파싱한 항목은 다시 읽지 않고, max_articles개가 모이면 더보기를 멈춘다.
+        """
+        articles = []
+        seen_urls = set()
+        parsed_count = 0
+        click_count = 0
 
-            except TimeoutException:
-                logger.info("  더보기 버튼을 찾을 수 없습니다.")
+        while True:
+            try:
+                items = self.driver.find_elements(By.CSS_SELECTOR, LIST_ITEM_SELECTOR)
+            except Exception as e:
+                logger.error(f"  기사 목록 추출 중 오류: {e}")
+                break
+
+            for article_info in self._parse_list_items(items[parsed_count:]):
+                if article_info["url"] not in seen_urls:
+                    seen_urls.add(article_info["url"])
+                    articles.append(article_info)
+            parsed_count = len(items)
+
+            if len(articles) >= max_articles or click_count >= max_clicks:
                 break
+            try:
+                if not self._load_more(parsed_count):
+                    break
             except Exception as e:
                 logger.error(f"  더보기 버튼 클릭 중 오류: {e}")
                 break
+            click_count += 1
+            logger.info(f"  더보기 버튼 클릭 {click_count}회 (목록 {self._list_count()}개)")
 
-        return click_count
+        logger.info(f"  총 {len(articles)}개의 기사 목록 추출 완료")
+        return articles
 
-    def extract_article_list(self):
-        """기사 목록 추출"""
+    def _parse_list_items(self, news_items):
+        """기사 목록 항목(div.news_list) → 기사 정보 리스트"""
         articles = []
 
-        try:
-            # 기사 목록 컨테이너 찾기
-            news_items = self.driver.find_elements(By.CSS_SELECTOR, "div.news_list")
+        for item in news_items:
+            try:
+                article_info = {}
+
+                # 제목과 링크
+                title_elem = item.find_element(By.CSS_SELECTOR, "div.title a")
+                article_info["title"] = title_elem.text.strip()
+                article_info["url"] = title_elem.get_attribute("href")
+
+                # URL이 없거나 잘못된 경우 스킵
+                if not article_info["url"] or "javascript" in article_info["url"]:
+                    continue
 
-            for item in news_items:
+                # 날짜/시간
                 try:
-                    article_info = {}
+                    date_elem = item.find_element(By.CSS_SELECTOR, "div.date")
+                    article_info["date"] = date_elem.text.strip()
+                except:
+                    article_info["date"] = ""
 
-                    # 제목과 링크
-                    title_elem = item.find_element(By.CSS_SELECTOR, "div.title a")
-                    article_info["title"] = title_elem.text.strip()
-                    article_info["url"] = title_elem.get_attribute("href")
+                # 요약 (숨겨진 content div)
+                try:
+                    content_elem = item.find_element(By.CSS_SELECTOR, "div.content")
+                    article_info["summary"] = content_elem.text.strip()
+                except:
+                    article_info["summary"] = ""
 
-                    # URL이 없거나 잘못된 경우 스킵
-                    if not article_info["url"] or "javascript" in article_info["url"]:
-                        continue
+                # 썸네일 이미지 URL (선택사항)
+                try:
+                    img_elem = item.find_element(By.CSS_SELECTOR, "div.photo img")
+                    article_info["thumbnail"] = img_elem.get_attribute("src")
+                except:
+                    article_info["thumbnail"] = ""
 
-                    # 날짜/시간
-                    try:
-                        date_elem = item.find_element(By.CSS_SELECTOR, "div.date")
-                        article_info["date"] = date_elem.text.strip()
-                    except:
-                        article_info["date"] = ""
+                articles.append(article_info)
 
-                    # 요약 (숨겨진 content div)
-                    try:
-                        content_elem = item.find_element(By.CSS_SELECTOR, "div.content")
-                        article_info["summary"] = content_elem.text.strip()
-                    except:
-                        article_info["summary"] = ""
+            except Exception as e:
+                logger.error(f"  기사 정보 추출 중 오류: {e}")
+                continue
 
-                    # 썸네일 이미지 URL (선택사항)
-                    try:
-                        img_elem = item.find_element(By.CSS_SELECTOR, "div.photo img")
-                        article_info["thumbnail"] = img_elem.get_attribute("src")
-                    except:
-                        article_info["thumbnail"] = ""
+        return articles
 
-                    articles.append(article_info)
+    def extract_article_list(self):
+        """기사 목록 추출"""
+        articles = []
 
-                except Exception as e:
-                    logger.error(f"  기사 정보 추출 중 오류: {e}")
-                    continue
+        try:
+            # 기사 목록 컨테이너 찾기
+            news_items = self.driver.find_elements(By.CSS_SELECTOR, LIST_ITEM_SELECTOR)
+            articles = self._parse_list_items(news_items)
 
             logger.info(f"  총 {len(articles)}개의 기사 목록 추출 완료")
             return articles
@@ -292,26 +348,18 @@ class YTNScraper:
         logger.info(f"{'='*50}")
 
         try:
-            # 페이지 로드
+            # 페이지 로드 (첫 목록 항목이 나타날 때까지 대기)
             self.driver.get(section_url)
-            time.sleep(3)
-
-            # 더보기 버튼 클릭하여 추가 기사 로드
-            self.click_more_button(load_more_clicks)
-
-            # 기사 목록 추출
-            articles = self.extract_article_list()
+            try:
+                self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, LIST_ITEM_SELECTOR)))
+            except TimeoutException:
+                logger.warning("  기사 목록이 로드되지 않았습니다.")
 
-            # 중복 제거
-            seen_urls = set()
-            unique_articles = []
-            for article in articles:
-                if article["url"] not in seen_urls:
-                    seen_urls.add(article["url"])
-                    unique_articles.append(article)
+            # 더보기로 목록을 늘리며 새 항목만 추출 (중복 제거 포함)
+            articles = self.collect_article_list(max_articles, load_more_clicks)
 
             # 지정된 수만큼만 처리
-            articles_to_process = unique_articles[:max_articles]
+            articles_to_process = articles[:max_articles]
 
             logger.info(f"{len(articles_to_process)}개 기사 상세 정보 수집 시작")
 
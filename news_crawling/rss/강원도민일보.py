@@ -295,7 +295,7 @@ if __name__ == "__main__":
     print("=" * 60)
 
     # 각 카테고리별로 20개씩 자동 수집
-    max_articles = 20
+    max_articles = int(os.environ.get("CRAWL_MAX_ARTICLES", 20))
     timestamp = datetime.now().strftime("%Y%m%d_%H%M")
 
     total_categories = len(kado_rss_options)
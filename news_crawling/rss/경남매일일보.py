@@ -5,6 +5,7 @@ import csv
 import re
 import time
 import random
+import os
 from datetime import datetime
 import logging
 
@@ -255,7 +256,7 @@ def main():
     print("전체기사, 뉴스 카테고리에서 각각 20개씩 수집을 시작합니다...")
 
     # 지정된 4개 카테고리에서 각각 20개씩 자동 수집
-    articles = collector.collect_all_categories(20)
+    articles = collector.collect_all_categories(int(os.environ.get("CRAWL_MAX_ARTICLES", 20)))
     collector.save_to_csv(articles)
 
     print(f"수집 완료: 총 {len(articles)}개 기사")
@@ -5,6 +5,7 @@ import csv
 import re
 import time
 import random
+import os
 from datetime import datetime
 import logging
 
@@ -261,7 +262,7 @@ def main():
     print("각 카테고리별 20개씩 수집을 시작합니다...")
 
     # 자동으로 지정된 카테고리들 수집
-    articles = collector.collect_all_categories(20)
+    articles = collector.collect_all_categories(int(os.environ.get("CRAWL_MAX_ARTICLES", 20)))
     collector.save_to_csv(articles)
 
     print(f"수집 완료: 총 {len(articles)}개 기사")
@@ -227,7 +227,7 @@ class NamdoTVRSSCollector:
 def main():
     collector = NamdoTVRSSCollector()
     # 실행 시 바로 전체기사 20건 수집 및 저장
-    articles = collector.collect_rss_data("전체기사", 20)
+    articles = collector.collect_rss_data("전체기사", int(os.environ.get("CRAWL_MAX_ARTICLES", 20)))
     collector.save_to_csv(articles)
     print(f"수집 완료: 총 {len(articles)}개 기사")
 
@@ -5,6 +5,7 @@ import csv
 import re
 import time
 import random
+import os
 from datetime import datetime
 import logging
 
@@ -253,7 +254,8 @@ class ImaeilRSSCollector:
 def main():
     collector = ImaeilRSSCollector()
     # 모든 카테고리에 대해 20개 기사씩 자동 수집
-    articles = collector.collect_all_categories(max_articles_per_category=20)
+    max_articles = int(os.environ.get("CRAWL_MAX_ARTICLES", 20))
+    articles = collector.collect_all_categories(max_articles_per_category=max_articles)
     collector.save_to_csv(articles)
     print(f"수집 완료: 총 {len(articles)}개 기사")
 
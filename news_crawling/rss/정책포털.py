@@ -315,6 +315,39 @@ class KoreaPolicyRSSCrawler:
         except Exception as e:
             self.logger.error(f"CSV 저장 오류: {e}")
 
+    def save_to_arrow(self, filename=None):
+        """Arrow IPC 파일로 저장 (CSV와 동일한 컬럼 매핑, 날짜는 timestamp 타입)"""
+        if not self.articles:
+            self.logger.warning("저장할 기사가 없습니다.")
+            return None
+
+        from arrow_handoff import write_arrow_file
+        from article_record import Article
+
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"results/정책포털_전체_{timestamp}.arrow"
+
+        records = [
+            Article(
+                outlet="정책포털",
+                title=art.get("title", ""),
+                published=art.get("pub_date", ""),
+                category=art.get("category", ""),
+                reporter="정책포털",
+                body=art.get("description", ""),
+                url=art.get("link", ""),
+            )
+            for art in self.articles
+        ]
+        try:
+            write_arrow_file(records, filename)
+            self.logger.info(f"Arrow 파일 저장 완료: {filename}")
+            return filename
+        except Exception as e:
+            self.logger.error(f"Arrow 저장 오류: {e}")
+            return None
+
     def print_statistics(self):
         """크롤링 통계 출력"""
         if not self.articles:
@@ -365,6 +398,12 @@ def main():
     # CSV 저장
     crawler.save_to_csv()
 
+    # 분석 작업 전달용 Arrow 파일
+    try:
+        crawler.save_to_arrow()
+    except ImportError:
+        print("⚠️ pyarrow가 설치되어 있지 않아 Arrow 파일 저장을 건너뜁니다.")
+
     print("\n크롤링이 완료되었습니다!")
 
 
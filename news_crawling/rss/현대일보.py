@@ -400,7 +400,7 @@ def main():
 
     print("\n🚀 전체 카테고리에서 각각 20개 수집을 시작합니다 (단일 CSV 저장)...")
 
-    max_articles = 20
+    max_articles = int(os.environ.get("CRAWL_MAX_ARTICLES", 20))
     timestamp = datetime.now().strftime("%Y%m%d_%H%M")
     output_file = f"results/{NEWS_OUTLET}_전체_{timestamp}.csv"
     out_dir = os.path.dirname(output_file)
@@ -0,0 +1,129 @@
+"""
+추가 전용 다운로드 진행 저널
+
+완료/실패한 항목마다 JSON 한 줄을 덧붙이므로 진행 상황 기록 비용이 파일당 O(1)이고,
+기록 도중 중단되어도 마지막 불완전한 줄만 버리면 그 직전까지의 상태가 정확히 복원된다.
+같은 키가 여러 번 기록되면 마지막 기록이 유효하며, 저널이 커지면 compact()로
+키별 최신 상태만 남긴 파일로 교체한다. (gyeonggi_policy, uijeongbu_policy, municipal_harvester 공용)
+
+완료 기록은 서버 파일이 바뀌어도 무효화되지 않는다. 변경 여부는 pdf_fetch의 매니페스트(ETag/Last-Modified)로
+확인하므로, 재확인할 때는 저널 대신 fetch_pdf_resumable(check_upstream=True)에 판단을 맡긴다.
+
+사용 예:
+    journal = DownloadJournal(os.path.join(base_path, ".download_journal.jsonl"))
+    if not journal.is_done(key):
+        ...
+        journal.mark_done(key, size=1234)
+    journal.close()
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import unquote
+
+
+def safe_filename(name):
+    """저장용 파일명 (경로/URL 인코딩 제거, 파일 시스템 금지 문자 치환)"""
+    return re.sub(r'[\\/:*?"<>|]', "_", os.path.basename(unquote(name))).strip() or "document.pdf"
+
+
+def document_key(category, filename):
+    """저널/매니페스트 키 "분류폴더/파일명" (지자체 스크립트와 municipal_harvester 공용)"""
+    return f"{category}/{safe_filename(filename)}"
+
+
+class DownloadJournal:
+    def __init__(self, path, fsync=True):
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+
+        # 키별 최신 기록
+        self.state = {}
+        self._lines = 0
+        self._replay()
+
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _replay(self):
+        """저널을 처음부터 읽어 상태 복원"""
+        if not os.path.exists(self.path):
+            return
+
+        valid_bytes = 0
+        with open(self.path, "rb") as f:
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # 기록 도중 중단된 마지막 줄
+                try:
+                    record = json.loads(raw)
+                except ValueError:
+                    break
+                self.state[record["key"]] = record
+                self._lines += 1
+                valid_bytes += len(raw)
+
+        # 불완전한 꼬리 제거 (이후 추가 기록이 깨진 줄 뒤에 붙지 않도록)
+        if valid_bytes != os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(valid_bytes)
+
+    def _append(self, record):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self.state[record["key"]] = record
+            self._lines += 1
+
+    def mark_done(self, key, **info):
+        self._append({"key": key, "status": "done", "ts": int(time.time()), **info})
+
+    def mark_failed(self, key, error=""):
+        self._append({"key": key, "status": "failed", "ts": int(time.time()), "error": str(error)[:200]})
+
+    def is_done(self, key):
+        record = self.state.get(key)
+        return record is not None and record["status"] == "done"
+
+    def completed(self, prefix=""):
+        """완료된 키 집합 (prefix로 섹션/카테고리 한정)"""
+        return {key for key, record in self.state.items() if record["status"] == "done" and key.startswith(prefix)}
+
+    def failed(self, prefix=""):
+        return {key for key, record in self.state.items() if record["status"] == "failed" and key.startswith(prefix)}
+
+    def compact(self, min_lines=100):
+        """키별 최신 기록만 남기도록 저널 재작성 (중복 기록이 절반을 넘을 때만)"""
+        with self._lock:
+            if self._lines < min_lines or self._lines < 2 * len(self.state):
+                return False
+
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for record in self.state.values():
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._file.close()
+            os.replace(tmp_path, self.path)
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._lines = len(self.state)
+            return True
+
+    def close(self):
+        self.compact()
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,6 +1,7 @@
 import time
 import os
 import requests
+import requests.adapters
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -9,12 +10,17 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from urllib.parse import unquote
+from urllib.parse import unquote, urljoin
+from bs4 import BeautifulSoup
 import re
 import json
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 
+from download_journal import DownloadJournal
+from pdf_fetch import DownloadManifest, HostRateLimiter, fetch_pdf_resumable
+from pledge_taxonomy import PledgeTaxonomy
+
 
 def setup_driver(download_path=None):
     """webdriver_manager로 Chrome 드라이버 자동 설정"""
@@ -42,48 +48,52 @@ def setup_driver(download_path=None):
     return driver
 
 
+SECTION_INFO = {
+    "01_더많은기회": {
+        "name": "더 많은 기회",
+        "range": (1, 49),
+        "description": "경제성장, 스타트업, 일자리 창출 관련 공약",
+    },
+    "02_주택교통일자리": {
+        "name": "주택, 교통, 일자리가 유쾌한 경기",
+        "range": (50, 91),
+        "description": "주거, 교통, 노동 관련 공약",
+    },
+    "03_문화예술여가": {
+        "name": "문화예술, 여가가 일상이 되는 경기",
+        "range": (92, 116),
+        "description": "문화, 예술, 스포츠, 관광 관련 공약",
+    },
+    "04_더고른기회": {
+        "name": "더 고른 기회",
+        "range": (117, 203),
+        "description": "복지, 돌봄, 의료, 교육 관련 공약",
+    },
+    "05_북부평화기회": {
+        "name": "북부에 변화와 평화의 기회를 만드는 경기",
+        "range": (204, 218),
+        "description": "경기북부 발전, 평화경제 관련 공약",
+    },
+    "06_더나은기회": {"name": "더 나은 기회", "range": (219, 270), "description": "행정혁신, 환경, 안전 관련 공약"},
+    "07_사회적가치": {
+        "name": "사회적 가치, 평등한 기회가 보장되는 경기",
+        "range": (271, 295),
+        "description": "사회적경제, 평등, 공정거래 관련 공약",
+    },
+}
+
+# 공약 번호 → 섹션 구간 인덱스 (구간 겹침/누락은 모듈 로드 시 검사)
+SECTION_TAXONOMY = PledgeTaxonomy.from_sections(SECTION_INFO, number_pattern=r"^(\d+)_")
+
+
 def create_section_folders(base_path):
     """섹션별 폴더 생성"""
 
-    section_info = {
-        "01_더많은기회": {
-            "name": "더 많은 기회",
-            "range": (1, 49),
-            "description": "경제성장, 스타트업, 일자리 창출 관련 공약",
-        },
-        "02_주택교통일자리": {
-            "name": "주택, 교통, 일자리가 유쾌한 경기",
-            "range": (50, 91),
-            "description": "주거, 교통, 노동 관련 공약",
-        },
-        "03_문화예술여가": {
-            "name": "문화예술, 여가가 일상이 되는 경기",
-            "range": (92, 116),
-            "description": "문화, 예술, 스포츠, 관광 관련 공약",
-        },
-        "04_더고른기회": {
-            "name": "더 고른 기회",
-            "range": (117, 203),
-            "description": "복지, 돌봄, 의료, 교육 관련 공약",
-        },
-        "05_북부평화기회": {
-            "name": "북부에 변화와 평화의 기회를 만드는 경기",
-            "range": (204, 218),
-            "description": "경기북부 발전, 평화경제 관련 공약",
-        },
-        "06_더나은기회": {"name": "더 나은 기회", "range": (219, 270), "description": "행정혁신, 환경, 안전 관련 공약"},
-        "07_사회적가치": {
-            "name": "사회적 가치, 평등한 기회가 보장되는 경기",
-            "range": (271, 295),
-            "description": "사회적경제, 평등, 공정거래 관련 공약",
-        },
-    }
-
     created_folders = {}
 
     print(f"📁 섹션별 폴더 생성: {base_path}")
 
-    for folder_key, info in section_info.items():
+    for folder_key, info in SECTION_INFO.items():
         folder_path = os.path.join(base_path, folder_key)
         os.makedirs(folder_path, exist_ok=True)
 
@@ -103,42 +113,17 @@ def create_section_folders(base_path):
 
 def determine_section_by_number(pdf_filename):
     """PDF 파일명에서 공약 번호를 추출하여 해당 섹션 결정"""
+    return SECTION_TAXONOMY.classify_filename(pdf_filename)
 
-    match = re.match(r"^(\d+)_", pdf_filename)
-    if not match:
-        return "00_미분류"
-
-    promise_num = int(match.group(1))
-
-    if 1 <= promise_num <= 49:
-        return "01_더많은기회"
-    elif 50 <= promise_num <= 91:
-        return "02_주택교통일자리"
-    elif 92 <= promise_num <= 116:
-        return "03_문화예술여가"
-    elif 117 <= promise_num <= 203:
-        return "04_더고른기회"
-    elif 204 <= promise_num <= 218:
-        return "05_북부평화기회"
-    elif 219 <= promise_num <= 270:
-        return "06_더나은기회"
-    elif 271 <= promise_num <= 295:
-        return "07_사회적가치"
-    else:
-        return "00_미분류"
 
+PROMISES_URL = "https://governor.gg.go.kr/promises/status/"
 
-def extract_and_categorize_pdfs(driver, base_path, section_folders):
-    """페이지에서 PDF URL을 추출하고 섹션별로 분류"""
+# 개별 공약 PDF가 아닌 문서 (공약실천계획서 전체본, 붙임 자료)
+EXCLUDED_PDF_KEYWORDS = ["공약실천계획서", "붙임2"]
 
-    print("🔍 페이지에서 PDF URL 추출 및 분류 중...")
-
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
-    driver.execute_script("window.scrollTo(0, 0);")
-    time.sleep(2)
 
-    viewer_links = driver.find_elements(By.XPATH, "//a[contains(@href, 'pdfjs/web/viewer.html')]")
+def categorize_pdf_links(viewer_hrefs, section_folders, page_url=PROMISES_URL):
+    """pdfjs 뷰어 링크 목록에서 PDF URL을 뽑아 섹션별로 분류"""
 
     categorized_pdfs = {}
 
@@ -146,23 +131,40 @@ def extract_and_categorize_pdfs(driver, base_path, section_folders):
         categorized_pdfs[section_key] = []
     categorized_pdfs["00_미분류"] = []
 
-    for link in viewer_links:
+    seen_urls = set()
+    pdf_entries = []
+
+    for href in viewer_hrefs:
         try:
-            href = link.get_attribute("href")
-            if "file=" in href:
+            if href and "file=" in href:
+                # pdf.js는 file 경로를 뷰어 URL 기준으로 해석
+                viewer_url = urljoin(page_url, href)
                 pdf_url = href.split("file=")[1]
-                pdf_url = unquote(pdf_url)
+                pdf_url = urljoin(viewer_url, unquote(pdf_url))
                 filename = pdf_url.split("/")[-1]
 
-                if not any(exclude in filename for exclude in ["공약실천계획서", "붙임2"]):
-                    section_key = determine_section_by_number(filename)
+                if pdf_url in seen_urls:
+                    continue
+                seen_urls.add(pdf_url)
 
-                    categorized_pdfs[section_key].append({"url": pdf_url, "filename": filename, "viewer_url": href})
+                if not any(exclude in filename for exclude in EXCLUDED_PDF_KEYWORDS):
+                    pdf_entries.append({"url": pdf_url, "filename": filename, "viewer_url": viewer_url})
 
         except Exception as e:
             print(f"⚠️ PDF 분류 중 오류: {e}")
             continue
 
+    # 섹션 분류는 한 번에
+    section_keys = SECTION_TAXONOMY.classify_many(entry["filename"] for entry in pdf_entries)
+    for section_key, entry in zip(section_keys, pdf_entries):
+        categorized_pdfs.setdefault(section_key, []).append(entry)
+
+    return categorized_pdfs
+
+
+def save_categorized_pdfs(categorized_pdfs, base_path, section_folders):
+    """분류 결과를 JSON으로 백업하고 섹션별 통계 출력"""
+
     # 결과를 JSON으로 저장 (중단 시 재시작 가능)
     urls_backup_path = os.path.join(base_path, "pdf_urls_backup.json")
     with open(urls_backup_path, "w", encoding="utf-8") as f:
@@ -180,50 +182,113 @@ def extract_and_categorize_pdfs(driver, base_path, section_folders):
 
     print(f"🎯 총 {total_pdfs}개의 개별 공약 PDF 발견")
 
+    return total_pdfs
+
+
+def discover_pdfs_static(base_path, section_folders, url=PROMISES_URL, session=None):
+    """브라우저 없이 정적 HTML을 직접 받아 PDF 링크 추출 (찾지 못하면 None)"""
+
+    print(f"🔍 정적 HTML에서 PDF 링크 탐색 중: {url}")
+
+    session = session or requests.Session()
+    try:
+        response = session.get(url, headers={"User-Agent": DOWNLOAD_HEADERS["User-Agent"]}, timeout=20)
+        response.raise_for_status()
+    except Exception as e:
+        print(f"⚠️ 정적 페이지 요청 실패: {e}")
+        return None
+
+    soup = BeautifulSoup(response.content, "html.parser")
+    viewer_hrefs = [a["href"] for a in soup.select("a[href*='pdfjs/web/viewer.html']")]
+
+    # 앵커 밖(스크립트, data 속성 등)에 들어 있는 뷰어 경로도 탐색
+    if not viewer_hrefs:
+        viewer_hrefs = re.findall(r"[^\s\"'<>]*pdfjs/web/viewer\.html\?file=[^\s\"'<>]+", response.text)
+
+    categorized_pdfs = categorize_pdf_links(viewer_hrefs, section_folders, page_url=response.url)
+
+    if not any(categorized_pdfs.values()):
+        print("⚠️ 정적 HTML에서 PDF 링크를 찾지 못했습니다.")
+        return None
+
+    save_categorized_pdfs(categorized_pdfs, base_path, section_folders)
     return categorized_pdfs
 
 
-def download_single_pdf(pdf_info, section_path, max_retries=5):
-    """단일 PDF 다운로드 (재시도 로직 포함)"""
+def extract_and_categorize_pdfs(driver, base_path, section_folders):
+    """페이지에서 PDF URL을 추출하고 섹션별로 분류 (Selenium, 정적 탐색 실패 시 사용)"""
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Referer": "https://governor.gg.go.kr/",
-        "Accept": "application/pdf,application/octet-stream,*/*",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-    }
+    print("🔍 페이지에서 PDF URL 추출 및 분류 중...")
 
-    for attempt in range(max_retries):
-        try:
-            session = requests.Session()
-            session.headers.update(headers)
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+    time.sleep(3)
+    driver.execute_script("window.scrollTo(0, 0);")
+    time.sleep(2)
 
-            # 점진적 타임아웃 증가
-            timeout = 30 + (attempt * 15)
+    viewer_links = driver.find_elements(By.XPATH, "//a[contains(@href, 'pdfjs/web/viewer.html')]")
 
-            response = session.get(pdf_info["url"], stream=True, timeout=timeout, allow_redirects=True)
+    categorized_pdfs = categorize_pdf_links(
+        [link.get_attribute("href") for link in viewer_links], section_folders, page_url=driver.current_url
+    )
+    save_categorized_pdfs(categorized_pdfs, base_path, section_folders)
 
-            if response.status_code == 200:
-                file_path = os.path.join(section_path, pdf_info["filename"])
+    return categorized_pdfs
 
-                with open(file_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
 
-                file_size = os.path.getsize(file_path)
+DOWNLOAD_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Referer": "https://governor.gg.go.kr/",
+    "Accept": "application/pdf,application/octet-stream,*/*",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
 
-                # 파일 크기 검증 (너무 작으면 오류)
-                if file_size < 1000:  # 1KB 이하면 비정상
-                    os.remove(file_path)
-                    raise Exception(f"파일 크기가 너무 작음: {file_size} bytes")
 
-                return {"success": True, "filename": pdf_info["filename"], "size": file_size, "attempts": attempt + 1}
+def create_download_session(pool_size=8):
+    """keep-alive 연결 풀을 공유하는 다운로드 세션 생성 (TLS/연결 설정 재사용)"""
+    session = requests.Session()
+    session.headers.update(DOWNLOAD_HEADERS)
 
-            else:
-                raise Exception(f"HTTP {response.status_code}")
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def download_single_pdf(
+    pdf_info, section_path, max_retries=5, session=None, rate_limiter=None, manifest=None, check_upstream=False
+):
+    """단일 PDF 다운로드 (재시도 로직 포함, 실패 시 받은 부분부터 이어받기)"""
+
+    if session is None:
+        session = create_download_session(pool_size=1)
+
+    file_path = os.path.join(section_path, pdf_info["filename"])
+    manifest_key = f"{os.path.basename(section_path)}/{pdf_info['filename']}"
+
+    for attempt in range(max_retries):
+        try:
+            result = fetch_pdf_resumable(
+                session,
+                pdf_info["url"],
+                file_path,
+                manifest=manifest,
+                key=manifest_key,
+                check_upstream=check_upstream,
+                rate_limiter=rate_limiter,
+            )
+
+            if result["resumed_from"]:
+                print(f"      ↪️ {result['resumed_from']:,} bytes부터 이어받기 완료")
+
+            return {
+                "success": True,
+                "filename": pdf_info["filename"],
+                "size": result["size"],
+                "attempts": attempt + 1,
+                "skipped": result["skipped"],
+            }
 
         except Exception as e:
             error_msg = str(e)
@@ -244,13 +309,33 @@ def download_single_pdf(pdf_info, section_path, max_retries=5):
     }
 
 
-def download_categorized_pdfs_with_retry(categorized_pdfs, section_folders, base_path):
+def completed_section_files(journal, manifest, section_key, section_path, check_upstream=False):
+    """저널에 완료로 기록되고 파일도 매니페스트 검증을 통과한 파일명 집합
+
+    삭제/손상된 파일은 다시 받고, check_upstream=True면 서버 변경 여부를 조건부 요청으로 확인하도록
+    저널 기록을 건너뛰지 않는다.
+    """
+    if check_upstream:
+        return set()
+
+    completed = set()
+    for key in journal.completed(f"{section_key}/"):
+        filename = key.split("/", 1)[1]
+        if manifest.is_verified(key, os.path.join(section_path, filename)):
+            completed.add(filename)
+    return completed
+
+
+def download_categorized_pdfs_with_retry(categorized_pdfs, section_folders, base_path, check_upstream=False):
     """개선된 다운로드 함수 (재시도 + 병렬 처리)"""
 
     print("📥 섹션별 PDF 다운로드 시작 (재시도 로직 적용)")
     print("=" * 60)
 
     download_results = {}
+    session = create_download_session(pool_size=1)
+    manifest = DownloadManifest(os.path.join(base_path, "download_manifest.json"))
+    journal = DownloadJournal(os.path.join(base_path, ".download_journal.jsonl"))
 
     for section_key, pdfs in categorized_pdfs.items():
         if not pdfs:
@@ -270,19 +355,10 @@ def download_categorized_pdfs_with_retry(categorized_pdfs, section_folders, base
         success_count = 0
         failed_files = []
 
-        # 진행 상황 저장을 위한 파일
-        progress_file = os.path.join(section_path, ".download_progress.json")
-        completed_files = set()
-
-        # 기존 진행 상황 로드
-        if os.path.exists(progress_file):
-            try:
-                with open(progress_file, "r", encoding="utf-8") as f:
-                    progress_data = json.load(f)
-                    completed_files = set(progress_data.get("completed", []))
-                print(f"  📋 이미 완료된 파일: {len(completed_files)}개")
-            except:
-                pass
+        # 저널에서 기존 진행 상황 복원
+        completed_files = completed_section_files(journal, manifest, section_key, section_path, check_upstream)
+        if completed_files:
+            print(f"  📋 이미 완료된 파일: {len(completed_files)}개")
 
         # 남은 파일들만 다운로드
         remaining_pdfs = [pdf for pdf in pdfs if pdf["filename"] not in completed_files]
@@ -298,36 +374,138 @@ def download_categorized_pdfs_with_retry(categorized_pdfs, section_folders, base
         for i, pdf_info in enumerate(remaining_pdfs, 1):
             print(f"  📥 {i:2d}/{len(remaining_pdfs)} {pdf_info['filename']}")
 
-            result = download_single_pdf(pdf_info, section_path)
+            result = download_single_pdf(
+                pdf_info, section_path, session=session, manifest=manifest, check_upstream=check_upstream
+            )
+
+            journal_key = f"{section_key}/{pdf_info['filename']}"
+
+            if result["success"] and result["skipped"]:
+                print(f"      ⏭️ 검증된 파일, 건너뜀 ({result['size']:,} bytes)")
+                success_count += 1
+                completed_files.add(pdf_info["filename"])
+                journal.mark_done(journal_key, size=result["size"])
+                continue
 
             if result["success"]:
                 print(f"      ✅ 완료 ({result['size']:,} bytes, {result['attempts']}회 시도)")
                 success_count += 1
                 completed_files.add(pdf_info["filename"])
-
-                # 진행 상황 저장
-                progress_data = {"completed": list(completed_files)}
-                with open(progress_file, "w", encoding="utf-8") as f:
-                    json.dump(progress_data, f, ensure_ascii=False, indent=2)
+                journal.mark_done(journal_key, size=result["size"])
 
             else:
                 print(f"      ❌ 실패: {result['error'][:50]}... ({result['attempts']}회 시도)")
                 failed_files.append(pdf_info["filename"])
+                journal.mark_failed(journal_key, result["error"])
 
             # 서버 부하 방지를 위한 대기
             time.sleep(1)
 
-        # 완료 후 진행 상황 파일 삭제
-        if os.path.exists(progress_file):
-            os.remove(progress_file)
-
         total_success = len(completed_files)
         download_results[section_key] = {"success": total_success, "failed": failed_files, "total": len(pdfs)}
+        manifest.save()
 
         print(f"  📊 {section_name}: {total_success}/{len(pdfs)} 성공")
         if failed_files:
             print(f"      ❌ 실패한 파일: {len(failed_files)}개")
 
+    session.close()
+    journal.close()
+    return download_results
+
+
+def download_categorized_pdfs_concurrent(
+    categorized_pdfs, section_folders, base_path, max_workers=4, min_interval=0.25, check_upstream=False
+):
+    """동시 다운로드 (공유 연결 풀 + 호스트별 요청 간격 제한)"""
+
+    print(f"📥 섹션별 PDF 동시 다운로드 시작 (동시 {max_workers}개, 요청 간격 {min_interval}초)")
+    print("=" * 60)
+
+    session = create_download_session(pool_size=max_workers)
+    rate_limiter = HostRateLimiter(min_interval=min_interval)
+    manifest = DownloadManifest(os.path.join(base_path, "download_manifest.json"))
+    journal = DownloadJournal(os.path.join(base_path, ".download_journal.jsonl"))
+    progress_lock = threading.Lock()
+
+    download_results = {}
+    section_states = {}
+    tasks = []
+
+    for section_key, pdfs in categorized_pdfs.items():
+        if not pdfs:
+            continue
+
+        if section_key == "00_미분류":
+            section_path = os.path.join(base_path, "00_미분류")
+            os.makedirs(section_path, exist_ok=True)
+        else:
+            section_path = section_folders[section_key]["path"]
+
+        # 저널에서 기존 진행 상황 복원
+        completed_files = completed_section_files(journal, manifest, section_key, section_path, check_upstream)
+
+        section_states[section_key] = {
+            "path": section_path,
+            "completed": completed_files,
+            "failed": [],
+            "total": len(pdfs),
+        }
+
+        for pdf_info in pdfs:
+            if pdf_info["filename"] not in completed_files:
+                tasks.append((section_key, pdf_info))
+
+    print(f"  📥 다운로드할 파일: {len(tasks)}개")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                download_single_pdf,
+                pdf_info,
+                section_states[section_key]["path"],
+                session=session,
+                rate_limiter=rate_limiter,
+                manifest=manifest,
+                check_upstream=check_upstream,
+            ): (section_key, pdf_info)
+            for section_key, pdf_info in tasks
+        }
+
+        for done, future in enumerate(as_completed(futures), 1):
+            section_key, pdf_info = futures[future]
+            state = section_states[section_key]
+            result = future.result()
+            journal_key = f"{section_key}/{pdf_info['filename']}"
+
+            with progress_lock:
+                if result["success"]:
+                    status = "검증된 파일, 건너뜀" if result["skipped"] else f"{result['attempts']}회 시도"
+                    print(
+                        f"  ✅ {done:3d}/{len(tasks)} [{section_key}] {pdf_info['filename']} "
+                        f"({result['size']:,} bytes, {status})"
+                    )
+                    state["completed"].add(pdf_info["filename"])
+                    journal.mark_done(journal_key, size=result["size"])
+                else:
+                    print(f"  ❌ {done:3d}/{len(tasks)} [{section_key}] {pdf_info['filename']}: {result['error'][:50]}")
+                    state["failed"].append(pdf_info["filename"])
+                    journal.mark_failed(journal_key, result["error"])
+
+    session.close()
+    manifest.save()
+    journal.close()
+
+    for section_key, state in section_states.items():
+        download_results[section_key] = {
+            "success": len(state["completed"]),
+            "failed": state["failed"],
+            "total": state["total"],
+        }
+
+        section_name = section_folders.get(section_key, {}).get("info", {}).get("name", "미분류")
+        print(f"  📊 {section_name}: {len(state['completed'])}/{state['total']} 성공")
+
     return download_results
 
 
@@ -413,8 +591,12 @@ def main():
             with open(urls_backup_path, "r", encoding="utf-8") as f:
                 categorized_pdfs = json.load(f)
 
+            check_upstream = input("서버 변경 여부도 재확인하시겠습니까? (y/n, 기본값: n): ").strip().lower()
+
             section_folders = create_section_folders(base_path)
-            download_results = download_categorized_pdfs_with_retry(categorized_pdfs, section_folders, base_path)
+            download_results = download_categorized_pdfs_concurrent(
+                categorized_pdfs, section_folders, base_path, check_upstream=check_upstream == "y"
+            )
 
             # 재시도 스크립트 생성
             create_retry_script(download_results, base_path)
@@ -424,23 +606,28 @@ def main():
 
     # 새로 시작
     section_folders = create_section_folders(base_path)
-
-    print("\n🔧 ChromeDriver 설정 중...")
-    driver = setup_driver(base_path)
+    driver = None
 
     try:
-        url = "https://governor.gg.go.kr/promises/status/"
-        print(f"🌐 페이지 접속: {url}")
+        # 정적 HTML에서 먼저 탐색하고, 찾지 못한 경우에만 브라우저 사용
+        categorized_pdfs = discover_pdfs_static(base_path, section_folders)
+
+        if categorized_pdfs is None:
+            print("\n🔧 ChromeDriver 설정 중...")
+            driver = setup_driver(base_path)
 
-        driver.get(url)
-        time.sleep(5)
+            print(f"🌐 페이지 접속: {PROMISES_URL}")
 
-        categorized_pdfs = extract_and_categorize_pdfs(driver, base_path, section_folders)
+            driver.get(PROMISES_URL)
+            time.sleep(5)
 
-        driver.quit()
-        print("🔚 브라우저 종료")
+            categorized_pdfs = extract_and_categorize_pdfs(driver, base_path, section_folders)
+
+            driver.quit()
+            driver = None
+            print("🔚 브라우저 종료")
 
-        download_results = download_categorized_pdfs_with_retry(categorized_pdfs, section_folders, base_path)
+        download_results = download_categorized_pdfs_concurrent(categorized_pdfs, section_folders, base_path)
 
         # 재시도 스크립트 생성
         create_retry_script(download_results, base_path)
@@ -474,7 +661,7 @@ def main():
 
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
-        if "driver" in locals():
+        if driver:
             driver.quit()
 
 
@@ -0,0 +1,447 @@
+"""
+설정 기반 지자체 공약 문서 수집기
+
+지자체마다 Selenium 스크립트와 분류 체계를 새로 짜는 대신, 지자체 하나를 설정 항목 하나로 기술한다.
+
+    {
+        "id": "gyeonggi",
+        "name": "경기도",
+        "url": "https://governor.gg.go.kr/promises/status/",   # 공약 목록 페이지
+        "folder": "gyeonggi_policies",                          # 저장 폴더 (기존 스크립트와 공유)
+        "link": {"type": "pdfjs_viewer"},                       # 링크 추출 방식 (아래 참고)
+        "number_pattern": r"^(\\d+)_",                          # 파일명에서 공약 번호 추출
+        "categories": [[1, 49, "01_더많은기회"], ...],          # 번호 구간 → 분류 폴더 (겹침/누락 검사)
+        "allow_gaps": False,                                    # 구간 사이 빈 번호 허용 여부
+        "exclude": ["공약실천계획서"],                          # 파일명에 포함되면 제외
+        "headers": {"Referer": "https://governor.gg.go.kr/"},
+        "max_per_host": 2,                                      # 호스트별 동시 다운로드 수
+    }
+
+링크 추출 방식:
+    pdfjs_viewer : <a href=".../pdfjs/web/viewer.html?file=...">의 file 파라미터
+    href         : pattern 정규식에 맞는 <a href> (기본값: .pdf로 끝나는 링크)
+    onclick      : onclick="goFile('a.pdf', '/path')" 형태 — function(함수명)의 JS 정의를 분석하거나
+                   endpoint({"url", "method", "params": {파라미터명: 인자 위치}})를 직접 지정
+    gofile_context : 정책목표 제목 아래 goFile 링크가 나열된 의정부시 페이지 — 파일명 번호 대신
+                   uijeongbu_policy의 문맥 분류(classify_gofile_links)를 그대로 써서
+                   uijeongbu_policy와 같은 분류 폴더/저널 키를 만든다
+
+여러 지자체를 동시에 수집하되 호스트별 동시 연결 수와 요청 간격을 제한하고, 다운로드/재시도/저널/매니페스트
+처리는 gyeonggi_policy, uijeongbu_policy와 같은 모듈(pdf_fetch, download_journal)을 사용한다.
+
+사용 예:
+    python municipal_harvester.py                   # 등록된 모든 지자체
+    python municipal_harvester.py gyeonggi          # 일부만
+    python municipal_harvester.py --check-upstream  # 완료된 문서도 서버 변경 여부 재확인
+    (현재 폴더에 municipalities.json이 있으면 항목을 추가/덮어씀)
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import unquote, urljoin, urlparse
+
+import requests
+from bs4 import BeautifulSoup
+
+from download_journal import DownloadJournal, document_key, safe_filename
+from pdf_fetch import DownloadManifest, HostRateLimiter, fetch_pdf_resumable, looks_like_pdf
+from pledge_taxonomy import get_taxonomy
+from uijeongbu_policy import CATEGORIES as UIJEONGBU_CATEGORIES
+from uijeongbu_policy import build_endpoint_request, classify_gofile_links, resolve_js_download_endpoint
+
+# 링크가 속한 목록 항목으로 볼 상위 요소
+ENTRY_CONTAINERS = ["tr", "li", "dd", "article"]
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+MUNICIPALITIES = [
+    {
+        "id": "gyeonggi",
+        "name": "경기도",
+        "url": "https://governor.gg.go.kr/promises/status/",
+        "folder": "gyeonggi_policies",
+        "link": {"type": "pdfjs_viewer"},
+        "number_pattern": r"^(\d+)_",
+        "categories": [
+            [1, 49, "01_더많은기회"],
+            [50, 91, "02_주택교통일자리"],
+            [92, 116, "03_문화예술여가"],
+            [117, 203, "04_더고른기회"],
+            [204, 218, "05_북부평화기회"],
+            [219, 270, "06_더나은기회"],
+            [271, 295, "07_사회적가치"],
+        ],
+        "exclude": ["공약실천계획서", "붙임2"],
+        "headers": {"Referer": "https://governor.gg.go.kr/"},
+    },
+    {
+        "id": "uijeongbu",
+        "name": "의정부시",
+        "url": "https://www.ui4u.go.kr/mayor/contents.do?mId=0203020300",
+        "folder": "uijeongbu_policies",
+        "link": {"type": "gofile_context"},
+        # 분류는 링크 주변 정책목표 제목으로 하며, 구간 표는 파일명 분류(classify_filename)용
+        "categories": [[int(number), int(number), folder] for number, folder in UIJEONGBU_CATEGORIES.items()],
+    },
+]
+
+
+def load_municipalities(config_path="municipalities.json"):
+    """기본 설정 + 설정 파일 항목 (같은 id면 설정 파일 우선)"""
+    entries = {entry["id"]: entry for entry in MUNICIPALITIES}
+
+    if config_path and os.path.exists(config_path):
+        with open(config_path, "r", encoding="utf-8") as f:
+            for entry in json.load(f):
+                entries[entry["id"]] = entry
+        print(f"📋 설정 파일 로드: {config_path}")
+
+    return list(entries.values())
+
+
+# ----------------------------------------------------------------------
+# 분류
+# ----------------------------------------------------------------------
+def classify_filename(municipality, filename):
+    """파일명의 공약 번호로 분류 폴더 결정"""
+    return get_taxonomy(municipality).classify_filename(filename)
+
+
+# ----------------------------------------------------------------------
+# 링크 추출
+# ----------------------------------------------------------------------
+def _entry_text(element):
+    """링크가 속한 목록 항목(표 행, 목록 항목)의 텍스트 (공약명, 이행 상태 등)"""
+    container = element.find_parent(ENTRY_CONTAINERS) or element.parent
+    return " ".join(container.get_text(" ").split()) if container else ""
+
+
+def _links_pdfjs_viewer(municipality, soup, html, page_url, session):
+    anchors = [(a["href"], a) for a in soup.select("a[href*='viewer.html']")]
+    if not anchors:
+        anchors = [(href, None) for href in re.findall(r"[^\s\"'<>]*viewer\.html\?file=[^\s\"'<>]+", html)]
+
+    for href, a in anchors:
+        if "file=" not in href:
+            continue
+        viewer_url = urljoin(page_url, href)
+        pdf_url = urljoin(viewer_url, unquote(href.split("file=")[1]))
+        yield {"url": pdf_url, "filename": pdf_url.split("/")[-1], "entry": _entry_text(a) if a else ""}
+
+
+def _links_href(municipality, soup, html, page_url, session):
+    pattern = re.compile(municipality["link"].get("pattern", r"\.pdf(?:$|\?)"), re.I)
+    for a in soup.find_all("a", href=True):
+        if pattern.search(a["href"]):
+            url = urljoin(page_url, a["href"])
+            yield {"url": url, "filename": urlparse(url).path.split("/")[-1], "entry": _entry_text(a)}
+
+
+def _links_onclick(municipality, soup, html, page_url, session):
+    function_name = municipality["link"].get("function", "goFile")
+    endpoint = municipality["link"].get("endpoint") or resolve_js_download_endpoint(
+        html, page_url, session, function_name
+    )
+    if not endpoint:
+        print(f"⚠️ [{municipality['name']}] {function_name} 요청 형식을 찾지 못했습니다. (link.endpoint로 지정 가능)")
+        return
+
+    call_pattern = re.compile(rf"{re.escape(function_name)}\(([^)]*)\)")
+    for a in soup.find_all(onclick=call_pattern):
+        call = call_pattern.search(a["onclick"])
+        args = re.findall(r"'([^']*)'|\"([^\"]*)\"", call.group(1))
+        args = [single or double for single, double in args]
+        if not args:
+            continue
+        url, data = build_endpoint_request(endpoint, args)
+        yield {"url": url, "data": data, "filename": args[0], "entry": _entry_text(a)}
+
+
+def _links_gofile_context(municipality, soup, html, page_url, session):
+    endpoint = municipality["link"].get("endpoint") or resolve_js_download_endpoint(html, page_url, session, "goFile")
+    if not endpoint:
+        print(f"⚠️ [{municipality['name']}] goFile 요청 형식을 찾지 못했습니다. (link.endpoint로 지정 가능)")
+        return
+
+    for info in classify_gofile_links(soup):
+        url, data = build_endpoint_request(endpoint, info["gofile_args"])
+        yield {
+            "url": url,
+            "data": data,
+            "filename": info["filename"],
+            "category": info["category"],
+            "entry": _entry_text(info["link"]),
+        }
+
+
+LINK_EXTRACTORS = {
+    "pdfjs_viewer": _links_pdfjs_viewer,
+    "href": _links_href,
+    "onclick": _links_onclick,
+    "gofile_context": _links_gofile_context,
+}
+
+
+def create_session(adapter, headers=None):
+    """지자체별 헤더를 가진 세션 (연결 풀 adapter는 모든 지자체가 공유)"""
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT, "Accept": "application/pdf,application/octet-stream,*/*"})
+    session.headers.update(headers or {})
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def parse_documents(municipality, html, page_url, session, markup=None):
+    """목록 페이지 HTML에서 문서 링크를 찾아 분류 [{"url", "filename", "category", "entry", ...}, ...]
+
+    markup에 응답 바이트를 넘기면 문서 인코딩은 BeautifulSoup이 판별한다.
+    """
+    soup = BeautifulSoup(markup or html, "html.parser")
+    extractor = LINK_EXTRACTORS[municipality["link"]["type"]]
+    exclude = municipality.get("exclude", [])
+
+    documents = []
+    seen = set()
+    for doc in extractor(municipality, soup, html, page_url, session):
+        doc["filename"] = safe_filename(doc["filename"])
+        identity = (doc["url"], json.dumps(doc.get("data"), sort_keys=True))
+        if identity in seen or any(keyword in doc["filename"] for keyword in exclude):
+            continue
+        seen.add(identity)
+        documents.append(doc)
+
+    # 추출 방식이 분류까지 정한 문서(gofile_context)는 그대로, 나머지는 파일명 번호로 분류
+    unclassified = [doc for doc in documents if not doc.get("category")]
+    categories = get_taxonomy(municipality).classify_many(doc["filename"] for doc in unclassified)
+    for doc, category in zip(unclassified, categories):
+        doc["category"] = category
+
+    return documents
+
+
+def discover_documents(municipality, session):
+    """목록 페이지를 받아 문서 목록 구성"""
+    response = session.get(municipality["url"], timeout=20)
+    response.raise_for_status()
+    return parse_documents(municipality, response.text, response.url, session, markup=response.content)
+
+
+# ----------------------------------------------------------------------
+# 수집기
+# ----------------------------------------------------------------------
+class MunicipalHarvester:
+    """여러 지자체 동시 수집 (호스트별 동시 연결/요청 간격 제한)"""
+
+    def __init__(
+        self,
+        municipalities,
+        base_path=".",
+        max_workers=16,
+        max_per_host=2,
+        min_interval=0.25,
+        max_retries=5,
+        check_upstream=False,
+    ):
+        self.municipalities = municipalities
+        self.base_path = base_path
+        self.max_workers = max_workers
+        self.max_per_host = max_per_host
+        self.max_retries = max_retries
+        # True면 저널에 완료로 기록된 문서도 조건부 요청(ETag/Last-Modified)으로 서버 변경 여부를 다시 확인
+        self.check_upstream = check_upstream
+
+        self.adapter = requests.adapters.HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.rate_limiter = HostRateLimiter(min_interval=min_interval)
+        self._host_slots = {}
+        self._host_lock = threading.Lock()
+
+        # 지자체별 저널/매니페스트 (기존 단일 지자체 스크립트와 같은 파일을 공유)
+        self.states = {}
+
+    def _host_slot(self, url, limit):
+        host = urlparse(url).netloc
+        with self._host_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(limit)
+            return self._host_slots[host]
+
+    def _state(self, municipality):
+        state = self.states.get(municipality["id"])
+        if state is None:
+            folder = os.path.join(self.base_path, municipality["folder"])
+            os.makedirs(folder, exist_ok=True)
+            state = {
+                "folder": folder,
+                "session": create_session(self.adapter, municipality.get("headers")),
+                "journal": DownloadJournal(os.path.join(folder, ".download_journal.jsonl")),
+                "manifest": DownloadManifest(os.path.join(folder, "download_manifest.json")),
+                "documents": 0,
+                "success": 0,
+                "skipped": 0,
+                "failed": [],
+            }
+            self.states[municipality["id"]] = state
+        return state
+
+    def _download(self, municipality, doc):
+        """문서 한 개 다운로드 (지수 백오프 재시도, 받은 부분부터 이어받기)"""
+        state = self.states[municipality["id"]]
+        category_path = os.path.join(state["folder"], doc["category"])
+        os.makedirs(category_path, exist_ok=True)
+
+        file_path = os.path.join(category_path, doc["filename"])
+        key = document_key(doc["category"], doc["filename"])
+        slot = self._host_slot(doc["url"], municipality.get("max_per_host", self.max_per_host))
+
+        last_error = None
+        for attempt in range(self.max_retries):
+            try:
+                with slot:
+                    result = fetch_pdf_resumable(
+                        state["session"],
+                        doc["url"],
+                        file_path,
+                        manifest=state["manifest"],
+                        key=key,
+                        check_upstream=self.check_upstream,
+                        rate_limiter=self.rate_limiter,
+                        data=doc.get("data"),
+                    )
+                if not result["skipped"] and doc["filename"].lower().endswith(".pdf") and not looks_like_pdf(file_path):
+                    os.remove(file_path)
+                    state["manifest"].remove(key)
+                    return {"success": False, "error": "PDF가 아닌 응답", "attempts": attempt + 1}
+
+                result["attempts"] = attempt + 1
+                return result
+            except Exception as e:
+                last_error = e
+                if attempt < self.max_retries - 1:
+                    time.sleep(min(2**attempt, 30))
+
+        return {"success": False, "error": str(last_error), "attempts": self.max_retries}
+
+    def discover(self):
+        """모든 지자체 목록 페이지를 동시에 요청해 문서 목록 수집"""
+        discovered = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.municipalities) or 1)) as executor:
+            futures = {
+                executor.submit(discover_documents, municipality, self._state(municipality)["session"]): municipality
+                for municipality in self.municipalities
+            }
+            for future in as_completed(futures):
+                municipality = futures[future]
+                try:
+                    documents = future.result()
+                except Exception as e:
+                    print(f"❌ [{municipality['name']}] 목록 수집 실패: {e}")
+                    continue
+
+                discovered[municipality["id"]] = documents
+                categories = defaultdict(int)
+                for doc in documents:
+                    categories[doc["category"]] += 1
+                print(f"🔍 [{municipality['name']}] 문서 {len(documents)}개 ({len(categories)}개 분류)")
+
+        return discovered
+
+    def _interleave(self, tasks_by_municipality):
+        """지자체별 작업을 번갈아 배치 (한 호스트의 대기열이 워커를 독점하지 않도록)"""
+        queues = deque(deque(tasks) for tasks in tasks_by_municipality if tasks)
+        while queues:
+            queue = queues.popleft()
+            yield queue.popleft()
+            if queue:
+                queues.append(queue)
+
+    def run(self):
+        """목록 수집 → 미완료 문서 동시 다운로드, 지자체별 결과 반환"""
+        started = time.time()
+        by_id = {municipality["id"]: municipality for municipality in self.municipalities}
+        discovered = self.discover()
+
+        tasks_by_municipality = []
+        for municipality_id, documents in discovered.items():
+            municipality = by_id[municipality_id]
+            state = self.states[municipality_id]
+            state["documents"] = len(documents)
+            pending = []
+            for doc in documents:
+                # 저널 완료 기록은 서버 파일이 바뀌어도 남아 있으므로, 변경 확인 시에는 매니페스트 검증에 맡김
+                if not self.check_upstream and state["journal"].is_done(document_key(doc["category"], doc["filename"])):
+                    state["skipped"] += 1
+                else:
+                    pending.append((municipality, doc))
+            tasks_by_municipality.append(pending)
+
+        tasks = list(self._interleave(tasks_by_municipality))
+        print(f"📥 다운로드할 문서: {len(tasks)}개 (동시 {self.max_workers}개, 호스트별 {self.max_per_host}개)")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._download, municipality, doc): (municipality, doc) for municipality, doc in tasks
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                municipality, doc = futures[future]
+                state = self.states[municipality["id"]]
+                result = future.result()
+                key = document_key(doc["category"], doc["filename"])
+
+                if result["success"]:
+                    # 변경 확인 결과 304(또는 검증된 기존 파일)면 기존 문서로 집계
+                    state["skipped" if result["skipped"] else "success"] += 1
+                    state["journal"].mark_done(key, size=result["size"], sha256=result["sha256"])
+                    print(f"  ✅ {done:4d}/{len(tasks)} [{municipality['name']}] {key} ({result['size']:,} bytes)")
+                else:
+                    state["failed"].append(key)
+                    state["journal"].mark_failed(key, result["error"])
+                    print(f"  ❌ {done:4d}/{len(tasks)} [{municipality['name']}] {key}: {result['error'][:50]}")
+
+        results = {}
+        for municipality_id, state in self.states.items():
+            state["manifest"].save()
+            state["journal"].close()
+            state["session"].close()
+            results[municipality_id] = {
+                "documents": state["documents"],
+                "success": state["success"],
+                "skipped": state["skipped"],
+                "failed": state["failed"],
+            }
+            print(
+                f"📊 [{by_id[municipality_id]['name']}] 신규 {state['success']}개, 기존 {state['skipped']}개, "
+                f"실패 {len(state['failed'])}개 / 전체 {state['documents']}개"
+            )
+
+        print(f"⏱️ 소요 시간: {time.time() - started:.1f}초")
+        return results
+
+
+def main():
+    municipalities = load_municipalities()
+    args = sys.argv[1:]
+    check_upstream = "--check-upstream" in args
+    selected = set(arg for arg in args if not arg.startswith("--"))
+    if selected:
+        municipalities = [m for m in municipalities if m["id"] in selected]
+
+    if not municipalities:
+        print(f"❌ 수집할 지자체가 없습니다. (등록된 id: {', '.join(m['id'] for m in load_municipalities())})")
+        return
+
+    print(f"🏛️ 지자체 공약 문서 수집: {', '.join(m['name'] for m in municipalities)}")
+    print("=" * 60)
+    MunicipalHarvester(municipalities, check_upstream=check_upstream).run()
+
+
+if __name__ == "__main__":
+    main()
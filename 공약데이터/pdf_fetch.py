@@ -0,0 +1,275 @@
+"""
+이어받기 가능한 PDF 다운로드 + 체크섬 매니페스트
+
+- 임시 파일(.part)에 받다가 중간에 끊기면 다음 시도에서 Range 요청으로 마지막 바이트부터 이어받는다.
+  (If-Range에 ETag를 실어 보내므로 서버 파일이 바뀌었으면 처음부터 다시 받는다)
+- 완료된 파일은 크기, SHA-256, ETag/Last-Modified를 매니페스트에 기록한다.
+- 재실행 시 매니페스트와 크기가 일치하는 파일은 네트워크 요청 없이 건너뛰고,
+  check_upstream=True일 때만 조건부 요청으로 서버 변경 여부를 확인한다.
+
+사용 예:
+    manifest = DownloadManifest(os.path.join(base_path, "download_manifest.json"))
+    result = fetch_pdf_resumable(session, url, file_path, manifest=manifest, key="01_더많은기회/1_공약.pdf")
+    manifest.save()
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import urlparse
+
+MIN_PDF_SIZE = 1000  # 1KB 이하면 비정상 응답(오류 페이지 등)으로 간주
+CHUNK_SIZE = 65536
+# 끊긴 응답에서는 마지막 미완성 청크만 잃으므로 네트워크 청크는 작게 유지
+STREAM_CHUNK_SIZE = 16384
+
+
+class HostRateLimiter:
+    """호스트별 요청 시작 간격 제한 (여러 스레드가 같은 서버에 몰리지 않도록)"""
+
+    def __init__(self, min_interval=0.25):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = {}
+
+    def wait(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class DownloadManifest:
+    """다운로드 완료 파일의 크기/해시/ETag 기록"""
+
+    def __init__(self, path, autosave_every=20):
+        self.path = path
+        self.autosave_every = autosave_every
+        self._lock = threading.Lock()
+        self._dirty = 0
+        self.entries = {}
+
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ 매니페스트 로드 실패, 새로 생성합니다: {e}")
+
+    def get(self, key):
+        with self._lock:
+            return self.entries.get(key)
+
+    def update(self, key, entry):
+        with self._lock:
+            self.entries[key] = entry
+            self._dirty += 1
+            should_save = self.autosave_every and self._dirty >= self.autosave_every
+        if should_save:
+            self.save()
+
+    def remove(self, key):
+        with self._lock:
+            if self.entries.pop(key, None) is not None:
+                self._dirty += 1
+
+    def is_verified(self, key, file_path, deep=False):
+        """파일이 매니페스트 기록과 일치하는지 (deep=True면 SHA-256까지 재계산)"""
+        entry = self.get(key)
+        if not entry or not os.path.exists(file_path):
+            return False
+        if os.path.getsize(file_path) != entry.get("size"):
+            return False
+        if deep:
+            return sha256_file(file_path) == entry.get("sha256")
+        return True
+
+    def save(self):
+        """임시 파일에 쓴 뒤 교체 (쓰기 도중 중단되어도 기존 매니페스트 유지)"""
+        with self._lock:
+            data = json.dumps(self.entries, ensure_ascii=False, indent=2)
+            self._dirty = 0
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+
+
+def sha256_file(file_path, hasher=None):
+    """파일 SHA-256 (hasher를 넘기면 이어서 갱신)"""
+    hasher = hasher or hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def looks_like_pdf(file_path):
+    """PDF 시그니처 확인 (오류 안내 HTML이 PDF 이름으로 저장된 경우 걸러냄)"""
+    with open(file_path, "rb") as f:
+        return b"%PDF" in f.read(1024)
+
+
+def _read_part_meta(meta_path):
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _content_total(response):
+    """응답의 전체 파일 크기 (Content-Range "bytes a-b/N" 또는 "*/N", 200이면 Content-Length)"""
+    content_range = response.headers.get("Content-Range", "")
+    match = re.search(r"/(\d+)\s*$", content_range)
+    if match:
+        return int(match.group(1))
+    if response.status_code == 200 and response.headers.get("Content-Length", "").isdigit():
+        return int(response.headers["Content-Length"])
+    return None
+
+
+def fetch_pdf_resumable(
+    session,
+    url,
+    file_path,
+    manifest=None,
+    key=None,
+    check_upstream=False,
+    timeout=(10, 30),
+    rate_limiter=None,
+    min_size=MIN_PDF_SIZE,
+    data=None,
+):
+    """PDF 한 개 다운로드 (실패 시 예외 발생, 재시도는 호출 측에서, data 지정 시 POST)
+
+    반환값: {"success": True, "size": ..., "sha256": ..., "skipped": bool, "resumed_from": int}
+    """
+    key = key or os.path.basename(file_path)
+    entry = manifest.get(key) if manifest else None
+
+    # 1. 검증된 파일은 네트워크 없이 건너뜀
+    verified = bool(manifest) and manifest.is_verified(key, file_path)
+    if verified and not check_upstream:
+        return {"success": True, "size": entry["size"], "sha256": entry["sha256"], "skipped": True, "resumed_from": 0}
+
+    part_path = f"{file_path}.part"
+    meta_path = f"{part_path}.json"
+    headers = {}
+
+    # 2. 서버 변경 확인 (조건부 요청) — 검증에 실패한 파일(크기/해시 불일치)은 304로 남기지 않고 다시 받음
+    if check_upstream and verified:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    # 3. 이어받기
+    offset = 0
+    part_meta = {}
+    if os.path.exists(part_path):
+        part_meta = _read_part_meta(meta_path)
+        if part_meta.get("url") == url and part_meta.get("data") == data:
+            offset = os.path.getsize(part_path)
+        else:
+            os.remove(part_path)
+
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+        validator = part_meta.get("etag") or part_meta.get("last_modified")
+        if validator:
+            headers["If-Range"] = validator
+
+    if rate_limiter is not None:
+        rate_limiter.wait(url)
+
+    method = "POST" if data is not None else "GET"
+    with session.request(
+        method, url, data=data, headers=headers, stream=True, timeout=timeout, allow_redirects=True
+    ) as response:
+        if response.status_code == 304:
+            return {
+                "success": True,
+                "size": entry["size"],
+                "sha256": entry["sha256"],
+                "skipped": True,
+                "resumed_from": 0,
+            }
+
+        if response.status_code == 416 and offset:
+            # 끝까지 받은 상태인지 전체 크기로 확인 (모르거나 다르면 .part를 버리고 다시 받도록)
+            expected = _content_total(response) or part_meta.get("total")
+            if expected is None or os.path.getsize(part_path) != expected:
+                os.remove(part_path)
+                if os.path.exists(meta_path):
+                    os.remove(meta_path)
+                raise Exception(f"HTTP 416 (이어받기 크기 불일치: {offset}/{expected})")
+        elif response.status_code == 206 and offset:
+            pass
+        elif response.status_code == 200:
+            # Range를 무시했거나 서버 파일이 바뀐 경우 처음부터
+            offset = 0
+        else:
+            raise Exception(f"HTTP {response.status_code}")
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code != 416:
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "url": url,
+                        "data": data,
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "total": _content_total(response),
+                    },
+                    f,
+                )
+        else:
+            etag = part_meta.get("etag")
+            last_modified = part_meta.get("last_modified")
+
+        hasher = hashlib.sha256()
+        if offset:
+            sha256_file(part_path, hasher)
+
+        if response.status_code != 416:
+            with open(part_path, "ab" if offset else "wb") as f:
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        hasher.update(chunk)
+
+    size = os.path.getsize(part_path)
+    if size < min_size:
+        os.remove(part_path)
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+        raise Exception(f"파일 크기가 너무 작음: {size} bytes")
+
+    os.replace(part_path, file_path)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    digest = hasher.hexdigest()
+    if manifest is not None:
+        manifest.update(
+            key,
+            {
+                "url": url,
+                "size": size,
+                "sha256": digest,
+                "etag": etag,
+                "last_modified": last_modified,
+                "downloaded_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+            },
+        )
+
+    return {"success": True, "size": size, "sha256": digest, "skipped": False, "resumed_from": offset}
@@ -0,0 +1,313 @@
+"""
+공약 PDF 텍스트/표 추출 파이프라인
+
+gyeonggi_policies/, uijeongbu_policies/ 에 쌓인 공약카드·실천계획서 PDF를 프로세스 풀로 나눠
+페이지별 텍스트와 단순 표를 추출하고 SQLite 저장소(pledge_texts.sqlite3)에 기록한다.
+
+- 추출 결과는 파일 SHA-256 + 페이지 번호로 캐시하므로 새로 받았거나 내용이 바뀐 PDF만 다시 처리한다.
+  (같은 내용의 파일이 다른 폴더에 있어도 한 번만 추출)
+- 파일 해시는 다운로드 매니페스트(download_manifest.json)나 이전 실행의 크기/수정 시각 기록을
+  재사용하고, 둘 다 맞지 않을 때만 다시 계산한다.
+- 워커는 추출만 하고 저장은 메인 프로세스 한 곳에서 하므로 SQLite 쓰기 경합이 없다.
+
+사용 예:
+    python pdf_text_extract.py gyeonggi_policies uijeongbu_policies
+    store = PledgeTextStore("pledge_texts.sqlite3")
+    store.document_text("gyeonggi_policies/01_더많은기회/1_공약.pdf")
+"""
+
+import glob
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from pdf_fetch import sha256_file
+
+DEFAULT_DB_PATH = "pledge_texts.sqlite3"
+DEFAULT_FOLDERS = ["gyeonggi_policies", "uijeongbu_policies"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_files_sha256 ON files (sha256);
+CREATE TABLE IF NOT EXISTS documents (
+    sha256 TEXT PRIMARY KEY,
+    page_count INTEGER NOT NULL,
+    backend TEXT NOT NULL,
+    error TEXT,
+    extracted_at INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    sha256 TEXT NOT NULL,
+    page_no INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (sha256, page_no)
+);
+CREATE TABLE IF NOT EXISTS page_tables (
+    sha256 TEXT NOT NULL,
+    page_no INTEGER NOT NULL,
+    table_no INTEGER NOT NULL,
+    rows TEXT NOT NULL,
+    PRIMARY KEY (sha256, page_no, table_no)
+);
+"""
+
+
+# ----------------------------------------------------------------------
+# 워커 (별도 프로세스에서 실행)
+# ----------------------------------------------------------------------
+def _clean_table(table):
+    """None 셀 정리 후 빈 행 제거"""
+    rows = []
+    for row in table:
+        cells = [" ".join((cell or "").split()) for cell in row]
+        if any(cells):
+            rows.append(cells)
+    return rows
+
+
+def extract_pdf_pages(path, skip_pages=(), with_tables=True):
+    """PDF 한 개의 페이지별 텍스트/표 추출
+
+    반환값: {"page_count": n, "backend": ..., "pages": [(page_no, text, [table_rows, ...]), ...]}
+    pdfplumber가 없으면 pypdf로 텍스트만 추출한다.
+    """
+    skip_pages = set(skip_pages)
+    pages = []
+
+    try:
+        import pdfplumber
+    except ImportError:
+        pdfplumber = None
+
+    if pdfplumber is not None:
+        with pdfplumber.open(path) as pdf:
+            for page_no, page in enumerate(pdf.pages, 1):
+                if page_no in skip_pages:
+                    continue
+                text = page.extract_text() or ""
+                tables = []
+                if with_tables:
+                    tables = [rows for rows in (_clean_table(t) for t in page.extract_tables()) if rows]
+                pages.append((page_no, text, tables))
+                page.close()  # 페이지별 캐시 해제 (큰 문서 메모리 절약)
+            return {"page_count": len(pdf.pages), "backend": "pdfplumber", "pages": pages}
+
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise ImportError("PDF 추출에는 pdfplumber(권장) 또는 pypdf가 필요합니다: pip install pdfplumber")
+
+    reader = PdfReader(path)
+    for page_no, page in enumerate(reader.pages, 1):
+        if page_no not in skip_pages:
+            pages.append((page_no, page.extract_text() or "", []))
+    return {"page_count": len(reader.pages), "backend": "pypdf", "pages": pages}
+
+
+def _extract_task(path, sha256, skip_pages, with_tables):
+    try:
+        result = extract_pdf_pages(path, skip_pages, with_tables)
+        result["error"] = None
+    except ImportError:
+        raise
+    except Exception as e:
+        result = {"page_count": 0, "backend": "", "pages": [], "error": f"{type(e).__name__}: {e}"[:500]}
+    result["path"] = path
+    result["sha256"] = sha256
+    return result
+
+
+# ----------------------------------------------------------------------
+# 저장소
+# ----------------------------------------------------------------------
+class PledgeTextStore:
+    """파일 해시 기준 페이지 텍스트/표 저장소"""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(SCHEMA)
+
+    # 파일 해시 -------------------------------------------------------
+    def cached_hash(self, path, size, mtime):
+        row = self.db.execute("SELECT size, mtime, sha256 FROM files WHERE path = ?", (path,)).fetchone()
+        if row and row[0] == size and row[1] == mtime:
+            return row[2]
+        return None
+
+    def record_file(self, path, size, mtime, sha256):
+        self.db.execute(
+            "INSERT OR REPLACE INTO files (path, size, mtime, sha256) VALUES (?, ?, ?, ?)", (path, size, mtime, sha256)
+        )
+
+    # 추출 상태 -------------------------------------------------------
+    def is_complete(self, sha256):
+        """추출이 끝난 문서인지 (오류로 끝난 문서도 완료로 간주, retry_errors로 재시도)"""
+        return self.db.execute("SELECT 1 FROM documents WHERE sha256 = ?", (sha256,)).fetchone() is not None
+
+    def done_pages(self, sha256):
+        return {row[0] for row in self.db.execute("SELECT page_no FROM pages WHERE sha256 = ?", (sha256,))}
+
+    def save_result(self, result):
+        """워커 결과 저장 (페이지 → 문서 순으로 기록해 문서 행이 있으면 모든 페이지가 있음을 보장)"""
+        sha256 = result["sha256"]
+        with self.db:
+            for page_no, text, tables in result["pages"]:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO pages (sha256, page_no, text) VALUES (?, ?, ?)", (sha256, page_no, text)
+                )
+                self.db.execute("DELETE FROM page_tables WHERE sha256 = ? AND page_no = ?", (sha256, page_no))
+                self.db.executemany(
+                    "INSERT INTO page_tables (sha256, page_no, table_no, rows) VALUES (?, ?, ?, ?)",
+                    [
+                        (sha256, page_no, table_no, json.dumps(rows, ensure_ascii=False))
+                        for table_no, rows in enumerate(tables, 1)
+                    ],
+                )
+            self.db.execute(
+                "INSERT OR REPLACE INTO documents (sha256, page_count, backend, error, extracted_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (sha256, result["page_count"], result["backend"], result["error"], int(time.time())),
+            )
+
+    def clear_errors(self):
+        with self.db:
+            self.db.execute("DELETE FROM documents WHERE error IS NOT NULL")
+
+    # 조회 ------------------------------------------------------------
+    def _sha_of(self, path_or_sha):
+        row = self.db.execute("SELECT sha256 FROM files WHERE path = ?", (os.path.abspath(path_or_sha),)).fetchone()
+        return row[0] if row else path_or_sha
+
+    def page_texts(self, path_or_sha):
+        """[(페이지 번호, 텍스트), ...]"""
+        sha256 = self._sha_of(path_or_sha)
+        return list(self.db.execute("SELECT page_no, text FROM pages WHERE sha256 = ? ORDER BY page_no", (sha256,)))
+
+    def document_text(self, path_or_sha, separator="\n\n"):
+        return separator.join(text for _, text in self.page_texts(path_or_sha))
+
+    def tables(self, path_or_sha):
+        """[(페이지 번호, [[셀, ...], ...]), ...]"""
+        sha256 = self._sha_of(path_or_sha)
+        rows = self.db.execute(
+            "SELECT page_no, rows FROM page_tables WHERE sha256 = ? ORDER BY page_no, table_no", (sha256,)
+        )
+        return [(page_no, json.loads(data)) for page_no, data in rows]
+
+    def close(self):
+        self.db.close()
+
+
+# ----------------------------------------------------------------------
+# 파이프라인
+# ----------------------------------------------------------------------
+def _load_manifest_hashes(folder):
+    """다운로드 매니페스트의 크기/해시 (key는 폴더 기준 상대 경로)"""
+    path = os.path.join(folder, "download_manifest.json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {
+        os.path.abspath(os.path.join(folder, key)): (entry.get("size"), entry.get("sha256"))
+        for key, entry in entries.items()
+        if entry.get("sha256")
+    }
+
+
+def find_pdfs(folders):
+    paths = []
+    for folder in folders:
+        paths.extend(glob.glob(os.path.join(folder, "**", "*.pdf"), recursive=True))
+    return sorted(os.path.abspath(path) for path in paths)
+
+
+def extract_folders(folders=None, db_path=DEFAULT_DB_PATH, max_workers=None, with_tables=True, retry_errors=False):
+    """폴더 아래 모든 PDF 추출 (새 파일/변경된 파일만), 처리 통계 반환"""
+    folders = folders or DEFAULT_FOLDERS
+    store = PledgeTextStore(db_path)
+    if retry_errors:
+        store.clear_errors()
+
+    manifest_hashes = {}
+    for folder in folders:
+        manifest_hashes.update(_load_manifest_hashes(folder))
+
+    # 1. 파일 해시 확인 (기록/매니페스트 재사용, 없을 때만 계산)
+    pdf_paths = find_pdfs(folders)
+    print(f"📄 PDF 파일: {len(pdf_paths)}개")
+
+    hashed = 0
+    tasks = {}
+    for path in pdf_paths:
+        stat = os.stat(path)
+        sha256 = store.cached_hash(path, stat.st_size, stat.st_mtime)
+        if sha256 is None:
+            size, manifest_sha = manifest_hashes.get(path, (None, None))
+            sha256 = manifest_sha if size == stat.st_size else sha256_file(path)
+            hashed += 1
+            store.record_file(path, stat.st_size, stat.st_mtime, sha256)
+
+        # 같은 내용의 파일은 한 번만 추출
+        if sha256 not in tasks and not store.is_complete(sha256):
+            tasks[sha256] = path
+    store.db.commit()
+
+    print(f"🔑 해시 갱신: {hashed}개, 추출 대상: {len(tasks)}개 (나머지는 캐시 사용)")
+    stats = {"files": len(pdf_paths), "extracted": 0, "pages": 0, "tables": 0, "errors": 0}
+    if not tasks:
+        store.close()
+        return stats
+
+    # 2. 프로세스 풀로 추출, 결과는 메인 프로세스에서 저장
+    started = time.time()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_extract_task, path, sha256, store.done_pages(sha256), with_tables)
+            for sha256, path in tasks.items()
+        ]
+        for i, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            store.save_result(result)
+
+            if result["error"]:
+                stats["errors"] += 1
+                print(f"⚠️ 추출 실패: {os.path.basename(result['path'])} - {result['error']}")
+            else:
+                stats["extracted"] += 1
+                stats["pages"] += len(result["pages"])
+                stats["tables"] += sum(len(tables) for _, _, tables in result["pages"])
+
+            if i % 50 == 0 or i == len(futures):
+                print(f"  📊 {i}/{len(futures)} 처리 ({time.time() - started:.1f}초)")
+
+    store.close()
+    print(
+        f"✅ 추출 완료: {stats['extracted']}개 문서, {stats['pages']}쪽, 표 {stats['tables']}개, "
+        f"실패 {stats['errors']}개 ({time.time() - started:.1f}초)"
+    )
+    return stats
+
+
+def main():
+    folders = sys.argv[1:] or DEFAULT_FOLDERS
+    folders = [folder for folder in folders if os.path.isdir(folder)]
+    if not folders:
+        print("❌ 추출할 PDF 폴더가 없습니다. (gyeonggi_policies, uijeongbu_policies)")
+        return
+
+    print(f"🔄 PDF 텍스트/표 추출 시작: {', '.join(folders)}")
+    extract_folders(folders)
+
+
+if __name__ == "__main__":
+    main()
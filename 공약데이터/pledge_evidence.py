@@ -0,0 +1,519 @@
+"""
+공약 ↔ 기사 근거 매칭 (문자 n-gram BM25)
+
+rss 크롤러가 모은 기사 본문을 한국어 문자 n-gram(기본 bigram) BM25 색인으로 만들고,
+공약 제목 + 추출 본문(pdf_text_extract 저장소)을 한 번에 질의해 공약별 상위 k개 기사를 찾는다.
+
+- n-gram은 문서 묶음을 UTF-32 코드 배열 하나로 이어 붙여 numpy 연산으로 만든다. (문자 n개를 21비트씩
+  이어 붙인 정수 키, 공백이 낀 n-gram은 제외하므로 단어/문서 경계를 넘지 않음)
+- 색인은 문서×용어 희소 행렬(scipy.sparse CSR)이고 BM25 길이 정규화 tf만 저장한다.
+  idf는 질의 쪽 가중치로 곱하므로 점수 = Q(공약×용어) · Wᵀ(용어×문서) 희소 행렬 곱 한 번이다.
+- 공약마다 idf가 높은 n-gram max_query_terms개만 질의에 사용하고, 문서는 묶음 단위로 곱해
+  argpartition으로 상위 k개만 남기므로 메모리는 (공약 수 × 묶음 크기)로 제한된다.
+
+사용 예:
+    index = EvidenceIndex()
+    index.add_documents(texts)                 # 기사 제목 + 본문
+    results = index.top_k(pledge_queries, k=20)  # [[(문서 번호, 점수), ...], ...]
+
+    tracker = EvidenceTracker(pledges)         # 공약별 상위 k개 힙 유지
+    tracker.ingest(new_texts, new_keys)        # 새 기사만 채점
+
+    python pledge_evidence.py   # 기사 CSV + 공약 PDF 텍스트 → pledge_evidence.csv (새 기사만 증분 반영)
+"""
+
+import glob
+import heapq
+import os
+import pickle
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from pdf_text_extract import DEFAULT_DB_PATH, DEFAULT_FOLDERS, PledgeTextStore, find_pdfs
+
+NON_WORD_RE = re.compile(r"[^0-9a-z가-힣]+")
+CODE_BITS = 21  # 유니코드 코드 포인트 최대 비트 수
+SEPARATOR = 32  # 공백
+
+DEFAULT_ARTICLE_GLOB = os.path.join("..", "news_crawling", "rss", "results", "*.csv")
+STATE_PATH = "pledge_evidence_state.pkl"
+
+
+def ngram_keys(texts, n=2, max_chars=None):
+    """문서 묶음의 문자 n-gram 키(uint64)와 각 키의 문서 번호 배열"""
+    cleaned = [NON_WORD_RE.sub(" ", (text or "")[:max_chars].lower()) for text in texts]
+    if not cleaned:
+        return np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64)
+
+    # 문서 사이에 공백 하나를 두고 이어 붙임 → 경계를 넘는 n-gram은 공백을 포함하므로 제외됨
+    joined = " ".join(cleaned)
+    codes = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    if len(codes) < n:
+        return np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64)
+
+    count = len(codes) - n + 1
+    keys = np.zeros(count, dtype=np.uint64)
+    valid = np.ones(count, dtype=bool)
+    for j in range(n):
+        window = codes[j : j + count]
+        keys = (keys << np.uint64(CODE_BITS)) | window
+        valid &= window != SEPARATOR
+
+    positions = np.flatnonzero(valid)
+    doc_ends = np.cumsum([len(text) + 1 for text in cleaned])
+    doc_ids = np.searchsorted(doc_ends, positions, side="right")
+    return keys[positions], doc_ids
+
+
+class EvidenceIndex:
+    """문자 n-gram BM25 색인 (문서 추가는 묶음 단위)"""
+
+    def __init__(self, ngram=2, k1=1.2, b=0.75, max_chars=5000):
+        self.ngram = ngram
+        self.k1 = k1
+        self.b = b
+        self.max_chars = max_chars
+
+        # 용어 사전: 정렬된 키 배열과 그 키의 용어 번호 (새 용어는 끝 번호로 추가)
+        self._sorted_keys = np.empty(0, dtype=np.uint64)
+        self._sorted_ids = np.empty(0, dtype=np.int64)
+        self.n_terms = 0
+
+        self.df = np.zeros(0, dtype=np.int64)
+        self.doc_lengths = np.zeros(0, dtype=np.int64)
+        self._tf_chunks = []  # 문서 묶음별 원시 tf CSR (열 수는 추가 시점의 용어 수)
+        self._weights = None  # BM25 정규화 tf CSR (avgdl 기준, 필요할 때 계산)
+
+    @property
+    def n_docs(self):
+        return len(self.doc_lengths)
+
+    # ------------------------------------------------------------------
+    # 용어 사전
+    # ------------------------------------------------------------------
+    def _lookup(self, keys):
+        """키 → 용어 번호 (없으면 -1)"""
+        if not len(self._sorted_keys):
+            return np.full(len(keys), -1, dtype=np.int64)
+        pos = np.searchsorted(self._sorted_keys, keys)
+        pos = np.minimum(pos, len(self._sorted_keys) - 1)
+        found = self._sorted_keys[pos] == keys
+        return np.where(found, self._sorted_ids[pos], -1)
+
+    def _add_terms(self, unique_keys):
+        """새 키를 사전에 추가하고 키(중복 없음)의 용어 번호 반환"""
+        new_keys = unique_keys[self._lookup(unique_keys) < 0]
+        if len(new_keys):
+            new_ids = np.arange(self.n_terms, self.n_terms + len(new_keys), dtype=np.int64)
+            merged_keys = np.concatenate([self._sorted_keys, new_keys])
+            merged_ids = np.concatenate([self._sorted_ids, new_ids])
+            order = np.argsort(merged_keys, kind="stable")
+            self._sorted_keys = merged_keys[order]
+            self._sorted_ids = merged_ids[order]
+            self.n_terms += len(new_keys)
+            self.df = np.concatenate([self.df, np.zeros(len(new_keys), dtype=np.int64)])
+        return self._lookup(unique_keys)
+
+    # ------------------------------------------------------------------
+    # 색인
+    # ------------------------------------------------------------------
+    def _tf_matrix(self, texts):
+        keys, doc_ids = ngram_keys(texts, self.ngram, self.max_chars)
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        term_ids = self._add_terms(unique_keys)[inverse]
+
+        # (문서, 용어) 쌍별 빈도 (중복 좌표는 CSR 변환 시 합산됨)
+        tf = sparse.coo_matrix(
+            (np.ones(len(term_ids), dtype=np.float32), (doc_ids, term_ids)), shape=(len(texts), self.n_terms)
+        ).tocsr()
+        tf.sum_duplicates()
+        return tf
+
+    def add_documents(self, texts, chunk_size=20000):
+        """문서 추가, 추가된 문서 번호 범위 반환"""
+        texts = list(texts)
+        start = self.n_docs
+
+        for i in range(0, len(texts), chunk_size):
+            tf = self._tf_matrix(texts[i : i + chunk_size])
+            self._tf_chunks.append(tf)
+            self.doc_lengths = np.concatenate([self.doc_lengths, np.asarray(tf.sum(axis=1)).ravel().astype(np.int64)])
+            self.df += np.bincount(tf.indices, minlength=self.n_terms)
+
+        self._weights = None
+        return range(start, self.n_docs)
+
+    def _bm25_weights(self, tf, doc_lengths, avgdl):
+        """원시 tf → BM25 정규화 tf (k1+1)·tf / (tf + k1·(1 - b + b·dl/avgdl))"""
+        tf = tf.copy()
+        norm = self.k1 * (1 - self.b + self.b * doc_lengths / max(avgdl, 1.0))
+        row_norm = np.repeat(norm, np.diff(tf.indptr)).astype(np.float32)
+        tf.data = tf.data * (self.k1 + 1) / (tf.data + row_norm)
+        return tf
+
+    def weights_from(self, first_doc=0):
+        """first_doc 이후 문서의 BM25 정규화 tf 행렬 (현재 avgdl 기준, 용어 수에 맞춰 열 확장)"""
+        avgdl = self.doc_lengths.mean() if self.n_docs else 1.0
+        blocks = []
+        offset = 0
+        for tf in self._tf_chunks:
+            if offset >= first_doc:
+                lengths = self.doc_lengths[offset : offset + tf.shape[0]]
+                tf = sparse.csr_matrix((tf.data, tf.indices, tf.indptr), shape=(tf.shape[0], self.n_terms))
+                blocks.append(self._bm25_weights(tf, lengths, avgdl))
+            offset += tf.shape[0]
+        return sparse.vstack(blocks, format="csr") if blocks else sparse.csr_matrix((0, self.n_terms))
+
+    def weights(self):
+        """전체 문서의 BM25 정규화 tf 행렬"""
+        if self._weights is None:
+            self._weights = self.weights_from(0)
+        return self._weights
+
+    # ------------------------------------------------------------------
+    # 질의
+    # ------------------------------------------------------------------
+    def idf(self):
+        n = max(self.n_docs, 1)
+        return np.log1p((n - self.df + 0.5) / (self.df + 0.5)).astype(np.float32)
+
+    def query_matrix(self, queries, max_query_terms=64, max_df_ratio=0.5):
+        """질의 묶음 → (질의 × 용어) 희소 행렬 (idf 가중, 질의마다 정보량 높은 용어만)"""
+        keys, query_ids = ngram_keys(queries, self.ngram, None)
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        term_ids = self._lookup(unique_keys)[inverse]
+        known = term_ids >= 0
+        query_ids, term_ids = query_ids[known], term_ids[known]
+
+        # 질의 내 중복 n-gram은 한 번만 (이진 질의)
+        pairs = np.unique(query_ids * max(self.n_terms, 1) + term_ids)
+        query_ids = pairs // max(self.n_terms, 1)
+        term_ids = pairs % max(self.n_terms, 1)
+
+        idf = self.idf()
+        weights = idf[term_ids]
+
+        # 대부분의 문서에 나오는 n-gram 제외
+        keep = self.df[term_ids] <= max_df_ratio * max(self.n_docs, 1)
+        query_ids, term_ids, weights = query_ids[keep], term_ids[keep], weights[keep]
+
+        # 질의별 idf 상위 max_query_terms개 (질의 번호 오름차순, 같은 질의 안에서는 idf 내림차순 정렬)
+        if max_query_terms:
+            order = np.lexsort((-weights, query_ids))
+            query_ids, term_ids, weights = query_ids[order], term_ids[order], weights[order]
+            first = np.searchsorted(query_ids, query_ids, side="left")
+            keep = np.arange(len(query_ids)) - first < max_query_terms
+            query_ids, term_ids, weights = query_ids[keep], term_ids[keep], weights[keep]
+
+        return sparse.csr_matrix((weights, (query_ids, term_ids)), shape=(len(queries), self.n_terms))
+
+    def score_block(self, query_matrix, weights):
+        """(질의 × 문서) 점수 (dense float32)"""
+        return (weights @ query_matrix.T).T.toarray()
+
+    def top_k(self, queries, k=10, chunk_size=100000, max_query_terms=64):
+        """질의별 상위 k개 [(문서 번호, 점수), ...] (점수 내림차순)"""
+        query_matrix = self.query_matrix(queries, max_query_terms=max_query_terms)
+        weights = self.weights()
+        n_queries = query_matrix.shape[0]
+
+        best_scores = np.full((n_queries, 0), -np.inf, dtype=np.float32)
+        best_docs = np.zeros((n_queries, 0), dtype=np.int64)
+
+        for start in range(0, self.n_docs, chunk_size):
+            scores = self.score_block(query_matrix, weights[start : start + chunk_size])
+            if scores.shape[1] > k:
+                part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            else:
+                part = np.tile(np.arange(scores.shape[1]), (n_queries, 1))
+            part_scores = np.take_along_axis(scores, part, axis=1)
+
+            # 이전 묶음까지의 상위 k개와 합쳐 다시 k개
+            best_scores = np.concatenate([best_scores, part_scores], axis=1)
+            best_docs = np.concatenate([best_docs, part + start], axis=1)
+            if best_scores.shape[1] > k:
+                keep = np.argpartition(-best_scores, k - 1, axis=1)[:, :k]
+                best_scores = np.take_along_axis(best_scores, keep, axis=1)
+                best_docs = np.take_along_axis(best_docs, keep, axis=1)
+
+        results = []
+        for scores, docs in zip(best_scores, best_docs):
+            order = np.argsort(-scores)
+            results.append([(int(docs[i]), float(scores[i])) for i in order if scores[i] > 0])
+        return results
+
+
+class EvidenceTracker:
+    """공약별 상위 k개 근거 기사를 유지하며 새 기사만 증분 채점
+
+    - 새 기사 묶음은 색인에 추가한 뒤 그 묶음의 가중치 행렬만 질의 행렬과 한 번 곱해 공약별 힙에 반영한다.
+    - 문서 빈도(df)는 추가할 때 누적되지만, 질의 행렬의 idf 가중치는 지연 갱신한다. 마지막 갱신 이후
+      문서 수가 refresh_ratio 이상 늘었을 때만 질의 행렬을 다시 만들고 전체를 재채점해 힙을 교체한다.
+    - 상태(색인, 힙, 기사 정보)는 pickle로 저장해 다음 수집 후 이어서 사용한다.
+    """
+
+    def __init__(self, pledges, k=20, refresh_ratio=0.1, index=None):
+        self.k = k
+        self.refresh_ratio = refresh_ratio
+        self.index = index or EvidenceIndex()
+        self.pledges = []
+        self.heaps = []
+
+        self.doc_keys = []  # 문서 번호 → 기사 키
+        self.doc_info = []  # 문서 번호 → (언론사, 제목, 날짜, URL)
+        self._seen = set()
+
+        self._query_matrix = None
+        self._query_docs = 0  # 질의 행렬을 만들 때의 문서 수
+        self.set_pledges(pledges)
+
+    def set_pledges(self, pledges):
+        """공약 목록 설정 (바뀌었으면 전체 재채점)"""
+        if [p["id"] for p in pledges] == [p["id"] for p in self.pledges]:
+            self.pledges = pledges
+            return
+        self.pledges = pledges
+        self.refresh()
+
+    def refresh(self):
+        """현재 df로 질의 행렬을 다시 만들고 전체 재채점"""
+        queries = [pledge["query"] for pledge in self.pledges]
+        self._query_matrix = self.index.query_matrix(queries)
+        self._query_docs = self.index.n_docs
+        self.heaps = []
+
+        if not self.index.n_docs or not queries:
+            self.heaps = [[] for _ in self.pledges]
+            return
+
+        for matches in self.index.top_k(queries, k=self.k):
+            heap = [(score, doc) for doc, score in matches]
+            heapq.heapify(heap)
+            self.heaps.append(heap)
+
+    def _needs_refresh(self):
+        return self.index.n_docs > (1 + self.refresh_ratio) * max(self._query_docs, 1)
+
+    def ingest(self, texts, keys, infos=None):
+        """새 기사 추가 후 새 기사만 채점, 추가된 기사 수 반환 (이미 본 키는 건너뜀)"""
+        infos = infos if infos is not None else [("", "", "", "")] * len(keys)
+        # 같은 묶음 안에서 반복된 키도 한 번만 색인 (중복 문서가 BM25 가중치/상위 결과를 두 배로 차지하지 않도록)
+        fresh = []
+        for i, key in enumerate(keys):
+            if key not in self._seen:
+                self._seen.add(key)
+                fresh.append(i)
+        if not fresh:
+            return 0
+
+        new_texts = [texts[i] for i in fresh]
+        for i in fresh:
+            self.doc_keys.append(keys[i])
+            self.doc_info.append(tuple(infos[i]))
+
+        added = self.index.add_documents(new_texts)
+
+        if self._needs_refresh():
+            self.refresh()
+            return len(fresh)
+
+        # 질의 행렬은 이전 용어 수 기준이므로 새 용어 열만큼 확장 (새 용어 가중치는 0)
+        query_matrix = self._query_matrix
+        if query_matrix.shape[1] < self.index.n_terms:
+            query_matrix.resize((query_matrix.shape[0], self.index.n_terms))
+
+        weights = self.index.weights_from(added.start)
+        scores = self.index.score_block(query_matrix, weights)
+        k = min(self.k, scores.shape[1])
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+        for heap, row, docs in zip(self.heaps, scores, candidates):
+            for doc in docs:
+                score = float(row[doc])
+                if score <= 0:
+                    continue
+                item = (score, added.start + int(doc))
+                if len(heap) < self.k:
+                    heapq.heappush(heap, item)
+                elif score > heap[0][0]:
+                    heapq.heapreplace(heap, item)
+
+        return len(fresh)
+
+    def evidence(self, pledge_index):
+        """공약의 근거 기사 [(문서 번호, 점수), ...] (점수 내림차순)"""
+        return [(doc, score) for score, doc in sorted(self.heaps[pledge_index], reverse=True)]
+
+    def to_frame(self):
+        rows = []
+        for pledge_index, pledge in enumerate(self.pledges):
+            for rank, (doc, score) in enumerate(self.evidence(pledge_index), 1):
+                outlet, title, date, url = self.doc_info[doc]
+                rows.append(
+                    {
+                        "공약": pledge["id"],
+                        "공약명": pledge["title"],
+                        "순위": rank,
+                        "점수": round(score, 4),
+                        "언론사": outlet,
+                        "제목": title,
+                        "날짜": date,
+                        "URL": url,
+                    }
+                )
+        return pd.DataFrame(rows)
+
+    def save(self, path):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+# ----------------------------------------------------------------------
+# 공약/기사 로드
+# ----------------------------------------------------------------------
+def pledge_title(filename):
+    """'57_공공주택_확대.pdf' → '공공주택 확대'"""
+    name = os.path.splitext(os.path.basename(filename))[0]
+    name = re.sub(r"^\d+[-_.\s]*", "", name)
+    return name.replace("_", " ").strip()
+
+
+def load_pledges(folders=None, db_path=DEFAULT_DB_PATH, max_text_chars=3000):
+    """공약 PDF 목록과 추출 텍스트 [{"id", "title", "query"}, ...]"""
+    folders = folders or DEFAULT_FOLDERS
+    store = PledgeTextStore(db_path)
+
+    pledges = []
+    for path in find_pdfs(folders):
+        title = pledge_title(path)
+        text = store.document_text(path)[:max_text_chars]
+        pledges.append(
+            {
+                "id": os.path.relpath(path),
+                "title": title,
+                # 제목은 두 번 넣어 본문 n-gram보다 비중을 높임
+                "query": f"{title} {title} {text}",
+            }
+        )
+
+    store.close()
+    return pledges
+
+
+def load_articles(csv_paths):
+    """결과 CSV들을 하나의 DataFrame으로 (언론사, 제목, 날짜, 본문[, URL])
+
+    크롤러마다 컬럼 이름이 달라(언론사명/본문내용 등) 합친 뒤에 빈 값을 채우고 행별로 대체 컬럼을 사용한다.
+    """
+    frames = []
+    for path in csv_paths:
+        try:
+            frames.append(pd.read_csv(path, encoding="utf-8-sig", dtype=str))
+        except Exception as e:
+            print(f"⚠️ CSV 로드 실패 ({path}): {e}")
+
+    if not frames:
+        return pd.DataFrame(columns=["언론사", "제목", "날짜", "본문"])
+
+    articles = pd.concat(frames, ignore_index=True).fillna("")
+    for column in ("언론사", "제목", "날짜", "본문"):
+        if column not in articles.columns:
+            articles[column] = ""
+    for column, alias in (("언론사", "언론사명"), ("본문", "본문내용")):
+        if alias in articles.columns:
+            articles[column] = articles[column].where(articles[column] != "", articles[alias])
+    return articles
+
+
+def article_texts(articles):
+    return (articles["제목"] + " " + articles["본문"]).tolist()
+
+
+def article_keys(articles):
+    """기사 식별 키 (URL이 없으면 언론사|제목|날짜)"""
+    keys = articles["언론사"] + "|" + articles["제목"] + "|" + articles["날짜"]
+    if "URL" in articles.columns:
+        keys = articles["URL"].where(articles["URL"] != "", keys)
+    return keys.tolist()
+
+
+def article_infos(articles):
+    urls = articles["URL"] if "URL" in articles.columns else pd.Series("", index=articles.index)
+    return list(zip(articles["언론사"], articles["제목"], articles["날짜"], urls))
+
+
+def match_pledges(pledges, articles, index=None, k=20):
+    """공약별 상위 k개 기사 DataFrame"""
+    if index is None:
+        index = EvidenceIndex()
+        index.add_documents(article_texts(articles))
+
+    results = index.top_k([pledge["query"] for pledge in pledges], k=k)
+
+    rows = []
+    has_url = "URL" in articles.columns
+    for pledge, matches in zip(pledges, results):
+        for rank, (doc, score) in enumerate(matches, 1):
+            article = articles.iloc[doc]
+            rows.append(
+                {
+                    "공약": pledge["id"],
+                    "공약명": pledge["title"],
+                    "순위": rank,
+                    "점수": round(score, 4),
+                    "언론사": article["언론사"],
+                    "제목": article["제목"],
+                    "날짜": article["날짜"],
+                    "URL": article["URL"] if has_url else "",
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def main():
+    """기사 CSV를 증분 반영해 공약별 근거 기사 갱신 (상태 파일이 없으면 처음부터 색인)"""
+    import time
+
+    article_glob = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_ARTICLE_GLOB
+    csv_paths = sorted(glob.glob(article_glob))
+    if not csv_paths:
+        print(f"❌ 기사 CSV가 없습니다: {article_glob}")
+        return
+
+    pledges = load_pledges()
+    if not pledges:
+        print("❌ 공약 PDF가 없습니다. (gyeonggi_policies, uijeongbu_policies)")
+        return
+
+    started = time.time()
+    if os.path.exists(STATE_PATH):
+        tracker = EvidenceTracker.load(STATE_PATH)
+        tracker.set_pledges(pledges)
+        print(f"📂 이전 상태 로드: 기사 {tracker.index.n_docs:,}개 ({time.time() - started:.1f}초)")
+    else:
+        tracker = EvidenceTracker(pledges)
+
+    started = time.time()
+    articles = load_articles(csv_paths)
+    added = tracker.ingest(article_texts(articles), article_keys(articles), article_infos(articles))
+    print(f"📰 새 기사 {added:,}개 반영 / 전체 {tracker.index.n_docs:,}개 ({time.time() - started:.1f}초)")
+
+    tracker.save(STATE_PATH)
+    evidence = tracker.to_frame()
+    evidence.to_csv("pledge_evidence.csv", index=False, encoding="utf-8-sig")
+    print(f"💾 저장 완료: pledge_evidence.csv ({len(evidence):,}행)")
+
+
+if __name__ == "__main__":
+    main()
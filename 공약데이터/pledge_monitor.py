@@ -0,0 +1,367 @@
+"""
+공약 이행 현황 페이지 변경 감지
+
+경기도(promises/status)와 의정부시(mId=0203020300) 공약 목록 페이지를 주기적으로 확인해
+목록 항목마다 지문(항목 텍스트 해시)과 이행 상태를, PDF마다 ETag/크기/SHA-256을 기록하고
+바뀐 것만 다운로드하며 변경 내역(change feed)을 남긴다.
+
+- 목록 페이지는 ETag/Last-Modified 조건부 요청 → 304이거나 페이지 해시가 같으면 즉시 종료
+- 항목 지문이 바뀌었거나 새로 생긴 항목의 PDF, 그리고 서버 검증자(ETag/Last-Modified)가 있는 PDF만
+  조건부 요청으로 확인한다. (다운로드/매니페스트는 municipal_harvester와 같은 폴더/파일 사용)
+- 스냅샷 이력은 {항목 키: 지문} 사전을 zlib 압축해 내용이 바뀐 경우에만 한 행씩 추가한다.
+- 변경 내역은 SQLite changes 테이블과 pledge_changes.jsonl(한 줄에 하나)로 내보낸다.
+  종류: added / removed / status_changed / entry_changed / document_changed
+
+사용 예:
+    python pledge_monitor.py              # 등록된 모든 지자체 1회 확인
+    python pledge_monitor.py gyeonggi 600 # 경기도만 10분 간격으로 계속 확인
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+import zlib
+
+import requests
+
+from download_journal import document_key
+from municipal_harvester import create_session, load_municipalities, parse_documents
+from pdf_fetch import DownloadManifest, fetch_pdf_resumable, looks_like_pdf
+
+DEFAULT_DB_PATH = "pledge_monitor.sqlite3"
+FEED_PATH = "pledge_changes.jsonl"
+
+# 공약 이행 상태 표기 (긴 표현 먼저)
+STATUS_RE = re.compile(r"(이행\s*완료|완료|정상\s*추진|추진\s*중|일부\s*추진|계속\s*추진|부진|보류|폐기|변경)")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    source TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    page_hash TEXT,
+    checked_at INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    source TEXT NOT NULL,
+    entry_key TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    status TEXT,
+    url TEXT NOT NULL,
+    sha256 TEXT,
+    size INTEGER,
+    etag TEXT,
+    first_seen INTEGER NOT NULL,
+    last_seen INTEGER NOT NULL,
+    PRIMARY KEY (source, entry_key)
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    taken_at INTEGER NOT NULL,
+    entry_count INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    fingerprints BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_source ON snapshots (source, id);
+CREATE TABLE IF NOT EXISTS changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    detected_at INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    entry_key TEXT NOT NULL,
+    old_value TEXT,
+    new_value TEXT
+);
+"""
+
+
+def entry_fingerprint(text):
+    """공백 차이를 무시한 항목 텍스트 해시"""
+    return hashlib.sha1(" ".join((text or "").split()).encode("utf-8")).hexdigest()
+
+
+def entry_status(text):
+    match = STATUS_RE.search(text or "")
+    return re.sub(r"\s+", "", match.group(1)) if match else None
+
+
+class PledgeMonitor:
+    def __init__(self, municipalities, base_path=".", db_path=DEFAULT_DB_PATH, feed_path=FEED_PATH):
+        self.municipalities = municipalities
+        self.base_path = base_path
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(SCHEMA)
+        self.feed_path = feed_path
+
+        self.adapter = requests.adapters.HTTPAdapter()
+        self.sessions = {}
+
+    def _session(self, municipality):
+        session = self.sessions.get(municipality["id"])
+        if session is None:
+            session = create_session(self.adapter, municipality.get("headers"))
+            self.sessions[municipality["id"]] = session
+        return session
+
+    # ------------------------------------------------------------------
+    # 목록 페이지
+    # ------------------------------------------------------------------
+    def _fetch_listing(self, municipality):
+        """(변경된 목록 페이지 응답, 저장할 pages 행) — 304이거나 내용이 같으면 응답은 None
+
+        pages 행은 여기서 쓰지 않는다. 항목 비교까지 끝난 뒤 poll()이 같은 트랜잭션에서 저장해야
+        중간에 실패했을 때 새 해시만 남아 변경 내역을 잃지 않는다.
+        """
+        source = municipality["id"]
+        row = self.db.execute("SELECT etag, last_modified, page_hash FROM pages WHERE source = ?", (source,)).fetchone()
+        etag, last_modified, page_hash = row or (None, None, None)
+
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = self._session(municipality).get(municipality["url"], headers=headers, timeout=20)
+        now = int(time.time())
+        if response.status_code == 304:
+            return None, (source, etag, last_modified, page_hash, now)
+        response.raise_for_status()
+
+        new_hash = hashlib.sha256(response.content).hexdigest()
+        page = (source, response.headers.get("ETag"), response.headers.get("Last-Modified"), new_hash, now)
+        return (None if new_hash == page_hash else response), page
+
+    def _save_page(self, page):
+        self.db.execute(
+            "INSERT OR REPLACE INTO pages (source, etag, last_modified, page_hash, checked_at) VALUES (?, ?, ?, ?, ?)",
+            page,
+        )
+
+    # ------------------------------------------------------------------
+    # 스냅샷 / 변경 내역
+    # ------------------------------------------------------------------
+    def _record_snapshot(self, source, fingerprints, now):
+        """지문 사전이 직전 스냅샷과 다를 때만 압축 저장"""
+        payload = json.dumps(fingerprints, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        digest = hashlib.sha256(payload).hexdigest()
+        last = self.db.execute(
+            "SELECT digest FROM snapshots WHERE source = ? ORDER BY id DESC LIMIT 1", (source,)
+        ).fetchone()
+        if last and last[0] == digest:
+            return False
+        self.db.execute(
+            "INSERT INTO snapshots (source, taken_at, entry_count, digest, fingerprints) VALUES (?, ?, ?, ?, ?)",
+            (source, now, len(fingerprints), digest, zlib.compress(payload, 9)),
+        )
+        return True
+
+    def _emit(self, changes, source, now, kind, entry_key, old_value=None, new_value=None):
+        change = {
+            "source": source,
+            "detected_at": now,
+            "kind": kind,
+            "entry_key": entry_key,
+            "old": old_value,
+            "new": new_value,
+        }
+        self.db.execute(
+            "INSERT INTO changes (source, detected_at, kind, entry_key, old_value, new_value) VALUES (?, ?, ?, ?, ?, ?)",
+            (source, now, kind, entry_key, old_value, new_value),
+        )
+        changes.append(change)
+
+    # ------------------------------------------------------------------
+    # 확인
+    # ------------------------------------------------------------------
+    def _check_document(self, municipality, doc, manifest):
+        """PDF 조건부 확인/다운로드 → (sha256, size, etag) (변경 없으면 이전 값)"""
+        folder = os.path.join(self.base_path, municipality["folder"], doc["category"])
+        os.makedirs(folder, exist_ok=True)
+        file_path = os.path.join(folder, doc["filename"])
+        key = document_key(doc["category"], doc["filename"])
+
+        result = fetch_pdf_resumable(
+            self._session(municipality),
+            doc["url"],
+            file_path,
+            manifest=manifest,
+            key=key,
+            check_upstream=True,
+            data=doc.get("data"),
+        )
+        if not result["skipped"] and doc["filename"].lower().endswith(".pdf") and not looks_like_pdf(file_path):
+            os.remove(file_path)
+            manifest.remove(key)
+            raise Exception("PDF가 아닌 응답")
+
+        entry = manifest.get(key) or {}
+        return result["sha256"], result["size"], entry.get("etag") or entry.get("last_modified")
+
+    def poll(self, municipality):
+        """지자체 한 곳 확인, 변경 내역 목록 반환"""
+        changes = []
+
+        response, page = self._fetch_listing(municipality)
+        if response is None:
+            self._save_page(page)
+            self.db.commit()
+            print(f"⏸️ [{municipality['name']}] 목록 변경 없음")
+            return changes
+
+        try:
+            current, fetched = self._diff_entries(municipality, response, changes)
+            self._save_page(page)
+            self.db.commit()
+        except Exception:
+            # 새 목록 해시도 함께 되돌려 다음 확인에서 다시 비교
+            self.db.rollback()
+            raise
+
+        if changes:
+            with open(self.feed_path, "a", encoding="utf-8") as f:
+                for change in changes:
+                    f.write(json.dumps(change, ensure_ascii=False) + "\n")
+
+        print(f"🔔 [{municipality['name']}] 항목 {len(current)}개, 문서 확인 {fetched}개, 변경 {len(changes)}건")
+        return changes
+
+    def _diff_entries(self, municipality, response, changes):
+        """목록 항목을 직전 상태와 비교해 entries/snapshots/changes 갱신 (커밋은 poll에서)"""
+        source = municipality["id"]
+        now = int(time.time())
+        documents = parse_documents(
+            municipality, response.text, response.url, self._session(municipality), markup=response.content
+        )
+
+        previous = {
+            row[0]: row[1:]
+            for row in self.db.execute(
+                "SELECT entry_key, fingerprint, status, url, sha256, size, etag FROM entries WHERE source = ?",
+                (source,),
+            )
+        }
+        folder = os.path.join(self.base_path, municipality["folder"])
+        os.makedirs(folder, exist_ok=True)
+        manifest = DownloadManifest(os.path.join(folder, "download_manifest.json"))
+
+        current = {}
+        fetched = 0
+        for doc in documents:
+            entry_key = document_key(doc["category"], doc["filename"])
+            fingerprint = entry_fingerprint(doc.get("entry") or doc["filename"])
+            status = entry_status(doc.get("entry"))
+            current[entry_key] = fingerprint
+            old = previous.get(entry_key)
+
+            if old is None:
+                self._emit(changes, source, now, "added", entry_key, None, status)
+            else:
+                old_fingerprint, old_status = old[0], old[1]
+                if old_status != status:
+                    self._emit(changes, source, now, "status_changed", entry_key, old_status, status)
+                elif old_fingerprint != fingerprint:
+                    self._emit(changes, source, now, "entry_changed", entry_key, old_fingerprint, fingerprint)
+
+            # 새 항목/바뀐 항목, 이전 확인에 실패해 해시가 없는 문서, 또는 서버 검증자가 있어 조건부 요청이 싼 문서만 확인
+            sha256, size, etag = (old[3], old[4], old[5]) if old else (None, None, None)
+            if old is None or old[0] != fingerprint or old[2] != doc["url"] or not old[3] or etag:
+                try:
+                    sha256, size, etag = self._check_document(municipality, doc, manifest)
+                    fetched += 1
+                except Exception as e:
+                    print(f"⚠️ [{municipality['name']}] 문서 확인 실패: {entry_key} - {e}")
+                if old is not None and old[3] and sha256 and old[3] != sha256:
+                    self._emit(changes, source, now, "document_changed", entry_key, old[3], sha256)
+
+            self.db.execute(
+                """
+                INSERT INTO entries
+                    (source, entry_key, fingerprint, status, url, sha256, size, etag, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (source, entry_key) DO UPDATE SET
+                    fingerprint = excluded.fingerprint, status = excluded.status, url = excluded.url,
+                    sha256 = excluded.sha256, size = excluded.size, etag = excluded.etag,
+                    last_seen = excluded.last_seen
+                """,
+                (source, entry_key, fingerprint, status, doc["url"], sha256, size, etag, now, now),
+            )
+
+        for entry_key in previous.keys() - current.keys():
+            self._emit(changes, source, now, "removed", entry_key, previous[entry_key][1], None)
+            self.db.execute("DELETE FROM entries WHERE source = ? AND entry_key = ?", (source, entry_key))
+
+        self._record_snapshot(source, current, now)
+        manifest.save()
+        return current, fetched
+
+    def poll_all(self):
+        changes = []
+        for municipality in self.municipalities:
+            try:
+                changes.extend(self.poll(municipality))
+            except Exception as e:
+                print(f"❌ [{municipality['name']}] 확인 실패: {e}")
+        return changes
+
+    def snapshot(self, source, snapshot_id=None):
+        """저장된 스냅샷의 {항목 키: 지문} (기본값: 최신)"""
+        query = "SELECT fingerprints FROM snapshots WHERE source = ?"
+        params = [source]
+        if snapshot_id is not None:
+            query += " AND id = ?"
+            params.append(snapshot_id)
+        row = self.db.execute(query + " ORDER BY id DESC LIMIT 1", params).fetchone()
+        return json.loads(zlib.decompress(row[0])) if row else {}
+
+    def recent_changes(self, source=None, limit=100):
+        query = "SELECT source, detected_at, kind, entry_key, old_value, new_value FROM changes"
+        params = []
+        if source:
+            query += " WHERE source = ?"
+            params.append(source)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        return list(self.db.execute(query, params))
+
+    def close(self):
+        for session in self.sessions.values():
+            session.close()
+        self.db.close()
+
+
+def main():
+    municipalities = load_municipalities()
+    args = sys.argv[1:]
+    interval = int(args.pop()) if args and args[-1].isdigit() else None
+    if args:
+        municipalities = [m for m in municipalities if m["id"] in args]
+
+    if not municipalities:
+        print("❌ 확인할 지자체가 없습니다.")
+        return
+
+    monitor = PledgeMonitor(municipalities)
+    try:
+        while True:
+            changes = monitor.poll_all()
+            for change in changes:
+                print(
+                    f"  • [{change['source']}] {change['kind']}: {change['entry_key']} ({change['old']} → {change['new']})"
+                )
+            if interval is None:
+                break
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\n⚠️ 사용자에 의해 중단되었습니다.")
+    finally:
+        monitor.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+공약 번호 → 분류 구간 인덱스
+
+지자체마다 공약 번호 구간(경기도 1~49번 "01_더많은기회" ...)을 정렬된 시작 번호 배열로 한 번만 적재하고
+이분 탐색으로 조회한다. 적재 시 구간이 겹치거나(같은 번호가 두 분류에 속함) 비어 있는지(어느 분류에도
+속하지 않는 번호) 검사하며, 파일명/공약 번호 수천 개를 numpy 한 번의 searchsorted로 분류할 수 있다.
+
+사용 예:
+    taxonomy = PledgeTaxonomy([(1, 49, "01_더많은기회"), (50, 91, "02_주택교통일자리")], number_pattern=r"^(\\d+)_")
+    taxonomy.lookup(57)                        # "02_주택교통일자리"
+    taxonomy.classify_filename("57_공약.pdf")   # "02_주택교통일자리"
+    taxonomy.classify_many(filenames)          # 분류 리스트
+"""
+
+import bisect
+import re
+
+import numpy as np
+
+UNCATEGORIZED = "00_미분류"
+
+
+class PledgeTaxonomy:
+    def __init__(self, ranges, number_pattern=r"^(\d+)", default=UNCATEGORIZED, allow_gaps=False):
+        """ranges: [(시작 번호, 끝 번호, 분류), ...] (끝 번호 포함)"""
+        ranges = sorted((int(start), int(end), label) for start, end, label in ranges)
+        self._validate(ranges, allow_gaps)
+
+        self.starts = np.array([start for start, _, _ in ranges], dtype=np.int64)
+        self.ends = np.array([end for _, end, _ in ranges], dtype=np.int64)
+        self.labels = [label for _, _, label in ranges]
+        self._starts = self.starts.tolist()  # 단건 조회용 (bisect가 리스트에서 더 빠름)
+        self._ends = self.ends.tolist()
+
+        self.number_pattern = number_pattern
+        self._number_re = re.compile(number_pattern)
+        self.default = default
+
+    @staticmethod
+    def _validate(ranges, allow_gaps):
+        for start, end, label in ranges:
+            if start > end:
+                raise ValueError(f"잘못된 구간: {label} ({start}~{end})")
+
+        for (_, prev_end, prev_label), (start, _, label) in zip(ranges, ranges[1:]):
+            if start <= prev_end:
+                raise ValueError(f"구간 겹침: {prev_label} (~{prev_end}) / {label} ({start}~)")
+            if not allow_gaps and start != prev_end + 1:
+                raise ValueError(f"구간 누락: {prev_end + 1}~{start - 1}번 ({prev_label}와 {label} 사이)")
+
+    @classmethod
+    def from_sections(cls, sections, **kwargs):
+        """{폴더: {"range": (시작, 끝), ...}} 형태 (gyeonggi_policy 섹션 정보)"""
+        return cls([(info["range"][0], info["range"][1], key) for key, info in sections.items()], **kwargs)
+
+    @classmethod
+    def from_mapping(cls, mapping, **kwargs):
+        """{"1": "1_아이가_행복한_도시", ...} 형태 (번호 하나가 분류 하나)"""
+        return cls([(int(number), int(number), label) for number, label in mapping.items()], **kwargs)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def lookup(self, number, default=None):
+        """공약 번호의 분류"""
+        i = bisect.bisect_right(self._starts, number) - 1
+        if i >= 0 and number <= self._ends[i]:
+            return self.labels[i]
+        return self.default if default is None else default
+
+    def extract_number(self, filename):
+        match = self._number_re.search(filename)
+        return int(match.group(1)) if match else None
+
+    def classify_filename(self, filename):
+        number = self.extract_number(filename)
+        return self.default if number is None else self.lookup(number)
+
+    def classify_many(self, values):
+        """공약 번호(정수) 또는 파일명 목록을 한 번에 분류"""
+        values = list(values)
+        if not values:
+            return []
+
+        # 번호를 찾지 못한 항목은 -1 (어느 구간에도 속하지 않음)
+        numbers = np.fromiter(
+            (value if isinstance(value, (int, np.integer)) else (self.extract_number(value) or -1) for value in values),
+            dtype=np.int64,
+            count=len(values),
+        )
+
+        index = np.searchsorted(self.starts, numbers, side="right") - 1
+        valid = index >= 0
+        valid[valid] &= numbers[valid] <= self.ends[index[valid]]
+
+        labels = np.array(self.labels + [self.default], dtype=object)
+        return labels[np.where(valid, index, len(self.labels))].tolist()
+
+
+_CACHE = {}
+
+
+def get_taxonomy(municipality):
+    """지자체 설정(municipal_harvester 항목)의 분류 인덱스 (id별로 한 번만 생성)"""
+    taxonomy = _CACHE.get(municipality["id"])
+    if taxonomy is None:
+        taxonomy = PledgeTaxonomy(
+            municipality.get("categories", []),
+            number_pattern=municipality.get("number_pattern", r"^(\d+)"),
+            allow_gaps=municipality.get("allow_gaps", False),
+        )
+        _CACHE[municipality["id"]] = taxonomy
+    return taxonomy
@@ -0,0 +1,30 @@
+import pandas as pd
+
+from pledge_evidence import EvidenceTracker, article_keys, article_texts, load_articles
+
+
+def test_load_articles_mixed_schemas(tmp_path):
+    kbs = tmp_path / "kbs.csv"
+    factcheck = tmp_path / "factcheck.csv"
+    pd.DataFrame({"언론사명": ["KBS"], "제목": ["공약 점검"], "날짜": ["2024-05-20"], "본문": ["KBS 본문"]}).to_csv(
+        kbs, index=False, encoding="utf-8-sig"
+    )
+    pd.DataFrame(
+        {"언론사": ["뉴스톱"], "제목": ["팩트체크"], "날짜": ["2024-05-21"], "본문내용": ["뉴스톱 본문"], "URL": ["u1"]}
+    ).to_csv(factcheck, index=False, encoding="utf-8-sig")
+
+    articles = load_articles([str(kbs), str(factcheck)])
+    assert articles["언론사"].tolist() == ["KBS", "뉴스톱"]
+    assert articles["본문"].tolist() == ["KBS 본문", "뉴스톱 본문"]
+    assert article_texts(articles) == ["공약 점검 KBS 본문", "팩트체크 뉴스톱 본문"]
+    assert article_keys(articles) == ["KBS|공약 점검|2024-05-20", "u1"]
+
+
+def test_ingest_dedupes_keys_within_batch():
+    pledges = [{"id": "p1", "title": "청년 주택", "query": "청년 주택 공급 확대"}]
+    tracker = EvidenceTracker(pledges, k=5)
+    texts = ["청년 주택 공급", "청년 주택 공급", "버스 노선 개편"]
+    assert tracker.ingest(texts, ["u1", "u1", "u2"]) == 2
+    assert tracker.doc_keys == ["u1", "u2"]
+    assert tracker.index.n_docs == 2
+    assert tracker.ingest(texts, ["u1", "u2", "u3"]) == 1
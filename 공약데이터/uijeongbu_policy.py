@@ -8,35 +8,262 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, Tag
 import shutil
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import requests
+from urllib.parse import urlencode, urljoin
 from webdriver_manager.chrome import ChromeDriverManager
 
+from download_journal import DownloadJournal, document_key, safe_filename
+from pdf_fetch import DownloadManifest, HostRateLimiter, fetch_pdf_resumable, looks_like_pdf
+from pledge_taxonomy import PledgeTaxonomy
+
+# 정책목표 제목 ("1 아이가 행복한 도시")과 사업명 ("3. 어린이 통학로 안전 강화") 패턴
+POLICY_HEADING_RE = re.compile(r"(\d+)\s*[\w가-힣]*\s*도시")
+BUSINESS_NAME_RE = re.compile(r"(\d+\.?\s*[가-힣\s]{5,50})")
+SKIP_TEXT_PARENTS = {"script", "style", "noscript"}
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+# 10개 정책목표 카테고리
+CATEGORIES = {
+    "1": "1_아이가_행복한_도시",
+    "2": "2_어르신이_행복한_도시",
+    "3": "3_청년이_바꾸는_도시",
+    "4": "4_장애인이_행복한_도시",
+    "5": "5_교통이_편리한_도시",
+    "6": "6_문화를_향유하는_도시",
+    "7": "7_삶의_질이_높은_도시",
+    "8": "8_일자리가_풍부한_도시",
+    "9": "9_체육복지가_실현되는_도시",
+    "10": "10_지구와_함께_공존하는_도시",
+}
+# goFile 함수 본문에서 요청 메서드를 정하는 구문
+AJAX_METHOD_RE = re.compile(r"\b(?:type|method)\s*:\s*[\"'](get|post)[\"']", re.I)
+FORM_METHOD_SET_RE = re.compile(
+    r"(?:\.method\s*=|\.attr\(\s*[\"']method[\"']\s*,|setAttribute\(\s*[\"']method[\"']\s*,|method=\\?)\s*[\"'](get|post)[\"']",
+    re.I,
+)
+FORM_SUBMIT_RE = re.compile(
+    r"(?:document\.(\w+)|getElementById\(\s*[\"'](\w+)[\"']\s*\)|\$\(\s*[\"']#(\w+)[\"']\s*\))\.submit\s*\("
+)
+GOFILE_CALL_RE = re.compile(r"goFile\('([^']+)',\s*'([^']+)'(?:,\s*'([^']*)')?\)")
+
+
+# ----------------------------------------------------------------------
+# JS 다운로드 함수 분석 (goFile 등, municipal_harvester의 onclick 방식도 사용)
+# ----------------------------------------------------------------------
+def _find_js_function(html, page_url, session, function_name):
+    pattern = re.compile(
+        rf"(?:function\s+{re.escape(function_name)}|{re.escape(function_name)}\s*=\s*function)\s*\(([^)]*)\)\s*\{{"
+    )
+    match = pattern.search(html)
+    if match:
+        return html, match
+
+    soup = BeautifulSoup(html, "html.parser")
+    for script in soup.find_all("script", src=True):
+        script_url = urljoin(page_url, script["src"])
+        try:
+            response = session.get(script_url, timeout=15)
+            response.raise_for_status()
+        except requests.RequestException:
+            continue
+        match = pattern.search(response.text)
+        if match:
+            return response.text, match
+
+    return None, None
+
+
+def resolve_js_download_endpoint(html, page_url, session, function_name="goFile"):
+    """다운로드 JS 함수 소스를 분석해 요청 형식 추출
+
+    반환값: {"url": ..., "method": "GET"/"POST", "params": {파라미터명: 인자 위치}} 또는 None
+    """
+    source, match = _find_js_function(html, page_url, session, function_name)
+    if source is None:
+        return None
+
+    arg_names = [name.strip() for name in match.group(1).split(",") if name.strip()]
+
+    # 함수 본문 (중괄호 짝 맞추기)
+    depth = 1
+    pos = match.end()
+    while pos < len(source) and depth:
+        if source[pos] == "{":
+            depth += 1
+        elif source[pos] == "}":
+            depth -= 1
+        pos += 1
+    body = source[match.end() : pos - 1]
+
+    url_match = re.search(r"[\"']((?:https?://[^/\"']+)?/[^\"'\s]*)[\"']", body)
+    if not url_match:
+        return None
+
+    params = {}
+    patterns = [
+        # location.href = "/down.do?fileNm=" + encodeURIComponent(fileNm) + "&filePath=" + filePath
+        r"[?&](\w+)=[\"']\s*\+\s*(?:(?:encodeURI(?:Component)?|escape)\(\s*)?(\w+)",
+        # form.fileNm.value = fileNm
+        r"\.(\w+)\.value\s*=\s*(\w+)",
+        # { fileNm: fileNm } / $("<input>", {name: "fileNm", value: fileNm})
+        r"name\s*[:=]\s*[\"'](\w+)[\"'][^;{}]*?value\s*[:=]\s*(\w+)",
+        r"[\"']?(\w+)[\"']?\s*:\s*(\w+)\s*[,}]",
+    ]
+    for pattern in patterns:
+        for name, var in re.findall(pattern, body):
+            if var in arg_names and name not in params:
+                params[name] = arg_names.index(var)
+
+    if not params:
+        return None
+
+    method = _js_request_method(body, html)
+    return {"url": urljoin(page_url, url_match.group(1).split("?")[0]), "method": method, "params": params}
+
+
+def _js_request_method(body, html):
+    """다운로드 함수 본문의 실제 요청 메서드 ($.ajax type/method, $.post, 폼 method 속성, 기본 GET)"""
+    match = AJAX_METHOD_RE.search(body) or FORM_METHOD_SET_RE.search(body)
+    if match:
+        return match.group(1).upper()
+    if re.search(r"\$\.post\s*\(", body):
+        return "POST"
+
+    # document.frm.submit() / $("#frm").submit() → 페이지의 <form name|id="frm" method="...">
+    submit = FORM_SUBMIT_RE.search(body)
+    if submit:
+        form_name = next(name for name in submit.groups() if name)
+        for form in BeautifulSoup(html, "html.parser").find_all("form"):
+            if form_name in (form.get("name"), form.get("id")):
+                return (form.get("method") or "GET").upper()
+    return "GET"
+
+
+def build_endpoint_request(endpoint, args):
+    """JS 함수 인자로 요청 URL과 POST 데이터 구성"""
+    params = {name: args[index] for name, index in endpoint["params"].items() if index < len(args)}
+
+    if endpoint["method"] == "POST":
+        return endpoint["url"], params
+
+    separator = "&" if "?" in endpoint["url"] else "?"
+    return f"{endpoint['url']}{separator}{urlencode(params)}", None
+
+
+# ----------------------------------------------------------------------
+# 정책목표 문맥 분류 (municipal_harvester도 같은 함수로 분류해 폴더/저널 키가 같다)
+# ----------------------------------------------------------------------
+def iter_gofile_links(soup, categories=CATEGORIES):
+    """문서 순서대로 한 번만 순회하며 (goFile 링크, 정책번호, 사업명) 생성
+
+    링크마다 상위 요소 텍스트를 다시 직렬화하지 않고, 순회 중에 만난 마지막 정책목표 제목과
+    사업명을 현재 상태로 들고 다니므로 페이지 크기에 선형이다.
+    """
+    category_names = {folder.split("_", 1)[1].replace("_", " "): number for number, folder in categories.items()}
+    current_policy = None
+    current_business = None
+
+    for node in soup.descendants:
+        if isinstance(node, Tag):
+            if node.name == "a" and "goFile(" in (node.get("onclick") or ""):
+                yield node, current_policy, current_business
+            continue
+
+        if type(node) is not NavigableString:
+            continue  # 주석, CDATA 등
+
+        parent = node.parent
+        if parent.name in SKIP_TEXT_PARENTS:
+            continue
+        if parent.name == "a" and "goFile(" in (parent.get("onclick") or ""):
+            continue  # 링크 텍스트("공약카드" 등)는 문맥이 아님
+
+        text = " ".join(node.split())
+        if not text:
+            continue
+
+        # 정책목표 제목이면 카테고리 전환 (사업명 초기화)
+        policy = next((number for name, number in category_names.items() if name in text), None)
+        if policy is None:
+            heading_match = POLICY_HEADING_RE.search(text)
+            if heading_match and heading_match.group(1) in categories:
+                policy = heading_match.group(1)
+        if policy is not None:
+            current_policy = policy
+            current_business = None
+            continue
+
+        business_match = BUSINESS_NAME_RE.search(text)
+        if business_match:
+            current_business = business_match.group(1).strip()[:50]
+
+
+def classify_gofile_links(soup, categories=CATEGORIES, taxonomy=None):
+    """goFile 링크별 파일명/인자와 분류 폴더 (링크 앞 정책목표 제목 우선, 없으면 파일명 앞 번호)"""
+    taxonomy = taxonomy or PledgeTaxonomy.from_mapping(categories)
+    documents = []
+
+    for idx, (link, context_policy, context_business) in enumerate(iter_gofile_links(soup, categories)):
+        onclick = link.get("onclick", "")
+        match = GOFILE_CALL_RE.search(onclick)
+        if not match:
+            continue
+
+        filename = match.group(1)
+
+        # 파일명에서 정책번호 추출 (파일명이 "1-1.pdf" 같은 형식인 경우)
+        policy_number = "1"  # 기본값
+        policy_match = re.search(r"^(\d+)", filename)
+        if policy_match:
+            policy_number = policy_match.group(1)
+
+        # 링크 앞에서 마지막으로 나온 정책목표 제목 우선
+        if context_policy:
+            policy_number = context_policy
+
+        documents.append(
+            {
+                "link": link,
+                "index": idx + 1,
+                "filename": filename,
+                "filepath": match.group(2),
+                "gofile_args": [arg for arg in match.groups() if arg is not None],
+                "onclick": onclick,
+                "link_text": link.get_text(strip=True),
+                "policy_number": policy_number,
+                "category": taxonomy.lookup(int(policy_number), default=f"정책_{policy_number}"),
+                "business_name": context_business,
+            }
+        )
+
+    return documents
+
 
 class UijeongbuPolicyDownloader:
-    def __init__(self, download_dir="uijeongbu_policies", show_browser=True, max_files=None):
+    def __init__(self, download_dir="uijeongbu_policies", show_browser=True, max_files=None, gofile_endpoint=None):
         self.url = "https://www.ui4u.go.kr/mayor/contents.do?mId=0203020300"
         self.download_dir = os.path.abspath(download_dir)
         self.show_browser = show_browser
         self.max_files = max_files
+        # goFile 요청 형태를 직접 지정할 때: {"url": ..., "method": "GET"/"POST", "params": {파라미터명: 인자 위치}}
+        self.gofile_endpoint = gofile_endpoint
 
         # 10개 정책목표 카테고리
-        self.categories = {
-            "1": "1_아이가_행복한_도시",
-            "2": "2_어르신이_행복한_도시",
-            "3": "3_청년이_바꾸는_도시",
-            "4": "4_장애인이_행복한_도시",
-            "5": "5_교통이_편리한_도시",
-            "6": "6_문화를_향유하는_도시",
-            "7": "7_삶의_질이_높은_도시",
-            "8": "8_일자리가_풍부한_도시",
-            "9": "9_체육복지가_실현되는_도시",
-            "10": "10_지구와_함께_공존하는_도시",
-        }
+        self.categories = dict(CATEGORIES)
+        self.taxonomy = PledgeTaxonomy.from_mapping(self.categories)
 
         self.downloaded_files = []
         self.failed_downloads = []
+        self._result_lock = threading.Lock()
 
         self._setup_logging()
         self._create_directories()
@@ -144,55 +371,33 @@ class UijeongbuPolicyDownloader:
                 f.write(driver.page_source)
             self.logger.info("페이지 소스 저장: page_source.html")
 
-            soup = BeautifulSoup(driver.page_source, "html.parser")
+            return self._extract_download_links_from_html(driver.page_source)
 
-            # 모든 goFile 링크를 찾아서 단순 처리
-            all_gofile_links = soup.find_all("a", onclick=re.compile(r"goFile\("))
-            self.logger.info(f"발견된 goFile 링크: {len(all_gofile_links)}개")
+        except Exception as e:
+            self.logger.error(f"링크 추출 실패: {e}")
+            return []
 
-            if not all_gofile_links:
+    def _extract_download_links_from_html(self, html):
+        """페이지 HTML에서 goFile 링크 추출 (브라우저/정적 요청 공용)"""
+        try:
+            soup = BeautifulSoup(html, "html.parser")
+
+            # goFile 링크와 그 시점의 정책목표/사업명을 한 번의 순회로 수집해 분류
+            classified = classify_gofile_links(soup, self.categories, self.taxonomy)
+            self.logger.info(f"발견된 goFile 링크: {len(classified)}개")
+
+            if not classified:
                 self.logger.error("goFile 링크를 찾을 수 없습니다!")
                 return []
 
             download_data = []
 
-            for idx, link in enumerate(all_gofile_links):
+            for info in classified:
+                idx = info["index"] - 1
                 try:
-                    onclick = link.get("onclick", "")
-                    link_text = link.get_text(strip=True)
-
-                    # goFile 함수 파라미터 추출
-                    match = re.search(r"goFile\('([^']+)',\s*'([^']+)'(?:,\s*'([^']*)')?\)", onclick)
-                    if not match:
-                        self.logger.debug(f"goFile 파라미터 추출 실패: {onclick}")
-                        continue
-
-                    filename = match.group(1)
-                    filepath = match.group(2)
-
-                    # 파일명에서 정책번호 추출 (파일명이 "1-1.pdf" 같은 형식인 경우)
-                    policy_number = "1"  # 기본값
-                    policy_match = re.search(r"^(\d+)", filename)
-                    if policy_match:
-                        policy_number = policy_match.group(1)
-
-                    # 링크 주변 텍스트에서 정책번호 찾기
-                    parent_element = link.parent
-                    context_text = ""
-                    for _ in range(5):  # 5단계까지 상위 요소 확인
-                        if parent_element:
-                            context_text += " " + parent_element.get_text()
-                            parent_element = parent_element.parent
-                        else:
-                            break
-
-                    # 컨텍스트에서 정책번호 추출
-                    context_policy_match = re.search(r"(\d+)\s*[\w가-힣]*\s*도시", context_text)
-                    if context_policy_match:
-                        policy_number = context_policy_match.group(1)
-
-                    # 카테고리 결정
-                    category = self.categories.get(policy_number, f"정책_{policy_number}")
+                    filename = info["filename"]
+                    link_text = info["link_text"]
+                    policy_number = info["policy_number"]
 
                     # 문서 타입 추정 (링크 텍스트나 파일명으로)
                     doc_type = "문서"
@@ -204,26 +409,22 @@ class UijeongbuPolicyDownloader:
                         # 순서로 추정 (짝수는 공약카드, 홀수는 실천계획서)
                         doc_type = "공약카드" if idx % 2 == 1 else "실천계획서"
 
-                    # 사업명 추정 (링크 주변 텍스트에서)
-                    business_name = f"정책사업_{idx+1:03d}"
-
-                    # 주변 텍스트에서 사업명 추출 시도
-                    business_match = re.search(r"(\d+\.?\s*[가-힣\s]{5,50})", context_text)
-                    if business_match:
-                        business_name = business_match.group(1).strip()[:50]
+                    # 사업명 (링크 앞에서 마지막으로 나온 사업명, 없으면 순번)
+                    business_name = info["business_name"] or f"정책사업_{idx+1:03d}"
 
                     download_data.append(
                         {
                             "filename": filename,
-                            "filepath": filepath,
-                            "category": category,
+                            "filepath": info["filepath"],
+                            "category": info["category"],
                             "policy_number": policy_number,
                             "business_name": business_name,
                             "department": "담당부서",
                             "doc_type": doc_type,
-                            "onclick": onclick,
+                            "onclick": info["onclick"],
+                            "gofile_args": info["gofile_args"],
                             "link_text": link_text,
-                            "index": idx + 1,
+                            "index": info["index"],
                         }
                     )
 
@@ -366,6 +567,111 @@ class UijeongbuPolicyDownloader:
             )
             return False
 
+    # ------------------------------------------------------------------
+    # HTTP 직접 다운로드 (goFile 요청 재구성)
+    # ------------------------------------------------------------------
+    def _create_session(self, pool_size=4):
+        """keep-alive 연결 풀을 공유하는 세션"""
+        session = requests.Session()
+        session.headers.update({"User-Agent": USER_AGENT, "Referer": self.url})
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _resolve_gofile_endpoint(self, html, session):
+        """goFile 함수 소스를 분석해 다운로드 요청 형식(URL, 메서드, 파라미터-인자 위치) 추출"""
+        return resolve_js_download_endpoint(html, self.url, session, "goFile")
+
+    def _build_gofile_request(self, endpoint, download_info):
+        """goFile 인자로 요청 URL과 POST 데이터 구성"""
+        args = download_info.get("gofile_args") or [download_info["filename"], download_info["filepath"]]
+        return build_endpoint_request(endpoint, args)
+
+    def _download_file_http(
+        self, session, endpoint, download_info, manifest, rate_limiter, max_retries=3, check_upstream=False
+    ):
+        """goFile 요청을 직접 보내 카테고리 폴더에 스트리밍 저장 (실패 시 예외)"""
+        filename = safe_filename(download_info["filename"])
+        file_path = os.path.join(self.download_dir, download_info["category"], filename)
+        key = document_key(download_info["category"], download_info["filename"])
+        url, data = self._build_gofile_request(endpoint, download_info)
+
+        last_error = None
+        for attempt in range(max_retries):
+            try:
+                result = fetch_pdf_resumable(
+                    session,
+                    url,
+                    file_path,
+                    manifest=manifest,
+                    key=key,
+                    check_upstream=check_upstream,
+                    rate_limiter=rate_limiter,
+                    data=data,
+                )
+
+                # 오류 안내 페이지가 PDF 이름으로 저장되는 경우 방지
+                if not result["skipped"] and filename.lower().endswith(".pdf") and not looks_like_pdf(file_path):
+                    os.remove(file_path)
+                    manifest.remove(key)
+                    raise Exception("PDF가 아닌 응답")
+
+                with self._result_lock:
+                    self.downloaded_files.append(
+                        {
+                            "filename": filename,
+                            "original_filename": download_info["filename"],
+                            "category": download_info["category"],
+                            "business_name": download_info["business_name"],
+                            "doc_type": download_info["doc_type"],
+                            "policy_number": download_info["policy_number"],
+                            "path": file_path,
+                        }
+                    )
+                return file_path
+
+            except Exception as e:
+                last_error = e
+                if attempt < max_retries - 1:
+                    time.sleep(2**attempt)
+
+        raise last_error
+
+    def _download_with_browser(self, driver, download_list, journal, handled=None):
+        """브라우저에서 goFile을 실행해 순차 다운로드 (handled: 결과를 기록한 저널 키를 모을 집합)"""
+        for i, download_info in enumerate(download_list, 1):
+            success = self._download_file(driver, download_info, i)
+
+            journal_key = document_key(download_info["category"], download_info["filename"])
+            if success:
+                journal.mark_done(journal_key, path=self.downloaded_files[-1]["path"])
+            else:
+                journal.mark_failed(journal_key, self.failed_downloads[-1]["error"] if self.failed_downloads else "")
+            if handled is not None:
+                handled.add(journal_key)
+
+            if success and i == 1:
+                self.logger.info("🎉 첫 번째 파일 다운로드 성공!")
+
+            # 다운로드 간격
+            time.sleep(1 if i > 2 else 3)
+
+    def _log_summary(self):
+        """최종 통계 출력"""
+        doc_stats = {}
+        for item in self.downloaded_files:
+            doc_type = item["doc_type"]
+            doc_stats[doc_type] = doc_stats.get(doc_type, 0) + 1
+
+        self.logger.info("=" * 60)
+        self.logger.info("다운로드 완료!")
+        self.logger.info(f"✅ 총 성공: {len(self.downloaded_files)}개")
+        for doc_type, count in doc_stats.items():
+            self.logger.info(f"   - {doc_type}: {count}개")
+        self.logger.info(f"❌ 총 실패: {len(self.failed_downloads)}개")
+        self.logger.info("=" * 60)
+
     def _generate_report(self):
         """결과 보고서 생성"""
         try:
@@ -447,31 +753,21 @@ class UijeongbuPolicyDownloader:
                 self.logger.info("page_source.html 파일을 확인해서 실제 HTML 구조를 분석하세요.")
                 return
 
-            self.logger.info(f"총 {len(download_list)}개 파일 다운로드 시작")
-
-            for i, download_info in enumerate(download_list, 1):
-                success = self._download_file(driver, download_info, i)
-
-                if success and i == 1:
-                    self.logger.info("🎉 첫 번째 파일 다운로드 성공!")
+            # 이전 실행에서 완료된 파일은 건너뜀 (저널 기준)
+            journal = DownloadJournal(os.path.join(self.download_dir, ".download_journal.jsonl"))
+            remaining = [
+                info for info in download_list if not journal.is_done(document_key(info["category"], info["filename"]))
+            ]
+            if len(remaining) < len(download_list):
+                self.logger.info(f"이미 완료된 파일: {len(download_list) - len(remaining)}개")
+            download_list = remaining
 
-                # 다운로드 간격
-                time.sleep(1 if i > 2 else 3)
-
-            # 최종 통계
-            doc_stats = {}
-            for item in self.downloaded_files:
-                doc_type = item["doc_type"]
-                doc_stats[doc_type] = doc_stats.get(doc_type, 0) + 1
+            self.logger.info(f"총 {len(download_list)}개 파일 다운로드 시작")
 
-            self.logger.info("=" * 60)
-            self.logger.info("다운로드 완료!")
-            self.logger.info(f"✅ 총 성공: {len(self.downloaded_files)}개")
-            for doc_type, count in doc_stats.items():
-                self.logger.info(f"   - {doc_type}: {count}개")
-            self.logger.info(f"❌ 총 실패: {len(self.failed_downloads)}개")
-            self.logger.info("=" * 60)
+            self._download_with_browser(driver, download_list, journal)
+            journal.close()
 
+            self._log_summary()
             self._generate_report()
 
         except Exception as e:
@@ -481,6 +777,111 @@ class UijeongbuPolicyDownloader:
             if driver:
                 driver.quit()
 
+    def run_http(self, max_workers=4, min_interval=0.25, check_upstream=False):
+        """브라우저 없이 goFile 요청을 직접 보내 병렬 다운로드 (실패한 파일만 브라우저로 재시도)
+
+        check_upstream=True면 저널에 완료로 기록된 파일도 조건부 요청으로 서버 변경 여부를 다시 확인한다.
+        """
+        self.logger.info("=" * 60)
+        self.logger.info("의정부시 정책 문서 자동 다운로드 시작")
+        self.logger.info(f"⚡ HTTP 직접 다운로드 방식 (동시 {max_workers}개)")
+        self.logger.info("=" * 60)
+
+        session = self._create_session(pool_size=max_workers)
+
+        try:
+            response = session.get(self.url, timeout=20)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.logger.warning(f"정적 페이지 요청 실패, 브라우저 방식으로 전환: {e}")
+            return self.run()
+
+        download_list = self._extract_download_links_from_html(response.text)
+        endpoint = self.gofile_endpoint or self._resolve_gofile_endpoint(response.text, session)
+
+        if not download_list or not endpoint:
+            self.logger.warning("정적 HTML에서 goFile 링크 또는 요청 형식을 찾지 못해 브라우저 방식으로 전환합니다.")
+            return self.run()
+
+        self.logger.info(f"goFile 요청 형식: {endpoint['method']} {endpoint['url']} {endpoint['params']}")
+
+        journal = DownloadJournal(os.path.join(self.download_dir, ".download_journal.jsonl"))
+        manifest = DownloadManifest(os.path.join(self.download_dir, "download_manifest.json"))
+
+        # 저널 완료 기록은 서버 파일이 바뀌어도 남아 있으므로, 변경 확인 시에는 매니페스트 검증에 맡김
+        if not check_upstream:
+            remaining = [
+                info for info in download_list if not journal.is_done(document_key(info["category"], info["filename"]))
+            ]
+            if len(remaining) < len(download_list):
+                self.logger.info(f"이미 완료된 파일: {len(download_list) - len(remaining)}개")
+            download_list = remaining
+
+        self.logger.info(f"총 {len(download_list)}개 파일 다운로드 시작")
+
+        rate_limiter = HostRateLimiter(min_interval)
+        browser_retry = []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._download_file_http,
+                    session,
+                    endpoint,
+                    info,
+                    manifest,
+                    rate_limiter,
+                    check_upstream=check_upstream,
+                ): info
+                for info in download_list
+            }
+            for future in as_completed(futures):
+                info = futures[future]
+                try:
+                    path = future.result()
+                    journal.mark_done(document_key(info["category"], info["filename"]), path=path)
+                    self.logger.info(f"다운로드 완료: [{info['policy_number']}] {os.path.basename(path)}")
+                except Exception as e:
+                    self.logger.warning(f"HTTP 다운로드 실패 (브라우저로 재시도 예정): {info['filename']} - {e}")
+                    browser_retry.append(info)
+
+        manifest.save()
+
+        if browser_retry:
+            self.logger.info(f"브라우저로 재시도: {len(browser_retry)}개")
+            driver = None
+            handled = set()
+            try:
+                driver = self._setup_webdriver()
+                driver.get(self.url)
+                WebDriverWait(driver, 30).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+                time.sleep(5)
+                browser_retry.sort(key=lambda info: info["index"])
+                self._download_with_browser(driver, browser_retry, journal, handled)
+            except Exception as e:
+                self.logger.error(f"브라우저 재시도 중 오류: {e}")
+                # 중단 전에 이미 받았거나 실패로 기록된 항목은 그대로 두고, 시도하지 못한 항목만 실패 처리
+                for info in browser_retry:
+                    if document_key(info["category"], info["filename"]) in handled:
+                        continue
+                    self.failed_downloads.append(
+                        {
+                            "filename": info["filename"],
+                            "business_name": info["business_name"],
+                            "doc_type": info["doc_type"],
+                            "error": str(e),
+                        }
+                    )
+                    journal.mark_failed(document_key(info["category"], info["filename"]), e)
+            finally:
+                if driver:
+                    driver.quit()
+
+        journal.close()
+
+        self._log_summary()
+        self._generate_report()
+
 
 def main():
     print("🏛️ 의정부시 정책 문서 자동 다운로더")
@@ -499,6 +900,14 @@ def main():
     test_mode = input("테스트 모드로 실행하시겠습니까? (10개 파일만, y/n): ").lower().strip()
     max_files = 10 if test_mode == "y" else None
 
+    http_mode = input("HTTP 직접 다운로드(병렬)로 실행하시겠습니까? (y/n, 기본값: y): ").lower().strip()
+    http_mode = http_mode != "n"
+
+    check_upstream = False
+    if http_mode:
+        check_upstream = input("받은 파일도 서버 변경 여부를 재확인하시겠습니까? (y/n, 기본값: n): ").lower().strip()
+        check_upstream = check_upstream == "y"
+
     print(f"\n🚀 다운로드를 시작합니다...")
     if max_files:
         print(f"📊 테스트 모드: 최대 {max_files}개 파일")
@@ -511,7 +920,10 @@ def main():
         downloader = UijeongbuPolicyDownloader(
             download_dir=download_dir, show_browser=show_browser, max_files=max_files
         )
-        downloader.run()
+        if http_mode:
+            downloader.run_http(check_upstream=check_upstream)
+        else:
+            downloader.run()
 
         print(f"\n🎉 다운로드 완료!")
         print(f"📂 결과 확인: '{download_dir}' 폴더")
@@ -0,0 +1,183 @@
+"""
+22대 의원 위원회/보좌진 역색인
+
+22대 명부의 '소속 위원회 목록', '보좌관', '선임비서관', '비서관'은 쉼표로 이어진 문자열이다.
+명부를 읽을 때 한 번만 펼쳐 정규화한 조회 테이블과 역색인을 만든다.
+
+    committee_table  [committee, person_id]           (위원회명은 공백 제거)
+    staff_table      [staff, role, person_id]         (role: 보좌관/선임비서관/비서관)
+    committee → person_id 튜플,  보좌진 이름 → (person_id, role) 튜플
+    person_id → 위원회 튜플,     person_id → (보좌진 이름, role) 튜플
+
+기사 본문의 "국방위", "법사위" 같은 약칭도 같은 위원회로 찾도록 별칭을 함께 색인하며,
+mention_detector는 위원회 별칭을 동명이인 구분 문맥으로, 보좌진 이름을 의원 귀속 패턴으로 쓴다.
+
+사용 예:
+    entities = EntityIndex.from_registry()
+    entities.members_of("국방위")           # (person_id, ...)
+    entities.employers_of("김재삼")          # ((person_id, "보좌관"), ...)
+"""
+
+import re
+import sys
+
+import pandas as pd
+
+from lawmaker_identity import resolve_identities
+
+CURRENT_TERM = 22
+STAFF_ROLES = {"aides": "보좌관", "senior_secretaries": "선임비서관", "secretaries": "비서관"}
+STAFF_NAME_RE = re.compile(r"^[가-힣]{2,4}$")
+
+# 언론에서 주로 쓰는 상임위 약칭 (일반 규칙 "OO위원회" → "OO위"로 만들 수 없는 것)
+COMMITTEE_ABBREVIATIONS = {
+    "법제사법위원회": ["법사위"],
+    "기획재정위원회": ["기재위"],
+    "과학기술정보방송통신위원회": ["과방위"],
+    "국회운영위원회": ["운영위"],
+    "외교통일위원회": ["외통위"],
+    "행정안전위원회": ["행안위"],
+    "문화체육관광위원회": ["문체위"],
+    "농림축산식품해양수산위원회": ["농해수위"],
+    "산업통상자원중소벤처기업위원회": ["산자위", "산자중기위"],
+    "보건복지위원회": ["복지위"],
+    "환경노동위원회": ["환노위"],
+    "국토교통위원회": ["국토위"],
+    "여성가족위원회": ["여가위"],
+    "예산결산특별위원회": ["예결위"],
+}
+
+
+def normalize_committee(name):
+    return re.sub(r"\s+", "", name or "")
+
+
+def committee_aliases(name):
+    """위원회 정식 명칭 → 본문 검색용 별칭 (정식 명칭 포함)"""
+    name = normalize_committee(name)
+    if not name:
+        return []
+    aliases = [name] + COMMITTEE_ABBREVIATIONS.get(name, [])
+    if name.endswith("특별위원회") and len(name) <= 12:
+        aliases.append(name[: -len("특별위원회")] + "특위")
+    elif name.endswith("위원회") and len(name) <= 9 and not name.endswith("특별위원회"):
+        aliases.append(name[: -len("위원회")] + "위")
+    return list(dict.fromkeys(alias for alias in aliases if len(alias) >= 3))
+
+
+def _explode(frame, column):
+    exploded = frame[["person_id", column]].explode(column).dropna(subset=[column])
+    return exploded.rename(columns={column: "value"})
+
+
+class EntityIndex:
+    def __init__(self, committee_table, staff_table):
+        self.committee_table = committee_table
+        self.staff_table = staff_table
+
+        self.committee_members = {
+            committee: tuple(group["person_id"].tolist())
+            for committee, group in committee_table.groupby("committee", sort=False)
+        }
+        self.member_committees = {
+            int(person_id): tuple(group["committee"].tolist())
+            for person_id, group in committee_table.groupby("person_id", sort=False)
+        }
+        self.alias_committees = {}
+        for committee in self.committee_members:
+            for alias in committee_aliases(committee):
+                self.alias_committees.setdefault(alias, set()).add(committee)
+
+        self.staff_members = {
+            staff: tuple(zip(group["person_id"].tolist(), group["role"].tolist()))
+            for staff, group in staff_table.groupby("staff", sort=False)
+        }
+        self.member_staff = {
+            int(person_id): tuple(zip(group["staff"].tolist(), group["role"].tolist()))
+            for person_id, group in staff_table.groupby("person_id", sort=False)
+        }
+
+    @classmethod
+    def from_registry(cls, lawmakers=None, term=CURRENT_TERM):
+        """명부(person_id 포함)의 해당 대수 행에서 색인 구성"""
+        if lawmakers is None:
+            lawmakers = resolve_identities()
+        current = lawmakers[lawmakers["term"] == term]
+
+        committees = _explode(current, "committees")
+        committee_table = pd.DataFrame(
+            {"committee": committees["value"].map(normalize_committee), "person_id": committees["person_id"]}
+        )
+        committee_table = committee_table[committee_table["committee"] != ""].drop_duplicates()
+
+        staff_frames = []
+        for column, role in STAFF_ROLES.items():
+            staff = _explode(current, column)
+            staff_frames.append(
+                pd.DataFrame(
+                    {
+                        "staff": staff["value"].str.replace(r"\s+", "", regex=True),
+                        "role": role,
+                        "person_id": staff["person_id"],
+                    }
+                )
+            )
+        staff_table = pd.concat(staff_frames, ignore_index=True)
+        staff_table = staff_table[staff_table["staff"].str.match(STAFF_NAME_RE)].drop_duplicates()
+
+        return cls(
+            committee_table.astype({"person_id": "int64"}).reset_index(drop=True),
+            staff_table.astype({"person_id": "int64"}).reset_index(drop=True),
+        )
+
+    def members_of(self, committee):
+        """위원회 정식 명칭 또는 별칭 → person_id 튜플"""
+        name = normalize_committee(committee)
+        members = self.committee_members.get(name)
+        if members is not None:
+            return members
+        merged = []
+        for full_name in sorted(self.alias_committees.get(name, ())):
+            merged.extend(pid for pid in self.committee_members[full_name] if pid not in merged)
+        return tuple(merged)
+
+    def committees_of(self, person_id):
+        return self.member_committees.get(int(person_id), ())
+
+    def employers_of(self, staff):
+        """보좌진 이름 → ((person_id, role), ...)"""
+        return self.staff_members.get(re.sub(r"\s+", "", staff or ""), ())
+
+    def staff_of(self, person_id):
+        return self.member_staff.get(int(person_id), ())
+
+    def committee_contexts(self):
+        """{별칭: {person_id, ...}} (언급 탐지 문맥 토큰)"""
+        return {alias: set(self.members_of(alias)) for alias in self.alias_committees}
+
+    def staff_patterns(self):
+        """{보좌진 이름: {person_id, ...}} (언급 탐지 귀속 패턴)"""
+        return {staff: {person_id for person_id, _ in employers} for staff, employers in self.staff_members.items()}
+
+
+def main():
+    lawmakers = resolve_identities()
+    entities = EntityIndex.from_registry(lawmakers)
+    names = lawmakers.drop_duplicates("person_id", keep="last").set_index("person_id")["name"]
+
+    shared = sum(1 for employers in entities.staff_members.values() if len({pid for pid, _ in employers}) > 1)
+    print(f"🏛️ 위원회 {len(entities.committee_members)}개 (별칭 {len(entities.alias_committees)}개)")
+    print(
+        f"👥 보좌진 {len(entities.staff_table)}건, 이름 {len(entities.staff_members)}개 (여러 의원실 동명 {shared}개)"
+    )
+
+    for query in sys.argv[1:]:
+        members = entities.members_of(query)
+        if members:
+            print(f"\n[{query}] 위원 {len(members)}명: {', '.join(names[pid] for pid in members)}")
+        for person_id, role in entities.employers_of(query):
+            print(f"\n[{query}] {names[person_id]} 의원실 {role}")
+
+
+if __name__ == "__main__":
+    main()
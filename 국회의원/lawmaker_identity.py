@@ -0,0 +1,222 @@
+"""
+국회의원 대수 간 동일인 식별 (해시 조인 + 영구 person_id)
+
+20·21·22대 명부에는 공통 ID가 없어 이름/한자명/생년월일과 '대별 및 소속정당(단체)' 문자열만으로
+같은 사람을 찾아야 한다. 명부(lawmaker_registry)의 고유 키 (이름, 한자명, 생년월일)를 해시 조인으로
+묶되, 실제 데이터의 흔들림을 두 단계 보조 조인으로 흡수한다.
+
+    1. (이름, 한자명, 생년월일) 완전 일치
+    2. (이름, 생년월일) 일치 — 한자명 결측/오기 (예: 22대 한자명 표기 차이)
+    3. (이름, 한자명) 일치 + 생년월일 차이 1년 이내 — 음력/양력 표기 차이
+
+같은 대수에 함께 재직한 키는 동명이인이므로 2·3단계에서 묶지 않는다(예: 21대 김병욱 두 명).
+person_id는 lawmaker_ids.json에 키별로 저장해 두므로 명부가 갱신되어도 기존 의원의 ID는 바뀌지 않고,
+공약/뉴스 조인은 문자열 매칭 대신 정수 키로 할 수 있다.
+
+대별 이력 문자열("제17대국회의원(울산울주) 열린우리당 … 제20대국회의원(울산울주) 무소속")은
+str.extractall 한 번으로 (person_id, term, district, party) 행으로 펼친다.
+
+사용 예:
+    lawmakers = resolve_identities()           # 명부 + person_id 컬럼
+    history = term_history(lawmakers)          # 인물별 대수 이력
+    roster = people(lawmakers)                 # 인물당 한 행
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from lawmaker_registry import AFFILIATION_RE, BASE_DIR, load_registry
+
+ID_PATH = os.path.join(BASE_DIR, "lawmaker_ids.json")
+KEY_COLUMNS = ["name", "name_hanja", "birth_date"]
+MAX_BIRTH_GAP = pd.Timedelta(days=366)
+ELECTED_TERM_RE = r"제\s*(?P<term>\d+)\s*대"
+
+
+def identity_key(name, name_hanja, birth_date):
+    """영구 ID 저장용 문자열 키"""
+    hanja = "" if pd.isna(name_hanja) else name_hanja
+    birth = "" if pd.isna(birth_date) else pd.Timestamp(birth_date).strftime("%Y-%m-%d")
+    return f"{name}|{hanja}|{birth}"
+
+
+class PersonIdStore:
+    """identity_key → person_id 영구 저장소"""
+
+    def __init__(self, path=ID_PATH):
+        self.path = path
+        self.ids = {}
+        self.next_id = 1
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.ids = data.get("ids", {})
+            self.next_id = data.get("next_id", max(self.ids.values(), default=0) + 1)
+        self.dirty = False
+
+    def get(self, key):
+        return self.ids.get(key)
+
+    def assign(self, keys):
+        """같은 사람의 키 목록 → person_id (기존 ID 중 가장 작은 값, 없으면 새 ID)"""
+        known = [self.ids[key] for key in keys if key in self.ids]
+        if known:
+            person_id = min(known)
+        else:
+            person_id = self.next_id
+            self.next_id += 1
+        for key in keys:
+            if self.ids.get(key) != person_id:
+                self.ids[key] = person_id
+                self.dirty = True
+        return person_id
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"next_id": self.next_id, "ids": self.ids}, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _candidate_pairs(keys, on):
+    """고유 키 테이블 자기 조인 (on 컬럼 일치, 서로 다른 키 쌍)"""
+    valid = keys.dropna(subset=on)
+    pairs = valid.merge(valid, on=on, suffixes=("_a", "_b"))
+    return pairs[pairs["key_id_a"] < pairs["key_id_b"]]
+
+
+def _cluster_keys(registry):
+    """고유 키 테이블과 키별 클러스터 번호"""
+    keys = registry[KEY_COLUMNS].drop_duplicates().reset_index(drop=True)
+    keys["key_id"] = np.arange(len(keys))
+
+    # 키별 재직 대수 (같은 대수에 함께 있으면 다른 사람)
+    record_keys = registry[KEY_COLUMNS + ["term"]].merge(keys, on=KEY_COLUMNS, how="left")
+    terms = record_keys.groupby("key_id")["term"].agg(frozenset).to_dict()
+
+    parent = list(range(len(keys)))
+    members = {i: set(terms.get(i, ())) for i in range(len(keys))}
+
+    def union(a, b):
+        root_a, root_b = _find(parent, a), _find(parent, b)
+        if root_a == root_b or members[root_a] & members[root_b]:
+            return
+        parent[root_b] = root_a
+        members[root_a] |= members.pop(root_b)
+
+    same_birth = _candidate_pairs(keys, ["name", "birth_date"])
+    for a, b in zip(same_birth["key_id_a"], same_birth["key_id_b"]):
+        union(a, b)
+
+    same_hanja = _candidate_pairs(keys, ["name", "name_hanja"])
+    gap = (same_hanja["birth_date_a"] - same_hanja["birth_date_b"]).abs()
+    same_hanja = same_hanja[gap <= MAX_BIRTH_GAP]
+    for a, b in zip(same_hanja["key_id_a"], same_hanja["key_id_b"]):
+        union(a, b)
+
+    keys["cluster"] = [_find(parent, i) for i in range(len(keys))]
+    return keys
+
+
+def resolve_identities(registry=None, id_path=ID_PATH, save=True):
+    """명부에 person_id(int64) 컬럼을 붙여 반환"""
+    if registry is None:
+        registry = load_registry()
+
+    keys = _cluster_keys(registry)
+    keys["identity_key"] = [
+        identity_key(name, hanja, birth)
+        for name, hanja, birth in zip(keys["name"], keys["name_hanja"], keys["birth_date"])
+    ]
+
+    store = PersonIdStore(id_path)
+    cluster_ids = {}
+    # 클러스터는 첫 등장 순서(대수 오름차순 명부 순)로 ID를 받는다
+    for cluster, group in keys.groupby("cluster", sort=False):
+        cluster_ids[cluster] = store.assign(group["identity_key"].tolist())
+    keys["person_id"] = keys["cluster"].map(cluster_ids).astype("int64")
+
+    if save:
+        store.save()
+
+    resolved = registry.merge(keys[KEY_COLUMNS + ["person_id"]], on=KEY_COLUMNS, how="left")
+    return resolved
+
+
+def term_history(lawmakers):
+    """인물별 대수 이력 [person_id, term, district, party] (대수당 한 행)"""
+    frames = []
+    # extractall 결과의 0번 인덱스 레벨은 원래 행의 라벨이므로 위치가 아니라 라벨로 찾음 (필터링된 명부 대응)
+    person_ids = lawmakers["person_id"]
+
+    # 1. 20·21대 '대별 및 소속정당(단체)' 문자열 (벡터화 파싱)
+    affiliations = lawmakers["affiliations"].dropna()
+    if len(affiliations):
+        parsed = affiliations.str.extractall(AFFILIATION_RE.pattern)
+        parsed.columns = ["term", "district", "party"]
+        parsed["person_id"] = person_ids.reindex(parsed.index.get_level_values(0)).to_numpy()
+        frames.append(parsed.reset_index(drop=True))
+
+    # 2. 명부 행 자체 (해당 대수의 선거구/정당)
+    frames.append(lawmakers[["person_id", "term", "district", "party"]])
+
+    # 3. 22대 '당선' 컬럼 ("제21대, 제22대") — 선거구/정당 정보 없음
+    elected = lawmakers["elected"].dropna()
+    if len(elected):
+        terms = elected.str.extractall(ELECTED_TERM_RE)
+        terms["person_id"] = person_ids.reindex(terms.index.get_level_values(0)).to_numpy()
+        frames.append(terms.reset_index(drop=True))
+
+    history = pd.concat(frames, ignore_index=True)
+    history["term"] = pd.to_numeric(history["term"]).astype("int16")
+    for column in ("district", "party"):
+        history[column] = history[column].astype("string").str.strip().replace("", pd.NA)
+
+    # 같은 대수는 선거구/정당이 채워진 행 우선
+    history["filled"] = history[["district", "party"]].notna().sum(axis=1)
+    history = history.sort_values(["person_id", "term", "filled"], ascending=[True, True, False], kind="stable")
+    history = history.drop_duplicates(["person_id", "term"]).drop(columns="filled")
+    return history.reset_index(drop=True)[["person_id", "term", "district", "party"]]
+
+
+def people(lawmakers):
+    """인물당 한 행 (가장 최근 대수의 명부 기준) + 재직 대수 목록"""
+    latest = lawmakers.sort_values("term").drop_duplicates("person_id", keep="last")
+    roster = latest.set_index("person_id")[["name", "name_hanja", "birth_date", "party", "district"]]
+    roster["terms"] = lawmakers.groupby("person_id")["term"].agg(lambda terms: sorted(set(terms)))
+    return roster.sort_index()
+
+
+def main():
+    lawmakers = resolve_identities()
+    roster = people(lawmakers)
+    history = term_history(lawmakers)
+
+    multi_term = roster[roster["terms"].map(len) > 1]
+    print(f"👤 명부 {len(lawmakers)}건 → 인물 {len(roster)}명 (2개 대수 이상 {len(multi_term)}명)")
+    print(f"📜 대수 이력 {len(history)}행 (제{history['term'].min()}대 ~ 제{history['term'].max()}대)")
+
+    if len(sys.argv) > 1:
+        for name in sys.argv[1:]:
+            for person_id, row in roster[roster["name"] == name].iterrows():
+                print(f"\n[{person_id}] {row['name']}({row['name_hanja']}) {row['birth_date']:%Y-%m-%d}")
+                for _, h in history[history["person_id"] == person_id].iterrows():
+                    print(f"  제{h['term']}대 {h['district']} {h['party']}")
+
+
+if __name__ == "__main__":
+    main()
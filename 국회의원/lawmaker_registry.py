@@ -0,0 +1,275 @@
+"""
+국회의원 명부 로더 (20·21·22대 CSV → 단일 타입 테이블 + 바이너리 캐시)
+
+국회의원 CSV는 CP949 인코딩에 스키마가 두 가지다.
+    20대/21대 : 대수, 대별, 대별 및 소속정당(단체), 이름, 이름(한자), 생년월일("1942년 06월 05일"), ...
+                결측값은 문자열 "null"
+    22대      : 이름, 한자명, 영문명칭, 생년월일("1967-05-02"), 정당명, 선거구, 소속 위원회 목록, 보좌관, ...
+
+모든 대수를 한 번 파싱해 같은 컬럼의 테이블로 합치고(날짜는 datetime, 결측은 NA, 목록은 리스트),
+Arrow(Feather) 파일로 캐시한다. 캐시 메타데이터에 원본 CSV의 mtime/크기를 기록해 두고
+원본이 바뀌었을 때만 다시 파싱하므로, 이후 프로세스는 CP949 디코딩 없이 mmap으로 바로 읽는다.
+
+컬럼:
+    term(int16) name name_hanja name_en birth_date(datetime64) party district gender
+    committees(list) aides(list) senior_secretaries(list) secretaries(list) elected affiliations profile_url homepage email source
+
+사용 예:
+    lawmakers = load_registry()                # 전체 (캐시 사용)
+    current = load_term(22)                    # 22대만
+    lawmakers[lawmakers["party"] == "국민의힘"]
+"""
+
+import json
+import os
+import re
+import sys
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_NAME = "lawmakers.feather"
+CACHE_VERSION = 2
+ENCODING = "cp949"
+
+SOURCES = {
+    20: "20대국회의원현황.csv",
+    21: "21대국회의원현황.csv",
+    22: "22대국회의원현황.csv",
+}
+
+COLUMNS = [
+    "term",
+    "name",
+    "name_hanja",
+    "name_en",
+    "birth_date",
+    "party",
+    "district",
+    "gender",
+    "committees",
+    "aides",
+    "senior_secretaries",
+    "secretaries",
+    "elected",
+    "affiliations",
+    "profile_url",
+    "homepage",
+    "email",
+    "source",
+]
+LIST_COLUMNS = ["committees", "aides", "senior_secretaries", "secretaries"]
+STRING_COLUMNS = [column for column in COLUMNS if column not in ["term", "birth_date"] + LIST_COLUMNS]
+
+# 20대/21대 스키마 → 공통 컬럼
+LEGACY_COLUMNS = {
+    "이름": "name",
+    "이름(한자)": "name_hanja",
+    "생년월일": "birth_date",
+    "대별 및 소속정당(단체)": "affiliations",
+    "회원정보 확인 헌정회 홈페이지 URL": "profile_url",
+}
+
+# 22대 스키마 → 공통 컬럼
+CURRENT_COLUMNS = {
+    "이름": "name",
+    "한자명": "name_hanja",
+    "영문명칭": "name_en",
+    "생년월일": "birth_date",
+    "정당명": "party",
+    "선거구": "district",
+    "성별": "gender",
+    "소속 위원회 목록": "committees",
+    "보좌관": "aides",
+    "선임비서관": "senior_secretaries",
+    "비서관": "secretaries",
+    "당선": "elected",
+    "홈페이지": "homepage",
+    "이메일": "email",
+}
+
+# "제20대국회의원(울산울주) 무소속" 한 구간 ("재21대", "21대(비례대표)국민의힘" 같은 오타/생략 포함)
+AFFILIATION_RE = re.compile(
+    r"(?:[제재]\s*)?(\d+)\s*대?\s*(?:국회의원)?\s*\(([^)]*)\)\s*(.*?)\s*(?=(?:[제재]\s*)?\d+\s*대|$)"
+)
+
+
+def parse_affiliations(text):
+    """'대별 및 소속정당(단체)' 문자열 → [(대수, 선거구, 정당), ...]"""
+    if not isinstance(text, str):
+        return []
+    history = []
+    for term, district, party in AFFILIATION_RE.findall(text.strip()):
+        history.append((int(term), district.strip() or None, party.strip() or None))
+    if not history:
+        # "(전북전주시 을) 진보당"처럼 대수가 빠진 단일 구간
+        match = re.match(r"\s*\(([^)]*)\)\s*(.*)", text)
+        if match:
+            history.append((None, match.group(1).strip() or None, match.group(2).strip() or None))
+    return history
+
+
+def _term_affiliation(text, term):
+    """해당 대수의 (선거구, 정당), 대수 표기가 없으면 마지막 구간"""
+    history = parse_affiliations(text)
+    for entry_term, district, party in reversed(history):
+        if entry_term == term:
+            return district, party
+    if history and history[-1][0] is None:
+        return history[-1][1], history[-1][2]
+    return None, None
+
+
+def _split_list(value):
+    if not isinstance(value, str):
+        return []
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _read_csv(path):
+    # "null"은 pandas 기본 결측 표기에 포함되어 NA로 읽힌다
+    return pd.read_csv(path, encoding=ENCODING, dtype=str, keep_default_na=True)
+
+
+def _parse_legacy(path, term):
+    raw = _read_csv(path)
+    frame = raw[list(LEGACY_COLUMNS)].rename(columns=LEGACY_COLUMNS)
+    frame["term"] = pd.to_numeric(raw["대수"], errors="coerce").fillna(term)
+    frame["birth_date"] = pd.to_datetime(frame["birth_date"], format="%Y년 %m월 %d일", errors="coerce")
+
+    district_party = [_term_affiliation(text, term) for text in frame["affiliations"]]
+    frame["district"] = [district for district, _ in district_party]
+    frame["party"] = [party for _, party in district_party]
+    for column in LIST_COLUMNS:
+        frame[column] = [[] for _ in range(len(frame))]
+    return frame
+
+
+def _parse_current(path, term):
+    raw = _read_csv(path)
+    frame = raw[list(CURRENT_COLUMNS)].rename(columns=CURRENT_COLUMNS)
+    frame["term"] = term
+    frame["birth_date"] = pd.to_datetime(frame["birth_date"], format="%Y-%m-%d", errors="coerce")
+    for column in LIST_COLUMNS:
+        frame[column] = frame[column].map(_split_list)
+    return frame
+
+
+PARSERS = {20: _parse_legacy, 21: _parse_legacy, 22: _parse_current}
+
+
+def _normalize(frame, source):
+    frame = frame.copy()
+    frame["source"] = source
+    for column in COLUMNS:
+        if column not in frame:
+            frame[column] = None
+    frame = frame[COLUMNS]
+
+    for column in STRING_COLUMNS:
+        frame[column] = frame[column].astype("string").str.strip().replace("", pd.NA)
+    frame["term"] = frame["term"].astype("int16")
+    frame["birth_date"] = frame["birth_date"].astype("datetime64[ns]")
+    return frame
+
+
+def parse_registry(base_dir=BASE_DIR, sources=SOURCES):
+    """원본 CSV 전체를 파싱해 공통 스키마 DataFrame으로 반환 (캐시 미사용)"""
+    frames = []
+    for term, filename in sorted(sources.items()):
+        path = os.path.join(base_dir, filename)
+        if not os.path.exists(path):
+            print(f"⚠️ 명부 파일 없음: {filename}")
+            continue
+        frames.append(_normalize(PARSERS[term](path, term), filename))
+
+    if not frames:
+        return _normalize(pd.DataFrame(columns=COLUMNS), "")
+    return pd.concat(frames, ignore_index=True)
+
+
+def _source_signature(base_dir, sources):
+    signature = {}
+    for term, filename in sorted(sources.items()):
+        path = os.path.join(base_dir, filename)
+        if os.path.exists(path):
+            stat = os.stat(path)
+            signature[filename] = [stat.st_mtime_ns, stat.st_size]
+    return {"version": CACHE_VERSION, "sources": signature}
+
+
+def _read_cache(cache_path, signature):
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        table = feather.read_table(cache_path, memory_map=True)
+    except (OSError, pa.ArrowInvalid):
+        return None
+
+    metadata = table.schema.metadata or {}
+    cached = metadata.get(b"registry")
+    if cached is None or json.loads(cached) != signature:
+        return None
+
+    frame = table.to_pandas()
+    for column in LIST_COLUMNS:
+        frame[column] = frame[column].map(list)
+    return frame
+
+
+def _write_cache(frame, cache_path, signature):
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[b"registry"] = json.dumps(signature).encode("utf-8")
+    table = table.replace_schema_metadata(metadata)
+
+    # 임시 파일에 쓴 뒤 교체 (읽는 중인 다른 프로세스에 영향 없음)
+    tmp_path = f"{cache_path}.tmp"
+    feather.write_feather(table, tmp_path, compression="uncompressed")
+    os.replace(tmp_path, cache_path)
+
+
+def load_registry(base_dir=BASE_DIR, cache_path=None, refresh=False, sources=SOURCES):
+    """국회의원 명부 DataFrame (원본 CSV가 그대로면 캐시에서 로드)"""
+    cache_path = cache_path or os.path.join(base_dir, CACHE_NAME)
+    signature = _source_signature(base_dir, sources)
+
+    if not refresh:
+        frame = _read_cache(cache_path, signature)
+        if frame is not None:
+            return frame
+
+    frame = parse_registry(base_dir, sources)
+    try:
+        _write_cache(frame, cache_path, signature)
+    except OSError as e:
+        print(f"⚠️ 명부 캐시 저장 실패: {e}")
+    return frame
+
+
+def load_term(term, **kwargs):
+    """특정 대수의 의원만"""
+    frame = load_registry(**kwargs)
+    return frame[frame["term"] == term].reset_index(drop=True)
+
+
+def main():
+    refresh = "--refresh" in sys.argv[1:]
+
+    start = time.perf_counter()
+    lawmakers = load_registry(refresh=refresh)
+    elapsed = time.perf_counter() - start
+
+    print(f"📋 국회의원 명부 {len(lawmakers)}명 로드 ({elapsed * 1000:.1f}ms)")
+    for term, group in lawmakers.groupby("term"):
+        print(
+            f"  제{term}대: {len(group)}명, 정당 미상 {group['party'].isna().sum()}명, "
+            f"선거구 미상 {group['district'].isna().sum()}명, 생년월일 미상 {group['birth_date'].isna().sum()}명"
+        )
+
+
+if __name__ == "__main__":
+    main()
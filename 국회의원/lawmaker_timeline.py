@@ -0,0 +1,356 @@
+"""
+국회의원별 주간 보도 타임라인 (구체화 뷰 + 증분 갱신)
+
+"의원 X의 주별·언론사별 보도량" 같은 질의를 결과 CSV 전체 재검색 없이 답하기 위해
+언급 테이블(mention_detector)을 (person_id, 주) 단위로 미리 집계해 SQLite에 저장한다.
+
+    timeline          (person_id, week) → 언급 수, 기사 수
+    timeline_outlets  (person_id, week, outlet) → 기사 수, 언급 수
+    timeline_top      (person_id, week) → 언급이 많은 기사 상위 top_n개
+
+크롤링 배치가 들어올 때마다 처음 보는 기사(URL 또는 언론사|제목|날짜 키)에만 언급 탐지를 돌리고
+집계값에 더한다(UPSERT). 조회는 기본 키 범위 검색이라 코퍼스 크기와 무관하다.
+week는 해당 주 월요일 날짜("2024-05-13"), 날짜를 해석할 수 없는 기사는 집계에서 제외한다.
+
+사용 예:
+    timeline = LawmakerTimeline("lawmaker_timeline.sqlite3")
+    timeline.ingest_csv(glob.glob("../news_crawling/rss/results/*.csv"))
+    timeline.timeline(person_id, "2024-01-01", "2024-12-31")
+    timeline.outlets(person_id, "2024-05-13")
+"""
+
+import glob
+import os
+import sqlite3
+import sys
+import time
+
+import pandas as pd
+
+from lawmaker_identity import resolve_identities
+from mention_detector import MentionDetector
+
+DEFAULT_DB_PATH = "lawmaker_timeline.sqlite3"
+# 날짜 컬럼은 크롤러마다 형식이 달라 RSS pubDate("…+0900", "… GMT")와 시간대 없는 값이 섞인다
+LOCAL_TZ = "Asia/Seoul"
+TZ_SUFFIX_RE = r"(?:[+-]\d{2}:?\d{2}|\b(?:GMT|UTC)|\dZ)$"
+TOP_N = 10
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    batch_id TEXT PRIMARY KEY,
+    ingested_at INTEGER NOT NULL,
+    articles INTEGER NOT NULL,
+    mentions INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS articles (
+    article_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    article_key TEXT NOT NULL UNIQUE,
+    outlet TEXT,
+    title TEXT,
+    published TEXT,
+    url TEXT
+);
+CREATE TABLE IF NOT EXISTS timeline (
+    person_id INTEGER NOT NULL,
+    week TEXT NOT NULL,
+    mentions INTEGER NOT NULL,
+    articles INTEGER NOT NULL,
+    PRIMARY KEY (person_id, week)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS timeline_outlets (
+    person_id INTEGER NOT NULL,
+    week TEXT NOT NULL,
+    outlet TEXT NOT NULL,
+    articles INTEGER NOT NULL,
+    mentions INTEGER NOT NULL,
+    PRIMARY KEY (person_id, week, outlet)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS timeline_top (
+    person_id INTEGER NOT NULL,
+    week TEXT NOT NULL,
+    article_id INTEGER NOT NULL,
+    mentions INTEGER NOT NULL,
+    PRIMARY KEY (person_id, week, article_id)
+) WITHOUT ROWID;
+"""
+
+
+def parse_published(values):
+    """날짜 문자열 → 시간대 없는 KST datetime Series (시간대 없는 값은 KST로 간주, 실패는 NaT)"""
+    text = pd.Series(values).astype("string").str.strip()
+    aware = text.str.contains(TZ_SUFFIX_RE, regex=True).fillna(False).astype(bool)
+    parts = []
+    if aware.any():
+        converted = pd.to_datetime(text[aware], errors="coerce", format="mixed", utc=True)
+        parts.append(converted.dt.tz_convert(LOCAL_TZ).dt.tz_localize(None))
+    if (~aware).any():
+        parts.append(pd.to_datetime(text[~aware], errors="coerce", format="mixed"))
+    if not parts:
+        return pd.Series(pd.NaT, index=text.index, dtype="datetime64[ns]")
+    return pd.concat(parts).reindex(text.index)
+
+
+def week_start(dates):
+    """datetime Series → 주 시작(월요일) 문자열 Series"""
+    days = dates.dt.normalize() - pd.to_timedelta(dates.dt.weekday, unit="D")
+    return days.dt.strftime("%Y-%m-%d")
+
+
+def _article_frame(articles):
+    """결과 CSV DataFrame → 표준 컬럼 (key, outlet, title, published, url, text)"""
+    frame = articles.fillna("")
+    for column in ("언론사", "제목", "날짜", "본문", "URL"):
+        if column not in frame.columns:
+            frame = frame.assign(**{column: ""})
+
+    # 크롤러마다 다른 컬럼 이름 (kbs/조선/중앙 등은 언론사명, factcheck는 본문내용) — 빈 값만 행별로 대체
+    for column, alias in (("언론사", "언론사명"), ("본문", "본문내용")):
+        if alias in frame.columns:
+            frame = frame.assign(**{column: frame[column].where(frame[column] != "", frame[alias])})
+
+    keys = frame["언론사"] + "|" + frame["제목"] + "|" + frame["날짜"]
+    keys = frame["URL"].where(frame["URL"] != "", keys)
+    return pd.DataFrame(
+        {
+            "key": keys,
+            "outlet": frame["언론사"],
+            "title": frame["제목"],
+            "published": frame["날짜"],
+            "url": frame["URL"],
+            "text": frame["제목"] + "\n" + frame["본문"],
+        }
+    ).drop_duplicates("key")
+
+
+class LawmakerTimeline:
+    def __init__(self, db_path=DEFAULT_DB_PATH, detector=None, top_n=TOP_N, processes=1):
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript(SCHEMA)
+        self._detector = detector
+        self.top_n = top_n
+        self.processes = processes
+
+    @property
+    def detector(self):
+        if self._detector is None:
+            self._detector = MentionDetector.from_registry()
+        return self._detector
+
+    # ------------------------------------------------------------------
+    # 증분 갱신
+    # ------------------------------------------------------------------
+    def _register_articles(self, frame):
+        """처음 보는 기사만 등록하고 article_id를 붙여 반환"""
+        existing = set()
+        keys = frame["key"].tolist()
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            existing.update(
+                row[0]
+                for row in self.db.execute(
+                    f"SELECT article_key FROM articles WHERE article_key IN ({placeholders})", chunk
+                )
+            )
+
+        new = frame[~frame["key"].isin(existing)].copy()
+        if new.empty:
+            new["article_id"] = pd.Series(dtype="int64")
+            return new
+
+        cursor = self.db.execute("SELECT COALESCE(MAX(article_id), 0) FROM articles")
+        first_id = cursor.fetchone()[0] + 1
+        new["article_id"] = range(first_id, first_id + len(new))
+        self.db.executemany(
+            "INSERT INTO articles (article_id, article_key, outlet, title, published, url) VALUES (?, ?, ?, ?, ?, ?)",
+            new[["article_id", "key", "outlet", "title", "published", "url"]].itertuples(index=False),
+        )
+        return new
+
+    def _apply(self, per_article):
+        """기사별 언급 수 [person_id, article_id, mentions, week, outlet] → 집계 테이블 UPSERT"""
+        cells = per_article.groupby(["person_id", "week"]).agg(
+            mentions=("mentions", "sum"), articles=("article_id", "size")
+        )
+        self.db.executemany(
+            """
+            INSERT INTO timeline (person_id, week, mentions, articles) VALUES (?, ?, ?, ?)
+            ON CONFLICT (person_id, week) DO UPDATE SET
+                mentions = mentions + excluded.mentions, articles = articles + excluded.articles
+            """,
+            ((int(pid), week, int(m), int(a)) for (pid, week), m, a in cells.itertuples(name=None)),
+        )
+
+        outlets = per_article.groupby(["person_id", "week", "outlet"]).agg(
+            articles=("article_id", "size"), mentions=("mentions", "sum")
+        )
+        self.db.executemany(
+            """
+            INSERT INTO timeline_outlets (person_id, week, outlet, articles, mentions) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (person_id, week, outlet) DO UPDATE SET
+                articles = articles + excluded.articles, mentions = mentions + excluded.mentions
+            """,
+            ((int(pid), week, outlet, int(a), int(m)) for (pid, week, outlet), a, m in outlets.itertuples(name=None)),
+        )
+
+        # 상위 기사: 배치 안에서 먼저 top_n개로 줄인 뒤 넣고, 갱신된 셀만 다시 top_n개로 정리
+        top = per_article.sort_values(["mentions", "article_id"], ascending=False)
+        top = top.groupby(["person_id", "week"], sort=False).head(self.top_n)
+        self.db.executemany(
+            "INSERT OR REPLACE INTO timeline_top (person_id, week, article_id, mentions) VALUES (?, ?, ?, ?)",
+            (
+                (int(pid), week, int(aid), int(m))
+                for pid, week, aid, m in top[["person_id", "week", "article_id", "mentions"]].itertuples(index=False)
+            ),
+        )
+
+        self.db.execute("CREATE TEMP TABLE IF NOT EXISTS touched (person_id INTEGER, week TEXT)")
+        self.db.execute("DELETE FROM touched")
+        self.db.executemany(
+            "INSERT INTO touched (person_id, week) VALUES (?, ?)",
+            ((int(pid), week) for pid, week in cells.index),
+        )
+        self.db.execute(
+            """
+            DELETE FROM timeline_top WHERE (person_id, week, article_id) IN (
+                SELECT person_id, week, article_id FROM (
+                    SELECT t.person_id, t.week, t.article_id,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY t.person_id, t.week ORDER BY t.mentions DESC, t.article_id DESC
+                           ) AS rank
+                    FROM timeline_top t JOIN touched USING (person_id, week)
+                ) WHERE rank > ?
+            )
+            """,
+            (self.top_n,),
+        )
+        return len(cells)
+
+    def ingest_frame(self, articles, batch_id=None):
+        """크롤링 배치 DataFrame(언론사/제목/날짜/본문[/URL]) 반영 → (신규 기사 수, 언급 수)"""
+        if batch_id is not None and self.has_batch(batch_id):
+            return 0, 0
+
+        new = self._register_articles(_article_frame(articles))
+        mention_count = 0
+        if not new.empty:
+            mentions = self.detector.detect_frame(new["text"].tolist(), processes=self.processes)
+            mention_count = len(mentions)
+
+            new = new.reset_index(drop=True)
+            new["week"] = week_start(parse_published(new["published"]))
+            per_article = mentions.groupby(["article", "person_id"]).size().rename("mentions").reset_index()
+            per_article = per_article.join(new[["article_id", "week", "outlet"]], on="article")
+            per_article = per_article.dropna(subset=["week"])
+            if not per_article.empty:
+                self._apply(per_article)
+
+        if batch_id is not None:
+            self.db.execute(
+                "INSERT INTO batches (batch_id, ingested_at, articles, mentions) VALUES (?, ?, ?, ?)",
+                (batch_id, int(time.time()), len(new), mention_count),
+            )
+        self.db.commit()
+        return len(new), mention_count
+
+    def ingest_csv(self, paths):
+        """결과 CSV 파일 목록 반영 (같은 파일/수정 시각 조합은 한 번만)"""
+        totals = [0, 0]
+        for path in paths:
+            stat = os.stat(path)
+            batch_id = f"{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+            if self.has_batch(batch_id):
+                continue
+            try:
+                articles = pd.read_csv(path, encoding="utf-8-sig", dtype=str)
+            except Exception as e:
+                print(f"⚠️ CSV 로드 실패 ({path}): {e}")
+                continue
+            new_articles, mentions = self.ingest_frame(articles, batch_id)
+            totals[0] += new_articles
+            totals[1] += mentions
+            print(f"📥 {os.path.basename(path)}: 신규 기사 {new_articles}건, 언급 {mentions}건")
+        return tuple(totals)
+
+    def has_batch(self, batch_id):
+        return self.db.execute("SELECT 1 FROM batches WHERE batch_id = ?", (batch_id,)).fetchone() is not None
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def timeline(self, person_id, start=None, end=None):
+        """[(week, mentions, articles), ...] (주 오름차순)"""
+        return list(
+            self.db.execute(
+                """
+                SELECT week, mentions, articles FROM timeline
+                WHERE person_id = ? AND week >= ? AND week <= ? ORDER BY week
+                """,
+                (int(person_id), start or "", end or "9999"),
+            )
+        )
+
+    def outlets(self, person_id, week):
+        """[(outlet, articles, mentions), ...] (기사 수 내림차순)"""
+        return list(
+            self.db.execute(
+                """
+                SELECT outlet, articles, mentions FROM timeline_outlets
+                WHERE person_id = ? AND week = ? ORDER BY articles DESC, outlet
+                """,
+                (int(person_id), week),
+            )
+        )
+
+    def top_articles(self, person_id, week):
+        """[(article_id, mentions, outlet, title, published, url), ...]"""
+        return list(
+            self.db.execute(
+                """
+                SELECT t.article_id, t.mentions, a.outlet, a.title, a.published, a.url
+                FROM timeline_top t JOIN articles a USING (article_id)
+                WHERE t.person_id = ? AND t.week = ? ORDER BY t.mentions DESC, t.article_id DESC
+                """,
+                (int(person_id), week),
+            )
+        )
+
+    def top_people(self, week, limit=20):
+        """해당 주 보도량 상위 의원 [(person_id, mentions, articles), ...]"""
+        return list(
+            self.db.execute(
+                "SELECT person_id, mentions, articles FROM timeline WHERE week = ? ORDER BY articles DESC LIMIT ?",
+                (week, limit),
+            )
+        )
+
+    def close(self):
+        self.db.close()
+
+
+def main():
+    pattern = os.path.join("..", "news_crawling", "rss", "results", "*.csv")
+    names = sys.argv[1:]
+    if names and ("*" in names[0] or names[0].endswith(".csv")):
+        pattern = names.pop(0)
+
+    lawmakers = resolve_identities()
+    timeline = LawmakerTimeline(detector=MentionDetector.from_registry(lawmakers), processes=os.cpu_count() or 1)
+    try:
+        new_articles, mentions = timeline.ingest_csv(sorted(glob.glob(pattern)))
+        print(f"✅ 반영 완료: 신규 기사 {new_articles}건, 언급 {mentions}건")
+
+        roster = lawmakers.drop_duplicates("person_id", keep="last").set_index("person_id")
+        for name in names:
+            for person_id in roster.index[roster["name"] == name]:
+                print(f"\n📈 {name} ({roster.at[person_id, 'party']}, person_id={person_id})")
+                for week, count, articles in timeline.timeline(person_id):
+                    outlets = ", ".join(f"{o} {a}" for o, a, _ in timeline.outlets(person_id, week)[:3])
+                    print(f"  {week}: 기사 {articles}건, 언급 {count}회 ({outlets})")
+    finally:
+        timeline.close()
+
+
+if __name__ == "__main__":
+    main()
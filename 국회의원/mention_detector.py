@@ -0,0 +1,441 @@
+"""
+기사 본문 국회의원 언급 탐지 (Aho-Corasick 단일 패스 + 동명이인 구분)
+
+의원 이름(한글/한자/영문명칭) 수천 개를 이름마다 `in`/정규식으로 찾으면 O(이름 수 × 코퍼스)가 된다.
+이름과 문맥 토큰(정당명, 선거구 시·군·구, 소속 위원회와 그 약칭)을 하나의 Aho-Corasick 오토마톤으로
+컴파일해 본문을 한 번만 훑고, 이름이 여러 사람(person_id)에 해당하면 주변에 함께 나온 문맥 토큰으로 가린다.
+22대 보좌진 이름(lawmaker_entities)도 같은 오토마톤에 넣어, 바로 앞뒤에 "보좌관/비서관" 직함이 붙은
+경우 해당 의원의 언급으로 귀속한다(via="staff").
+
+    - 한글/한자 이름은 앞 글자가 같은 문자 체계면(단어 중간) 무시: "김민석" ⊂ "이김민석" 방지
+    - 한글 이름 뒤에 한글이 이어지면 조사/직함("은", "의원" 등)일 때만 인정: "김건" ⊂ "김건희", "이용해" 방지
+    - 같은 위치의 이름은 가장 긴 것만, 더 긴 이름 언급 안에 들어간 이름은 제외: "김현" ⊂ "김현정"
+    - 두 글자 이하 한글 이름("이용", "진영")은 일반 단어와 겹치므로 바로 뒤 직함이나
+      window 안의 해당 의원 문맥 토큰(정당/선거구/위원회)이 있을 때만 인정
+    - 영문명칭은 소문자로 비교, 앞뒤가 알파벳이면 무시
+    - 동명이인: 문맥 토큰을 가장 가까운 이름 언급(±window 글자)에 귀속시켜 후보별로 센 뒤
+      → 기사 전체 문맥 토큰 수 → 최근 대수 순. 문맥으로 가리지 못한 경우 ambiguous=True
+
+출력은 (article, person_id, offset, length, ambiguous, via) 행이며, detect_frame은 여러 프로세스로 나눠 처리한다.
+
+사용 예:
+    detector = MentionDetector.from_registry()
+    detector.detect("정성호 더불어민주당 의원(경기 동두천시양주시연천군갑)은 …")
+    mentions = detector.detect_frame(texts, processes=8)
+"""
+
+import bisect
+import glob
+import os
+import re
+import sys
+import time
+from multiprocessing import Pool
+
+import pandas as pd
+
+from lawmaker_entities import EntityIndex
+from lawmaker_identity import resolve_identities, term_history
+
+CONTEXT_WINDOW = 200
+MIN_CONTEXT_LENGTH = 2
+# 문맥 토큰에서 제외 (너무 흔하거나 구분력이 없음)
+CONTEXT_STOPWORDS = {"비례대표", "무소속", "위원회", "특별위원회"}
+# 선거구 "경북포항시남구울릉군" → 포항시, 남구, 울릉군 (+ 포항, 울릉)
+DISTRICT_UNIT_RE = re.compile(r"[가-힣]+?[시군구]")
+PROVINCES = (
+    "서울",
+    "부산",
+    "대구",
+    "인천",
+    "광주",
+    "대전",
+    "울산",
+    "세종",
+    "경기",
+    "강원",
+    "충북",
+    "충남",
+    "전북",
+    "전남",
+    "경북",
+    "경남",
+    "제주",
+)
+PROVINCE_RE = re.compile(r"^(?:%s)(?:특별자치도|특별자치시|특별시|광역시|도)?" % "|".join(PROVINCES))
+# 보좌진 이름은 직함이 바로 붙어 있을 때만 인정 ("김재삼 보좌관", "보좌관 김재삼")
+STAFF_TITLE_AFTER_RE = re.compile(r"\s*(?:수석\s*|선임\s*)?(?:보좌관|비서관|비서)")
+STAFF_TITLE_BEFORE_RE = re.compile(r"(?:보좌관|비서관|비서)\s*$")
+# 이름 바로 뒤 직함 ("이용 의원", "진영 전 장관")
+NAME_TITLE_AFTER_RE = re.compile(
+    r"\s*(?:전\s*|현\s*)?(?:의원|위원장|원내대표|최고위원|대표|당선인|당선자|후보|대변인|의장|부의장|간사|장관|지사|시장)"
+)
+# 이름 뒤에 한글이 붙을 때 허용하는 조사/호칭
+NAME_JOSA_RE = re.compile(
+    r"(?:에게|에겐|께서|한테|으로|이라고|라고|이다|이며|이자|이었|였|씨|님|측|은|는|이|가|을|를|의|와|과|도|만|로|에)"
+)
+SHORT_NAME_LENGTH = 2
+
+NAME = 0
+CONTEXT = 1
+STAFF = 2
+VIA = {NAME: "name", STAFF: "staff"}
+
+
+def _is_hangul(ch):
+    return "가" <= ch <= "힣"
+
+
+def _is_hanja(ch):
+    return "一" <= ch <= "鿿"
+
+
+def district_tokens(district):
+    """선거구 문자열 → 문맥 토큰 (광역 단위, 시·군·구 단위)"""
+    if not isinstance(district, str):
+        return set()
+    tokens = set()
+    for part in re.split(r"[\s·,()]+", district):
+        part = PROVINCE_RE.sub("", part).rstrip("갑을병정무")
+        units = DISTRICT_UNIT_RE.findall(part)
+        if not units:
+            tokens.add(part)
+        for unit in units:
+            tokens.add(unit)
+            tokens.add(unit[:-1])
+    return {token for token in tokens if len(token) >= MIN_CONTEXT_LENGTH and token not in CONTEXT_STOPWORDS}
+
+
+class AhoCorasick:
+    """문자열 집합 다중 검색 오토마톤 (순수 파이썬)"""
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                next_state = self.goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][ch] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = next_state
+            self.output[state] = self.output[state] + (index,)
+
+        # 실패 링크 (BFS), 출력은 실패 링크를 따라 미리 합쳐 둔다
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for ch, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                if self.output[self.fail[next_state]]:
+                    self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def iter(self, text):
+        """(끝 위치, 패턴 번호) 생성 (끝 위치는 마지막 글자 인덱스)"""
+        goto, fail, output = self.goto, self.fail, self.output
+        root = goto[0]
+        state = 0
+        for i, ch in enumerate(text):
+            if state == 0:
+                state = root.get(ch, 0)
+                if state == 0:
+                    continue
+            else:
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(ch, 0)
+            for index in output[state]:
+                yield i, index
+
+
+class MentionDetector:
+    def __init__(self, names, contexts, recency, staff=None, window=CONTEXT_WINDOW):
+        """
+        names:    {이름 문자열: {person_id, ...}}
+        contexts: {문맥 토큰: {person_id, ...}}
+        recency:  {person_id: 마지막 재직 대수} (동명이인 동점 처리)
+        staff:    {보좌진 이름: {person_id, ...}} (직함이 붙은 경우 의원 언급으로 귀속)
+        """
+        patterns = []
+        self.kinds = []
+        self.targets = []
+        for kind, table in ((NAME, names), (CONTEXT, contexts), (STAFF, staff or {})):
+            for pattern, person_ids in table.items():
+                patterns.append(pattern)
+                self.kinds.append(kind)
+                self.targets.append(tuple(sorted(person_ids, key=lambda pid: (-recency.get(pid, 0), pid))))
+
+        self.target_sets = [frozenset(person_ids) for person_ids in self.targets]
+        self.automaton = AhoCorasick(patterns)
+        self.lengths = [len(pattern) for pattern in patterns]
+        self.latin = [pattern.isascii() for pattern in patterns]
+        self.window = window
+
+    @classmethod
+    def from_registry(cls, lawmakers=None, entities=None, extra_contexts=None, **kwargs):
+        """명부(person_id 포함)에서 이름/문맥/보좌진 사전 구성
+
+        과거 대수의 정당/선거구(대별 이력)와 위원회 별칭(entities)도 문맥에 포함한다.
+        extra_contexts: {person_id: [토큰, ...]} 추가 문맥
+        """
+        if lawmakers is None:
+            lawmakers = resolve_identities()
+        if entities is None:
+            entities = EntityIndex.from_registry(lawmakers)
+
+        names = {}
+        contexts = {}
+
+        def add(table, token, person_id):
+            if isinstance(token, str) and token:
+                table.setdefault(token, set()).add(person_id)
+
+        for row in lawmakers.itertuples(index=False):
+            person_id = int(row.person_id)
+            add(names, row.name, person_id)
+            add(names, row.name_hanja, person_id)
+            if isinstance(row.name_en, str):
+                add(names, " ".join(row.name_en.lower().split()), person_id)
+
+        for alias, person_ids in entities.committee_contexts().items():
+            if alias not in CONTEXT_STOPWORDS:
+                contexts.setdefault(alias, set()).update(person_ids)
+
+        for row in term_history(lawmakers).itertuples(index=False):
+            person_id = int(row.person_id)
+            if isinstance(row.party, str) and row.party not in CONTEXT_STOPWORDS:
+                add(contexts, row.party, person_id)
+            for token in district_tokens(row.district):
+                add(contexts, token, person_id)
+
+        for person_id, tokens in (extra_contexts or {}).items():
+            for token in tokens:
+                if isinstance(token, str) and len(token) >= MIN_CONTEXT_LENGTH:
+                    add(contexts, token, person_id)
+
+        # 이름 자체가 문맥 토큰/보좌진 이름인 경우는 의원 이름으로만 취급
+        staff = {name: person_ids for name, person_ids in entities.staff_patterns().items() if name not in names}
+        for name in names:
+            contexts.pop(name, None)
+        for name in staff:
+            contexts.pop(name, None)
+
+        recency = lawmakers.groupby("person_id")["term"].max().astype(int).to_dict()
+        return cls(names, contexts, recency, staff=staff, **kwargs)
+
+    def _accept(self, text, start, end, index):
+        before = text[start - 1] if start > 0 else " "
+        after = text[end + 1] if end + 1 < len(text) else " "
+        if self.latin[index]:
+            return not (before.isalpha() or after.isalpha())
+        first = text[start]
+        if _is_hangul(first):
+            if _is_hangul(before):
+                return False
+            return not _is_hangul(after) or bool(
+                NAME_TITLE_AFTER_RE.match(text, end + 1) or NAME_JOSA_RE.match(text, end + 1)
+            )
+        if _is_hanja(first):
+            return not (_is_hanja(before) or _is_hanja(after))
+        return True
+
+    def _has_evidence(self, text, start, end, index, context_starts, contexts):
+        """짧은 이름: 바로 뒤 직함이나 window 안에 해당 후보의 문맥 토큰이 있는지"""
+        if NAME_TITLE_AFTER_RE.match(text, end + 1):
+            return True
+        candidates = self.target_sets[index]
+        lo = bisect.bisect_left(context_starts, start - self.window)
+        hi = bisect.bisect_right(context_starts, start + self.window)
+        return any(candidates & self.target_sets[contexts[position]] for position in context_starts[lo:hi])
+
+    @staticmethod
+    def _has_title(text, start, end):
+        """보좌진 이름 앞뒤에 직함이 붙어 있는지"""
+        if STAFF_TITLE_AFTER_RE.match(text, end + 1):
+            return True
+        return STAFF_TITLE_BEFORE_RE.search(text, max(0, start - 8), start) is not None
+
+    def _resolve(self, candidates, attached, article_contexts):
+        """동명이인 후보 중 하나 선택 → (person_id, ambiguous)"""
+        if len(candidates) == 1:
+            return candidates[0], False
+
+        target_sets = self.target_sets
+        scores = [
+            (
+                sum(1 for index in attached if pid in target_sets[index]),
+                sum(1 for index in article_contexts if pid in target_sets[index]),
+            )
+            for pid in candidates
+        ]
+        # candidates는 최근 대수 순으로 정렬되어 있어 동점이면 앞쪽이 선택된다
+        best = max(range(len(candidates)), key=scores.__getitem__)
+        ranked = sorted(scores, reverse=True)
+        return candidates[best], ranked[0] == ranked[1]
+
+    def detect(self, text):
+        """[(person_id, offset, length, ambiguous, via), ...]"""
+        if not isinstance(text, str) or not text:
+            return []
+
+        name_hits = []
+        contexts = {}
+        kinds, targets, lengths = self.kinds, self.targets, self.lengths
+        lowered = text.lower()
+
+        for end, index in self.automaton.iter(lowered):
+            start = end - lengths[index] + 1
+            if kinds[index] == NAME:
+                if self._accept(lowered, start, end, index):
+                    name_hits.append((start, end, index))
+            elif kinds[index] == STAFF:
+                if self._accept(lowered, start, end, index) and self._has_title(lowered, start, end):
+                    name_hits.append((start, end, index))
+            elif start not in contexts or lengths[contexts[start]] < lengths[index]:
+                # 같은 위치에서 시작하는 토큰은 가장 긴 것만 ("성남" ⊂ "성남시")
+                contexts[start] = index
+
+        if not name_hits:
+            return []
+
+        # 같은 위치는 가장 긴 이름만, 더 긴 이름 언급 안에 들어간 이름은 제외 ("김현" ⊂ "김현정")
+        name_hits.sort(key=lambda hit: (hit[0], -lengths[hit[2]]))
+        kept = []
+        covered = -1
+        for start, end, index in name_hits:
+            if end <= covered:
+                continue
+            kept.append((start, end, index))
+            covered = end
+
+        # 두 글자 이하 한글 이름은 직함/문맥 근거가 있어야 인정 ("이용", "진영")
+        context_starts = sorted(contexts)
+        name_hits = [
+            (start, index)
+            for start, end, index in kept
+            if self.latin[index]
+            or kinds[index] == STAFF
+            or lengths[index] > SHORT_NAME_LENGTH
+            or not _is_hangul(lowered[start])
+            or self._has_evidence(lowered, start, end, index, context_starts, contexts)
+        ]
+        if not name_hits:
+            return []
+
+        # 문맥 토큰은 가장 가까운 이름 언급(window 이내)에 귀속 (동명이인이 있는 기사만)
+        attached = [[] for _ in name_hits]
+        if contexts and any(len(targets[index]) > 1 for _, index in name_hits):
+            starts = [start for start, _ in name_hits]
+            last = len(starts) - 1
+            for position, index in contexts.items():
+                i = bisect.bisect_left(starts, position)
+                if i > last or (i > 0 and position - starts[i - 1] <= starts[i] - position):
+                    i -= 1
+                if abs(starts[i] - position) <= self.window:
+                    attached[i].append(index)
+
+        article_contexts = list(contexts.values())
+        mentions = []
+        for (start, index), near in zip(name_hits, attached):
+            person_id, ambiguous = self._resolve(targets[index], near, article_contexts)
+            mentions.append((person_id, start, lengths[index], ambiguous, VIA[kinds[index]]))
+        return mentions
+
+    def detect_many(self, texts, start=0):
+        """[(article, person_id, offset, length, ambiguous, via), ...] (article은 start부터 매긴 순번)"""
+        rows = []
+        for article, text in enumerate(texts, start):
+            for mention in self.detect(text):
+                rows.append((article,) + mention)
+        return rows
+
+    def detect_frame(self, texts, processes=1, chunk_size=2000):
+        """언급 DataFrame (processes > 1이면 프로세스 풀, 워커마다 오토마톤을 한 번만 전달)"""
+        texts = list(texts)
+        if processes <= 1 or len(texts) <= chunk_size:
+            rows = self.detect_many(texts)
+        else:
+            chunks = [(start, texts[start : start + chunk_size]) for start in range(0, len(texts), chunk_size)]
+            with Pool(processes, initializer=_init_worker, initargs=(self,)) as pool:
+                rows = [row for part in pool.imap(_detect_chunk, chunks) for row in part]
+
+        frame = pd.DataFrame(rows, columns=["article", "person_id", "offset", "length", "ambiguous", "via"])
+        return frame.astype({"article": "int64", "person_id": "int64", "offset": "int32", "length": "int16"})
+
+
+_WORKER_DETECTOR = None
+
+
+def _init_worker(detector):
+    global _WORKER_DETECTOR
+    _WORKER_DETECTOR = detector
+
+
+def _detect_chunk(chunk):
+    start, texts = chunk
+    return _WORKER_DETECTOR.detect_many(texts, start)
+
+
+def _load_articles(pattern):
+    frames = []
+    for path in sorted(glob.glob(pattern)):
+        try:
+            frames.append(pd.read_csv(path, encoding="utf-8-sig", dtype=str))
+        except Exception as e:
+            print(f"⚠️ CSV 로드 실패 ({path}): {e}")
+    if not frames:
+        return pd.DataFrame(columns=["제목", "본문"])
+
+    # 크롤러마다 컬럼이 달라 합친 뒤에 빈 값을 채우고, 본문이 없는 행은 본문내용으로 대체
+    articles = pd.concat(frames, ignore_index=True).fillna("")
+    for column in ("제목", "본문"):
+        if column not in articles.columns:
+            articles[column] = ""
+    if "본문내용" in articles.columns:
+        articles["본문"] = articles["본문"].where(articles["본문"] != "", articles["본문내용"])
+    return articles
+
+
+def main():
+    pattern = sys.argv[1] if len(sys.argv) > 1 else os.path.join("..", "news_crawling", "rss", "results", "*.csv")
+    output_path = sys.argv[2] if len(sys.argv) > 2 else "lawmaker_mentions.csv"
+
+    lawmakers = resolve_identities()
+    start = time.perf_counter()
+    detector = MentionDetector.from_registry(lawmakers)
+    print(f"🔧 오토마톤 생성: 패턴 {len(detector.lengths)}개 ({time.perf_counter() - start:.2f}초)")
+
+    articles = _load_articles(pattern)
+    if articles.empty:
+        print(f"❌ 기사 파일이 없습니다: {pattern}")
+        return
+
+    texts = (articles["제목"] + "\n" + articles["본문"]).tolist()
+    start = time.perf_counter()
+    mentions = detector.detect_frame(texts, processes=os.cpu_count() or 1)
+    elapsed = time.perf_counter() - start
+
+    names = lawmakers.drop_duplicates("person_id").set_index("person_id")["name"]
+    mentions["name"] = mentions["person_id"].map(names)
+    mentions.to_csv(output_path, index=False, encoding="utf-8-sig")
+
+    print(
+        f"📰 기사 {len(texts)}건 → 언급 {len(mentions)}건 ({elapsed:.1f}초, 동명이인 미확정 {mentions['ambiguous'].sum()}건)"
+    )
+    print(mentions["name"].value_counts().head(20).to_string())
+    print(f"💾 저장: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+import pandas as pd
+
+from lawmaker_identity import resolve_identities, term_history
+
+
+def test_term_history_on_filtered_frame():
+    lawmakers = resolve_identities(save=False)
+    full = term_history(lawmakers)
+
+    subset = lawmakers[lawmakers["term"] == 21]
+    history = term_history(subset)
+    assert set(history["person_id"]) == set(subset["person_id"])
+
+    # 인덱스 라벨이 위치와 달라도 같은 결과
+    shuffled = lawmakers.sample(frac=1, random_state=0)
+    shuffled.index = shuffled.index + 1000
+    pd.testing.assert_frame_equal(term_history(shuffled), full)
@@ -0,0 +1,56 @@
+import pandas as pd
+
+from lawmaker_timeline import LawmakerTimeline, parse_published, week_start
+from mention_detector import MentionDetector
+
+MIXED_DATES = [
+    "Mon, 20 May 2024 23:30:00 +0900",
+    "Sun, 19 May 2024 16:00:00 GMT",
+    "2024-05-19 10:00:00",
+    "2024.05.26",
+    "",
+]
+
+
+def test_parse_published_mixed_formats():
+    parsed = parse_published(MIXED_DATES)
+    assert parsed.tolist()[:4] == [
+        pd.Timestamp("2024-05-20 23:30:00"),
+        pd.Timestamp("2024-05-20 01:00:00"),  # GMT 16:00 → KST 다음 날 01:00
+        pd.Timestamp("2024-05-19 10:00:00"),
+        pd.Timestamp("2024-05-26 00:00:00"),
+    ]
+    assert pd.isna(parsed.iloc[4])
+    assert week_start(parsed).tolist()[:3] == ["2024-05-20", "2024-05-20", "2024-05-13"]
+
+
+def test_ingest_frame_with_mixed_timezones(tmp_path):
+    detector = MentionDetector({"정성호": {1}}, {}, {1: 22})
+    timeline = LawmakerTimeline(str(tmp_path / "timeline.sqlite3"), detector=detector)
+    articles = pd.DataFrame(
+        {
+            "언론사": ["A", "B", "C", "D", "E"],
+            "제목": [f"정성호 의원 {i}" for i in range(5)],
+            "날짜": MIXED_DATES,
+            "본문": ["본문"] * 5,
+        }
+    )
+    assert timeline.ingest_frame(articles) == (5, 5)
+    assert timeline.timeline(1) == [("2024-05-13", 1, 1), ("2024-05-20", 3, 3)]
+    timeline.close()
+
+
+def test_ingest_frame_with_outlet_name_column(tmp_path):
+    detector = MentionDetector({"정성호": {1}}, {}, {1: 22})
+    timeline = LawmakerTimeline(str(tmp_path / "timeline.sqlite3"), detector=detector)
+    articles = pd.DataFrame(
+        {
+            "언론사명": ["KBS", "KBS"],
+            "제목": ["정성호 의원 발언", "정성호 의원 발언"],
+            "날짜": ["2024-05-20", "2024-05-21"],
+            "본문": ["본문", "본문"],
+        }
+    )
+    assert timeline.ingest_frame(articles) == (2, 2)
+    assert timeline.outlets(1, "2024-05-20") == [("KBS", 2, 2)]
+    timeline.close()
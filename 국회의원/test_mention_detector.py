@@ -0,0 +1,62 @@
+import pandas as pd
+import pytest
+
+from lawmaker_identity import resolve_identities
+from mention_detector import MentionDetector, _load_articles
+
+
+@pytest.fixture(scope="module")
+def registry():
+    lawmakers = resolve_identities(save=False)
+    detector = MentionDetector.from_registry(lawmakers)
+    names = lawmakers.drop_duplicates("person_id").set_index("person_id")["name"]
+    return detector, names
+
+
+def mentioned(registry, text):
+    detector, names = registry
+    return [(names[person_id], offset) for person_id, offset, *_ in detector.detect(text)]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "대중교통을 이용해 출근했다",
+        "보수 진영과 진보 진영이 맞섰다",
+        "김건희 여사는 박정희 전 대통령 생가를 찾았다",
+    ],
+)
+def test_common_words_are_not_mentions(registry, text):
+    assert mentioned(registry, text) == []
+
+
+def test_shorter_name_inside_longer_name(registry):
+    assert mentioned(registry, "김현정 의원은 이날") == [("김현정", 0)]
+
+
+def test_short_name_with_title_or_context(registry):
+    assert mentioned(registry, "이용 의원은 이날") == [("이용", 0)]
+    assert mentioned(registry, "미래한국당 이용은 이날") == [("이용", 6)]
+
+
+def test_short_name_without_evidence():
+    detector = MentionDetector({"진영": {1}, "김현": {2}, "김현정": {3}}, {"용산구": {1}}, {1: 21, 2: 21, 3: 22})
+    assert detector.detect("보수 진영이 결집했다") == []
+    assert [m[0] for m in detector.detect("용산구 진영이 결집했다")] == [1]
+    assert [m[0] for m in detector.detect("김현정·김현 의원")] == [3, 2]
+
+
+def test_load_articles_mixed_schemas(tmp_path):
+    pd.DataFrame({"언론사명": ["KBS"], "제목": ["정성호 의원"], "본문": ["본문"]}).to_csv(
+        tmp_path / "kbs.csv", index=False, encoding="utf-8-sig"
+    )
+    pd.DataFrame({"언론사": ["뉴스톱"], "제목": ["팩트체크"], "본문내용": ["정성호 의원 발언"]}).to_csv(
+        tmp_path / "factcheck.csv", index=False, encoding="utf-8-sig"
+    )
+    articles = _load_articles(str(tmp_path / "*.csv"))
+    texts = (articles["제목"] + "\n" + articles["본문"]).tolist()
+    assert texts == ["팩트체크\n정성호 의원 발언", "정성호 의원\n본문"]
+
+    detector = MentionDetector({"정성호": {1}}, {}, {1: 22})
+    assert [m[0] for m in detector.detect(texts[0])] == [1]
+    assert detector.detect(float("nan")) == []